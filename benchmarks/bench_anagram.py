@@ -0,0 +1,66 @@
+"""Time anagram and sub-anagram lookups for random 7-tile racks.
+
+Usage:
+    python benchmarks/bench_anagram.py [--words PATH] [--count N] [--racks N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import load_words  # noqa: E402
+from scrabble.anagram import AnagramIndex  # noqa: E402
+from scrabble.tile import TileBag  # noqa: E402
+
+
+def random_racks(count: int, blanks: int, seed: int):
+    """Draw 7-letter racks from the Dutch bag, with ``blanks`` blanks each."""
+    rng = random.Random(seed)
+    letters = [tile.letter for tile in TileBag("nl").tiles if not tile.is_blank]
+    return [
+        "".join(rng.sample(letters, 7 - blanks)) + "*" * blanks for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", help="plain-text word list, one word per line")
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--racks", type=int, default=200)
+    args = parser.parse_args()
+
+    words = load_words(args.words, args.count)
+    start = time.perf_counter()
+    index = AnagramIndex(words)
+    print(
+        f"{len(words)} words, {len(index.words)} keys, {index.node_count()} nodes, "
+        f"built in {time.perf_counter() - start:.2f}s"
+    )
+
+    for blanks in range(3):
+        racks = random_racks(args.racks, blanks, seed=blanks)
+        for name, query in [
+            ("anagrams", index.anagrams),
+            ("subanagrams", index.subanagrams),
+        ]:
+            times = []
+            found = 0
+            for rack in racks:
+                start = time.perf_counter()
+                found += len(query(rack))
+                times.append(time.perf_counter() - start)
+            times.sort()
+            print(
+                f"{blanks} blanks {name:>12}: "
+                f"median {times[len(times) // 2] * 1e3:6.2f} ms, "
+                f"p99 {times[int(len(times) * 0.99)] * 1e3:6.2f} ms, "
+                f"{found / len(racks):.1f} words per rack"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Measure placement validation with bitboards against the old grid scans.
+
+The legacy classes below reproduce the cell-by-cell scans ``Board`` and
+``Game`` used before the occupancy bitboards were introduced.
+
+Usage:
+    python benchmarks/bench_board.py [--turns N]
+"""
+
+import argparse
+import os
+import random
+import sys
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import best_of  # noqa: E402
+from scrabble.board import Board  # noqa: E402
+from scrabble.game import Game  # noqa: E402
+from scrabble.tile import Tile  # noqa: E402
+
+
+class LegacyBoard(Board):
+    def is_empty(self, row: int, col: int) -> bool:
+        if not self.is_valid_position(row, col):
+            return False
+        return self._tiles[row * self.size + col] is None
+
+    def is_board_empty(self) -> bool:
+        for tile in self._tiles:
+            if tile is not None:
+                return False
+        return True
+
+
+class LegacyGame(Game):
+    def _validate_placement(self, word_placement):
+        for row, col, _ in word_placement:
+            if not self.board.is_empty(row, col):
+                return False, f"Position ({row}, {col}) is not empty"
+        positions = [(row, col) for row, col, _ in word_placement]
+        rows = [r for r, c in positions]
+        cols = [c for r, c in positions]
+        if len(set(rows)) == 1:
+            row = rows[0]
+            cols_sorted = sorted(cols)
+            for i in range(cols_sorted[0], cols_sorted[-1] + 1):
+                if i not in cols and self.board.is_empty(row, i):
+                    return False, "Tiles must form a continuous word"
+        elif len(set(cols)) == 1:
+            col = cols[0]
+            rows_sorted = sorted(rows)
+            for i in range(rows_sorted[0], rows_sorted[-1] + 1):
+                if i not in rows and self.board.is_empty(i, col):
+                    return False, "Tiles must form a continuous word"
+        else:
+            return False, "Tiles must be placed in a single row or column"
+        if self.board.is_board_empty():
+            if not any(self.board.is_center(r, c) for r, c in positions):
+                return False, "First word must cover the center square"
+        elif not self._check_connected_to_board(positions):
+            return False, "Word must connect to existing tiles on board"
+        return True, ""
+
+    def _check_connected_to_board(self, positions: List[Tuple[int, int]]) -> bool:
+        for row, col in positions:
+            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                adj_row, adj_col = row + dr, col + dc
+                if self.board.is_valid_position(adj_row, adj_col):
+                    if not self.board.is_empty(adj_row, adj_col):
+                        return True
+        return False
+
+
+def mid_game(game_cls, board_cls, turns: int) -> Game:
+    """Play ``turns`` top-scoring moves from a fixed seed."""
+    game = game_cls(["Alice", "Bob"], rng=random.Random(3))
+    game.board = board_cls()
+    game.board.attach_validator(game.validator, "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    for _ in range(turns):
+        moves = game.generate_moves()
+        if moves:
+            rack = game.get_current_player().rack
+            game.place_word(moves[0].to_placement(rack))
+        else:
+            game.pass_turn()
+    return game
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=12)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = {}
+    for label, game_cls, board_cls in (
+        ("grid scans", LegacyGame, LegacyBoard),
+        ("bitboards", Game, Board),
+    ):
+        game = mid_game(game_cls, board_cls, args.turns)
+        move = game.generate_moves()[0]
+        # Swap in a Q so the formed word is rejected and place_word rolls back
+        rack = [Tile("Q", 10)] + [Tile(letter, 1) for _, _, letter, _ in move.tiles]
+        game.get_current_player().rack = rack
+        placement = [(r, c, tile) for (r, c, _, _), tile in zip(move.tiles, rack)]
+
+        def validate() -> None:
+            for _ in range(args.calls):
+                game._validate_placement(placement)
+
+        def place() -> None:
+            for _ in range(args.calls):
+                game.place_word(placement)
+
+        results[label] = (best_of(validate), best_of(place))
+        game.close()
+
+    print(f"{args.calls} calls on a board after {args.turns} moves")
+    print(f"{'':12s} {'_validate_placement':>20s} {'place_word':>12s}")
+    for label, (validate_time, place_time) in results.items():
+        print(
+            f"{label:12s} {validate_time / args.calls * 1e6:17.2f} us "
+            f"{place_time / args.calls * 1e6:9.2f} us"
+        )
+    legacy, bitboard = results["grid scans"], results["bitboards"]
+    print(
+        f"speedup      {legacy[0] / bitboard[0]:18.1f}x "
+        f"{legacy[1] / bitboard[1]:10.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
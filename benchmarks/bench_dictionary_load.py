@@ -0,0 +1,52 @@
+"""Compare game creation time with plain-text, compressed and compiled dictionaries.
+
+Usage:
+    python benchmarks/bench_dictionary_load.py [--words PATH] [--count N]
+"""
+
+import argparse
+import gzip
+import lzma
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import best_of, load_words  # noqa: E402
+from scrabble.game import Game  # noqa: E402
+from scrabble.lexicon import compile_lexicon  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", help="plain-text word list, one word per line")
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    words = load_words(args.words, args.count)
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, "words.txt")
+        compiled_path = os.path.join(tmp, "words.lex")
+        text = "\n".join(words).encode("utf-8")
+        with open(text_path, "wb") as f:
+            f.write(text)
+        with gzip.open(text_path + ".gz", "wb") as f:
+            f.write(text)
+        with lzma.open(text_path + ".xz", "wb") as f:
+            f.write(text)
+        compile_time = best_of(lambda: compile_lexicon(words, compiled_path), 1)
+
+        print(f"{len(words)} words, one-off compile step: {compile_time:.2f}s")
+        for label, path in (
+            ("text", text_path),
+            ("gzip", text_path + ".gz"),
+            ("xz", text_path + ".xz"),
+            ("compiled", compiled_path),
+        ):
+            elapsed = best_of(lambda: Game(["Alice", "Bob"], dictionary_file=path))
+            print(f"Game() with {label:8s} dictionary: {elapsed * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Time hook lookups against probing the validator once per letter.
+
+Probing is how cross-checks were built before the hook table: every letter
+of the alphabet is tried in the gap and the resulting word looked up.
+
+Usage:
+    python benchmarks/bench_hooks.py [--words PATH] [--count N] [--queries N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import best_of, load_words  # noqa: E402
+from scrabble.lexicon import compile_lexicon, load_compiled_lexicon  # noqa: E402
+from scrabble.validator import WordValidator  # noqa: E402
+
+
+def probe(validator, letters, prefix, suffix):
+    """Collect the letters that make ``prefix + letter + suffix`` a word."""
+    return {
+        letter
+        for letter in letters
+        if validator.is_valid_word(prefix + letter + suffix)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", help="plain-text word list, one word per line")
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    args = parser.parse_args()
+
+    words = load_words(args.words, args.count)
+    rng = random.Random(1)
+    queries = []
+    for word in rng.sample(words, min(args.queries, len(words))):
+        split = rng.randrange(len(word))
+        if rng.random() < 0.5:
+            queries.append((word[:split], ""))
+        else:
+            queries.append(("", word[split + 1 :]))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "words.lex")
+        start = time.perf_counter()
+        compile_lexicon(words, path)
+        compiled = time.perf_counter() - start
+        print(
+            f"{len(words)} words, compiled in {compiled:.2f}s, "
+            f"{os.path.getsize(path) / 1024:.0f} KiB"
+        )
+        lexicon = load_compiled_lexicon(path)
+        try:
+            validator = WordValidator(lexicon=lexicon)
+            hooks = validator.get_hook_table()
+            letters = sorted(hooks.codes)
+
+            def lookups():
+                return [hooks.letters(hooks.hooks(p, s)) for p, s in queries]
+
+            def probes():
+                return [probe(validator, letters, p, s) for p, s in queries]
+
+            assert lookups() == probes()
+            table = best_of(lookups)
+            probed = best_of(probes, repeat=3)
+            print(
+                f"{len(queries)} gaps: hook table {table * 1e3:7.1f} ms, "
+                f"probing {probed * 1e3:7.1f} ms ({probed / table:.0f}x)"
+            )
+        finally:
+            lexicon.close()
+
+
+if __name__ == "__main__":
+    main()
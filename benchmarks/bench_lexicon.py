@@ -0,0 +1,50 @@
+"""Compare memory and lookup latency of the lexicon backends.
+
+Usage:
+    python benchmarks/bench_lexicon.py [--words PATH] [--count N]
+"""
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import best_of, load_words  # noqa: E402
+from scrabble.lexicon import LEXICON_BACKENDS, build_lexicon  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", help="plain-text word list, one word per line")
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    words = load_words(args.words, args.count)
+    rng = random.Random(7)
+    hits = [rng.choice(words) for _ in range(args.lookups // 2)]
+    misses = [word + "Q" for word in hits]
+    queries = hits + misses
+    rng.shuffle(queries)
+    print(f"{len(words)} words, {len(queries)} lookups (50% hits)")
+    print(f"{'backend':8s} {'memory':>12s} {'build':>9s} {'lookup':>12s}")
+
+    for backend in LEXICON_BACKENDS:
+        build = best_of(lambda: build_lexicon(words, backend), repeat=1)
+        lexicon = build_lexicon(words, backend)
+
+        def lookup() -> None:
+            for word in queries:
+                word in lexicon
+
+        per_lookup = best_of(lookup) / len(queries)
+        print(
+            f"{backend:8s} {lexicon.memory_usage() / 2**20:8.1f} MiB {build:8.2f}s "
+            f"{per_lookup * 1e9:9.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
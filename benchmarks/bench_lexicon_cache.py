@@ -0,0 +1,55 @@
+"""Time dictionary loading cold and warm through the compiled lexicon cache.
+
+A cold start finds an empty cache: it hashes the word list, parses it,
+compiles it and renames the result into place before mapping it. A warm
+start hashes the word list and maps the cached file. Loading without a
+cache parses the word list every time.
+
+Usage:
+    python benchmarks/bench_lexicon_cache.py [--words PATH] [--count N]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import best_of, load_words  # noqa: E402
+from scrabble.validator import WordValidator  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", help="plain-text word list, one word per line")
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    words = load_words(args.words, args.count)
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, "words.txt")
+        cache_dir = os.path.join(tmp, "cache")
+        with open(text_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(words))
+
+        def load(**kwargs):
+            WordValidator(text_path, language="nl", **kwargs).lexicon.close()
+
+        def cold():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            load(cache_dir=cache_dir)
+
+        print(f"{len(words)} words")
+        for label, run, repeat in (
+            ("no cache (set)", lambda: load(), 3),
+            ("no cache (dawg)", lambda: load(backend="dawg"), 1),
+            ("cold cache", cold, 1),
+            ("warm cache", lambda: load(cache_dir=cache_dir), 5),
+        ):
+            print(f"{label:>16}: {best_of(run, repeat) * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Time legal move generation on a mid-game board.
+
+Usage:
+    python benchmarks/bench_movegen.py [--words PATH] [--count N] [--turns N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import best_of, load_words  # noqa: E402
+from scrabble.game import Game  # noqa: E402
+from scrabble.lexicon import compile_lexicon  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", help="plain-text word list, one word per line")
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--turns", type=int, default=10, help="moves before timing")
+    args = parser.parse_args()
+
+    words = load_words(args.words, args.count)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "words.lex")
+        compile_lexicon(words, path)
+        game = Game(["Alice", "Bob"], dictionary_file=path, rng=random.Random(11))
+
+        start = time.perf_counter()
+        game.validator.get_gaddag()
+        print(f"{len(words)} words, GADDAG built in {time.perf_counter() - start:.2f}s")
+
+        for _ in range(args.turns):
+            moves = game.generate_moves()
+            if not moves:
+                game.pass_turn()
+                continue
+            rack = game.get_current_player().rack
+            game.place_word(moves[0].to_placement(rack))
+        print(game.board)
+
+        moves = game.generate_moves()
+        elapsed = best_of(game.generate_moves)
+        print(f"{len(moves)} legal moves generated in {elapsed * 1e3:.1f} ms")
+        game.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Time wildcard pattern queries against linear scans.
+
+The scans test every word with a regular expression: once iterating
+``validator.valid_words`` (a DAWG lexicon here) and once over an in-memory
+list of strings, the fastest a scan can be.
+
+Usage:
+    python benchmarks/bench_pattern.py [--words PATH] [--count N]
+"""
+
+import argparse
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import best_of, load_words  # noqa: E402
+from scrabble.lexicon import DawgLexicon  # noqa: E402
+from scrabble.validator import WordValidator  # noqa: E402
+
+PATTERNS = ["?A?T", "B??T*", "?K???", "KA*EN", "*HEID", "*A*E*"]
+
+
+def scan(words, pattern):
+    """Match every word against the pattern as a regular expression."""
+    regex = re.compile(
+        "".join(".*" if c == "*" else "." if c == "?" else c for c in pattern)
+    )
+    return [word for word in words if regex.fullmatch(word)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", help="plain-text word list, one word per line")
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    words = load_words(args.words, args.count)
+    validator = WordValidator(lexicon=DawgLexicon.from_words(words))
+    print(f"{len(words)} words")
+    for pattern in PATTERNS:
+        found = len(list(validator.match(pattern)))
+        indexed = best_of(lambda: list(validator.match(pattern)))
+        first = best_of(lambda: list(validator.match(pattern, limit=10)))
+        lexicon = best_of(lambda: scan(validator.valid_words, pattern), repeat=1)
+        listed = best_of(lambda: scan(words, pattern), repeat=3)
+        print(
+            f"{pattern:>8}: {found:6d} words, index {indexed * 1e3:6.1f} ms "
+            f"(first 10: {first * 1e3:4.1f} ms), scan lexicon "
+            f"{lexicon * 1e3:6.1f} ms, scan list {listed * 1e3:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Measure the table-driven scorer against the old per-tile premium lookups.
+
+``legacy_score`` below reproduces ``Game._calculate_score`` from before
+scoring moved to ``Board.score_placement``: it is given the formed words and
+looks up each new tile's premium square in a dict, then compares its type
+against every premium kind. The table-driven scorer reads the board's point
+and multiplier arrays directly and finds the words itself.
+
+Usage:
+    python benchmarks/bench_scoring.py [--turns N]
+"""
+
+import argparse
+import os
+import random
+import sys
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import best_of  # noqa: E402
+from scrabble.board import Board, BoardOverlay  # noqa: E402
+from scrabble.game import Game  # noqa: E402
+from scrabble.tile import Tile  # noqa: E402
+
+
+def legacy_score(
+    board: BoardOverlay,
+    word_placement: List[Tuple[int, int, Tile]],
+    words: List[Tuple[str, List[Tuple[int, int]]]],
+) -> int:
+    total_score = 0
+    new_positions = {(row, col) for row, col, _ in word_placement}
+    for word, positions in words:
+        word_score = 0
+        word_multiplier = 1
+        for row, col in positions:
+            tile = board.get_tile(row, col)
+            if tile is None:
+                continue
+            tile_score = tile.points
+            if (row, col) in new_positions:
+                premium = board.get_premium_square(row, col)
+                if premium == Board.DOUBLE_LETTER:
+                    tile_score *= 2
+                elif premium == Board.TRIPLE_LETTER:
+                    tile_score *= 3
+                elif premium in [Board.DOUBLE_WORD, Board.CENTER]:
+                    word_multiplier *= 2
+                elif premium == Board.TRIPLE_WORD:
+                    word_multiplier *= 3
+            word_score += tile_score
+        total_score += word_score * word_multiplier
+    return total_score
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=12)
+    args = parser.parse_args()
+
+    game = Game(["Alice", "Bob"], rng=random.Random(3))
+    for _ in range(args.turns):
+        moves = game.generate_moves()
+        if moves:
+            game.place_word(moves[0].to_placement(game.get_current_player().rack))
+        else:
+            game.pass_turn()
+    # Two blanks give a realistic number of candidates from the small word list
+    player = game.get_current_player()
+    player.rack = [Tile("*", 0), Tile("*", 0)] + player.rack[:5]
+    rack = player.rack
+    placements = [move.to_placement(rack) for move in game.generate_moves()]
+    overlay = BoardOverlay(game.board)
+    words = []
+    for placement in placements:
+        overlay.set_placement(placement)
+        words.append(game._get_all_formed_words(placement, overlay))
+    new_tiles = [
+        [(row, col, tile.points) for row, col, tile in placement]
+        for placement in placements
+    ]
+
+    def legacy() -> None:
+        for placement, formed in zip(placements, words):
+            overlay.set_placement(placement)
+            legacy_score(overlay, placement, formed)
+
+    def table() -> None:
+        for tiles in new_tiles:
+            game.board.score_placement(tiles)
+
+    def legacy_with_words() -> None:
+        for placement in placements:
+            overlay.set_placement(placement)
+            legacy_score(
+                overlay, placement, game._get_all_formed_words(placement, overlay)
+            )
+
+    for placement, formed, tiles in zip(placements, words, new_tiles):
+        overlay.set_placement(placement)
+        assert legacy_score(overlay, placement, formed) == (
+            game.board.score_placement(tiles)
+        )
+
+    count = len(placements)
+    results = {
+        "legacy, words given": best_of(legacy),
+        "legacy, finding words": best_of(legacy_with_words),
+        "score_placement": best_of(table),
+    }
+    print(f"{count} candidate moves after {args.turns} turns")
+    for label, seconds in results.items():
+        print(f"{label:22s} {seconds / count * 1e6:8.2f} us/move")
+    speedup = results["legacy, finding words"] / results["score_placement"]
+    print(f"speedup {speedup:.1f}x")
+    game.close()
+
+
+if __name__ == "__main__":
+    main()
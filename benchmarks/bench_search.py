@@ -0,0 +1,80 @@
+"""Compare deepcopy with Game.clone and push_move/pop_move for search.
+
+Usage:
+    python benchmarks/bench_search.py [--words PATH] [--count N] [--turns N]
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import best_of, load_words  # noqa: E402
+from scrabble.game import Game  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", help="plain-text word list, one word per line")
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Plain text: deepcopy cannot copy a memory-mapped lexicon at all
+        path = os.path.join(tmp, "words.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(load_words(args.words, args.count)))
+        run(Game(["Alice", "Bob"], dictionary_file=path, rng=random.Random(5)), args)
+
+
+def run(game: Game, args: argparse.Namespace) -> None:
+    for _ in range(args.turns):
+        moves = game.generate_moves()
+        if moves:
+            game.place_word(moves[0].to_placement(game.get_current_player().rack))
+        else:
+            game.pass_turn()
+    moves = game.generate_moves()
+    placement = moves[0].to_placement(game.get_current_player().rack)
+
+    def deepcopy_and_play() -> None:
+        for _ in range(args.calls):
+            copy.deepcopy(game).place_word(placement)
+
+    def clone_and_play() -> None:
+        for _ in range(args.calls):
+            clone = game.clone()
+            clone.place_word(placement)
+            clone.close()
+
+    def push_and_pop() -> None:
+        for _ in range(args.calls):
+            game.push_move(placement)
+            game.pop_move()
+
+    print(
+        f"{args.calls} tries of a {len(placement)}-tile move after {args.turns} turns"
+    )
+    baseline = None
+    for label, func in (
+        ("deepcopy", deepcopy_and_play),
+        ("clone", clone_and_play),
+        ("push/pop", push_and_pop),
+    ):
+        elapsed = best_of(func)
+        baseline = baseline or elapsed
+        print(
+            f"{label:10s} {elapsed / args.calls * 1e6:9.1f} us/try "
+            f"{baseline / elapsed:6.1f}x"
+        )
+    game.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Measure per-game tile memory with interned slotted tiles.
+
+The legacy classes below reproduce the tiles ``TileBag`` created before
+tiles were interned: one ``__dict__``-backed object per tile per game.
+
+Usage:
+    python benchmarks/bench_tiles.py [--games N] [--language CODE]
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrabble.tile import TileBag  # noqa: E402
+
+
+class LegacyTile:
+    def __init__(self, letter: str, points: int):
+        self.letter = letter.upper()
+        self.points = points
+        self.is_blank = letter == "*"
+        self.blank_letter = None
+
+
+class LegacyTileBag(TileBag):
+    def _initialize_tiles(self) -> None:
+        for letter, (count, points) in self.letter_distribution.items():
+            for _ in range(count):
+                self.tiles.append(LegacyTile(letter, points))
+
+
+def measure(make_bag: Callable[[], TileBag], games: int) -> int:
+    """Return the bytes allocated to keep ``games`` bags alive."""
+    make_bag()  # Warm up interning and caches
+    tracemalloc.start()
+    bags: List[TileBag] = [make_bag() for _ in range(games)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del bags
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--language", default="nl")
+    args = parser.parse_args()
+
+    legacy = measure(lambda: LegacyTileBag(args.language), args.games)
+    interned = measure(lambda: TileBag(args.language), args.games)
+    print(f"tile memory per game ({args.language}, {args.games} games)")
+    print(f"legacy tiles    {legacy / args.games:9.0f} bytes")
+    print(f"interned tiles  {interned / args.games:9.0f} bytes")
+    print(f"reduction       {1 - interned / legacy:9.1%}")
+
+
+if __name__ == "__main__":
+    main()
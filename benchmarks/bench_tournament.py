@@ -0,0 +1,42 @@
+"""Measure how tournament throughput scales with worker processes.
+
+Usage:
+    python benchmarks/bench_tournament.py [--games N] [--max-workers N]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrabble.tournament import Tournament  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--dictionary", help="dictionary file to play with")
+    args = parser.parse_args()
+
+    workers = 1
+    baseline = None
+    print(f"{'workers':>8s} {'games/s':>10s} {'speedup':>8s}")
+    while workers <= args.max_workers:
+        tournament = Tournament(
+            ["greedy", "random"],
+            args.games,
+            workers=workers,
+            dictionary_file=args.dictionary,
+        )
+        for _ in tournament.run():
+            pass
+        rate = tournament.games_per_second
+        baseline = baseline or rate
+        print(f"{workers:8d} {rate:10.1f} {rate / baseline:7.1f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
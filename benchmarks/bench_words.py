@@ -0,0 +1,264 @@
+"""Measure word reading with the run index against scans of the board.
+
+``GridBoard`` below keeps the list-of-lists grid ``Board`` used before its
+contents moved into flat arrays, and reads words by walking the tiles and
+calling ``get_display_letter()`` on each one. ``ScanBoard`` scans the flat
+letter-code arrays instead. Cross-checks of every line are recomputed the
+same ways. ``Board`` itself looks words up in its per-line index of tile
+runs. ``WalkOverlay`` reads the words of a candidate placement square by
+square, the way ``BoardOverlay`` did before it used the run index.
+
+Usage:
+    python benchmarks/bench_words.py [--turns N] [--calls N]
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_board import mid_game  # noqa: E402
+from benchmarks.common import best_of  # noqa: E402
+from scrabble.board import EMPTY, Board, BoardOverlay  # noqa: E402
+from scrabble.game import Game  # noqa: E402
+from scrabble.tile import Tile  # noqa: E402
+
+
+class GridBoard(Board):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tile_grid: List[List[Optional[Tile]]] = [
+            [None] * self.size for _ in range(self.size)
+        ]
+
+    def place_tile(self, row: int, col: int, tile: Tile) -> bool:
+        if not super().place_tile(row, col, tile):
+            return False
+        self.tile_grid[row][col] = tile
+        return True
+
+    def remove_tile(self, row: int, col: int) -> Optional[Tile]:
+        tile = super().remove_tile(row, col)
+        if tile is not None:
+            self.tile_grid[row][col] = None
+        return tile
+
+    def get_word_at(
+        self, row: int, col: int, direction: str
+    ) -> Tuple[str, List[Tuple[int, int]]]:
+        grid = self.tile_grid
+        word = []
+        positions = []
+        if direction == "H":
+            start_col = col
+            while start_col > 0 and grid[row][start_col - 1] is not None:
+                start_col -= 1
+            c = start_col
+            while c < self.size and grid[row][c] is not None:
+                word.append(grid[row][c].get_display_letter())
+                positions.append((row, c))
+                c += 1
+        else:
+            start_row = row
+            while start_row > 0 and grid[start_row - 1][col] is not None:
+                start_row -= 1
+            r = start_row
+            while r < self.size and grid[r][col] is not None:
+                word.append(grid[r][col].get_display_letter())
+                positions.append((r, col))
+                r += 1
+        return ("".join(word), positions)
+
+    def _compute_cross_checks(self, direction: str, line: int) -> None:
+        if direction == "H":
+            squares = [(i, line) for i in range(self.size)]
+        else:
+            squares = [(line, i) for i in range(self.size)]
+        tiles = [self.tile_grid[r][c] for r, c in squares]
+        checks = self._cross_checks[direction]
+        scores = self._cross_scores[direction]
+        is_valid = self._validator.is_valid_word
+        for i, (r, c) in enumerate(squares):
+            checks[r][c] = None
+            scores[r][c] = -1
+            if tiles[i] is not None:
+                continue
+            start = i
+            while start > 0 and tiles[start - 1] is not None:
+                start -= 1
+            end = i
+            while end < self.size - 1 and tiles[end + 1] is not None:
+                end += 1
+            if start == end:
+                continue
+            before = tiles[start:i]
+            after = tiles[i + 1 : end + 1]
+            prefix = "".join(tile.get_display_letter() for tile in before)
+            suffix = "".join(tile.get_display_letter() for tile in after)
+            checks[r][c] = frozenset(
+                letter
+                for letter in self._cross_letters
+                if is_valid(prefix + letter + suffix)
+            )
+            scores[r][c] = sum(tile.points for tile in before + after)
+
+
+class ScanBoard(Board):
+    def get_word_at(
+        self, row: int, col: int, direction: str
+    ) -> Tuple[str, List[Tuple[int, int]]]:
+        size = self.size
+        if direction == "H":
+            codes, line, i = self.letter_codes, row, col
+        else:
+            codes, line, i = self.transposed_codes, col, row
+        if not (0 <= line < size and 0 <= i < size):
+            return ("", [])
+        base = line * size
+        while i > 0 and codes[base + i - 1]:
+            i -= 1
+        start = i
+        decode = self._code_letters
+        word = []
+        while i < size:
+            code = codes[base + i]
+            if not code:
+                break
+            word.append(decode[code])
+            i += 1
+        return ("".join(word), self._line_squares[direction][line][start:i])
+
+    def _compute_cross_checks(self, direction: str, line: int) -> None:
+        size = self.size
+        codes, points, base = self.line_arrays("V" if direction == "H" else "H", line)
+        decode = self._code_letters
+        checks = self._cross_checks[direction]
+        scores = self._cross_scores[direction]
+        is_valid = self._validator.is_valid_word
+        for i in range(size):
+            r, c = (i, line) if direction == "H" else (line, i)
+            checks[r][c] = None
+            scores[r][c] = -1
+            if codes[base + i] != EMPTY:
+                continue
+            start = codes.rfind(EMPTY, base, base + i) + 1 or base
+            end = codes.find(EMPTY, base + i + 1, base + size)
+            if end < 0:
+                end = base + size
+            if start == base + i and end == base + i + 1:
+                continue
+            prefix = "".join([decode[code] for code in codes[start : base + i]])
+            suffix = "".join([decode[code] for code in codes[base + i + 1 : end]])
+            checks[r][c] = frozenset(
+                letter
+                for letter in self._cross_letters
+                if is_valid(prefix + letter + suffix)
+            )
+            scores[r][c] = sum(points[start:end])
+
+
+class WalkOverlay(BoardOverlay):
+    def get_word_at(
+        self, row: int, col: int, direction: str
+    ) -> Tuple[str, List[Tuple[int, int]]]:
+        pending = self.pending
+        get_letter = self.board.get_letter
+
+        def letter_at(row: int, col: int) -> Optional[str]:
+            tile = pending.get((row, col))
+            if tile is None:
+                return get_letter(row, col)
+            return tile.get_display_letter()
+
+        dr, dc = (0, 1) if direction == "H" else (1, 0)
+        while letter_at(row - dr, col - dc) is not None:
+            row, col = row - dr, col - dc
+        word = []
+        positions = []
+        letter = letter_at(row, col)
+        while letter is not None:
+            word.append(letter)
+            positions.append((row, col))
+            row, col = row + dr, col + dc
+            letter = letter_at(row, col)
+        return ("".join(word), positions)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=12)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = {}
+    boards = (("tile grid", GridBoard), ("array scan", ScanBoard), ("run index", Board))
+    for label, board_cls in boards:
+        game = mid_game(Game, board_cls, args.turns)
+        board = game.board
+        move = game.generate_moves()[0]
+        rack = game.get_current_player().rack
+        placement = move.to_placement(rack)
+        for row, col, tile in placement:
+            board.place_tile(row, col, tile)
+        row, col = placement[0][:2]
+
+        def read_words() -> None:
+            for _ in range(args.calls):
+                board.get_word_at(row, col, "H")
+                board.get_word_at(row, col, "V")
+
+        def formed_words() -> None:
+            for _ in range(args.calls):
+                game._get_all_formed_words(placement)
+
+        def cross_checks() -> None:
+            for direction in ("H", "V"):
+                for line in range(board.size):
+                    board._compute_cross_checks(direction, line)
+
+        results[label] = (
+            best_of(read_words),
+            best_of(formed_words),
+            best_of(cross_checks),
+        )
+        words = [word for word, _ in game._get_all_formed_words(placement)]
+        game._rollback_placement(placement)
+
+        if board_cls is Board:
+            # Words of the candidate laid over the board, before placing it
+            overlays = {}
+            for name, overlay_cls in (("walk", WalkOverlay), ("runs", BoardOverlay)):
+                overlay = overlay_cls(board, placement)
+
+                def overlay_words() -> None:
+                    for _ in range(args.calls):
+                        game._get_all_formed_words(placement, overlay)
+
+                overlays[name] = best_of(overlay_words)
+        game.close()
+
+    print(f"{args.calls} calls on a board after {args.turns} moves, words {words}")
+    columns = ("get_word_at x2", "_get_all_formed_words", "cross-checks")
+    print(f"{'':12s} {columns[0]:>15s} {columns[1]:>22s} {columns[2]:>13s}")
+    for label, (read_time, formed_time, cross_time) in results.items():
+        print(
+            f"{label:12s} {read_time / args.calls * 1e6:12.2f} us "
+            f"{formed_time / args.calls * 1e6:19.2f} us "
+            f"{cross_time * 1e3:10.2f} ms"
+        )
+    grid, runs = results["tile grid"], results["run index"]
+    print(
+        f"speedup      {grid[0] / runs[0]:13.1f}x {grid[1] / runs[1]:20.1f}x "
+        f"{grid[2] / runs[2]:11.1f}x"
+    )
+    print(
+        f"overlay words: walking {overlays['walk'] / args.calls * 1e6:.2f} us, "
+        f"run index {overlays['runs'] / args.calls * 1e6:.2f} us "
+        f"({overlays['walk'] / overlays['runs']:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
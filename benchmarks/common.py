@@ -0,0 +1,61 @@
+"""Shared helpers for the benchmark scripts."""
+
+import random
+import time
+from typing import Callable, List, Optional
+
+STEMS_SYLLABLES = [
+    "BA", "BE", "BO", "DA", "DE", "DI", "GA", "GE", "HA", "HO", "KA", "KE",
+    "KO", "LA", "LE", "LI", "MA", "ME", "MO", "NA", "NE", "PA", "PE", "RA",
+    "RE", "RO", "SA", "SE", "SO", "TA", "TE", "TO", "VA", "VE", "WA", "ZE",
+]  # fmt: skip
+SUFFIXES = ["", "EN", "ER", "S", "JE", "JES", "TJE", "HEID", "ING", "DE", "TE"]
+
+
+def synthetic_words(count: int, seed: int = 1) -> List[str]:
+    """Generate a word list with a natural-language-like suffix structure.
+
+    Real word lists share long suffixes (inflections, diminutives), which is
+    what a DAWG exploits. Random strings would not be representative.
+
+    Args:
+        count: Number of distinct words to generate
+        seed: Random seed
+
+    Returns:
+        List of uppercase words
+    """
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        stem = "".join(rng.choice(STEMS_SYLLABLES) for _ in range(rng.randint(1, 4)))
+        for suffix in SUFFIXES:
+            if rng.random() < 0.6:
+                words.add(stem + suffix)
+    return sorted(words)[:count]
+
+
+def load_words(path: Optional[str], count: int) -> List[str]:
+    """Load a word list from ``path`` or generate a synthetic one.
+
+    Args:
+        path: Optional path to a plain-text word list
+        count: Number of synthetic words to generate when no path is given
+
+    Returns:
+        List of uppercase words
+    """
+    if path is None:
+        return synthetic_words(count)
+    with open(path, "r", encoding="utf-8") as f:
+        return sorted({w for w in (line.strip().upper() for line in f) if len(w) >= 2})
+
+
+def best_of(func: Callable[[], object], repeat: int = 5) -> float:
+    """Time ``func`` several times and return the fastest run in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
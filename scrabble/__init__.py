@@ -5,15 +5,17 @@ __version__ = "0.1.0"
 from scrabble.board import Board
 from scrabble.game import Game
 from scrabble.player import Player
+from scrabble.rack import Rack
 from scrabble.tile import Tile, TileBag
 
-__all__ = ["Board", "Game", "Player", "Tile", "TileBag"]
+__all__ = ["Board", "Game", "Player", "Rack", "Tile", "TileBag"]
 from scrabble.language import SUPPORTED_LANGUAGES, get_language_name, load_translations
 
 __all__ = [
     "Board",
     "Game",
     "Player",
+    "Rack",
     "Tile",
     "TileBag",
     "SUPPORTED_LANGUAGES",
@@ -0,0 +1,135 @@
+"""Integer letter codes shared by the board, racks and lexicon indexes.
+
+Hot loops compare small integers instead of strings. Code 0 means "no
+letter" (an empty square, or the GADDAG separator). The letters of a
+language's tile set come next, in the order of its letter distribution,
+followed by any extra letters a word list needs. The blank tile gets the
+code after the last letter, and 255 stands for a letter the alphabet does
+not know.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, Tuple
+
+from scrabble.language import get_letter_distribution
+
+EMPTY = 0
+UNKNOWN = 255
+
+
+class Alphabet:
+    """Maps the letters of a language to codes 1..n and back."""
+
+    def __init__(self, language: str, letters: Iterable[str]):
+        """Initialize the alphabet.
+
+        Args:
+            language: Language code the alphabet belongs to
+            letters: Distinct letters, in code order
+        """
+        self.language = language
+        self.letters: Tuple[str, ...] = tuple(letters)
+        if len(set(self.letters)) != len(self.letters):
+            raise ValueError("Alphabet letters must be distinct")
+        if len(self.letters) > 253:
+            raise ValueError("An alphabet is limited to 253 letters")
+        self.codes: Dict[str, int] = {
+            letter: code for code, letter in enumerate(self.letters, 1)
+        }
+        self.blank_code = len(self.letters) + 1
+
+    @property
+    def size(self) -> int:
+        """Number of codes, including ``EMPTY`` and the blank."""
+        return len(self.letters) + 2
+
+    def code(self, letter: str) -> int:
+        """Get the code of a letter.
+
+        Args:
+            letter: Letter to encode
+
+        Returns:
+            Code in the range 1..n
+
+        Raises:
+            ValueError: If the letter is not in the alphabet
+        """
+        code = self.codes.get(letter)
+        if code is None:
+            raise ValueError(
+                f"Letter {letter!r} is not in the {self.language} alphabet"
+            )
+        return code
+
+    def encode(self, word: str) -> bytes:
+        """Encode a word as letter codes.
+
+        Args:
+            word: Uppercase word
+
+        Returns:
+            One code per letter
+
+        Raises:
+            ValueError: If the word has a letter outside the alphabet
+        """
+        codes = self.codes
+        try:
+            return bytes(codes[letter] for letter in word)
+        except KeyError as e:
+            raise ValueError(
+                f"Letter {e.args[0]!r} is not in the {self.language} alphabet"
+            ) from None
+
+    def decode(self, codes: Iterable[int]) -> str:
+        """Decode letter codes back into a word.
+
+        Args:
+            codes: Codes in the range 1..n
+
+        Returns:
+            The word
+        """
+        letters = self.letters
+        return "".join(letters[code - 1] for code in codes)
+
+    def extended(self, letters: Iterable[str]) -> "Alphabet":
+        """Get an alphabet with extra letters appended after these ones.
+
+        Codes of existing letters are unchanged, so data encoded with this
+        alphabet stays valid.
+
+        Args:
+            letters: Letters to add; ones already present are ignored
+
+        Returns:
+            This alphabet if nothing was added, otherwise a new one
+        """
+        extra = sorted(set(letters) - set(self.letters))
+        if not extra:
+            return self
+        return Alphabet(self.language, self.letters + tuple(extra))
+
+    def __len__(self) -> int:
+        return len(self.letters)
+
+    def __repr__(self) -> str:
+        return f"Alphabet({self.language}, {''.join(self.letters)})"
+
+
+@lru_cache(maxsize=None)
+def get_alphabet(language: str = "nl") -> Alphabet:
+    """Get the shared alphabet of a language's tile set.
+
+    Args:
+        language: Language code ('en', 'nl', or 'fi')
+
+    Returns:
+        Alphabet of the language's letters, blank excluded
+
+    Raises:
+        ValueError: If language is not supported
+    """
+    distribution = get_letter_distribution(language)
+    return Alphabet(language, [letter for letter in distribution if letter != "*"])
@@ -0,0 +1,163 @@
+"""Anagram index answering "which words can these letters make".
+
+Every word is keyed by its letters in alphabet order, so all anagrams of a
+word share one key. The keys are stored in a minimized graph built like the
+DAWG lexicon. A query walks that graph, spending one rack letter per edge,
+or a blank when the rack has none of that letter. Since keys are sorted,
+the walk never visits the same multiset twice and gives up as soon as the
+rack cannot supply a prefix of any key, rather than trying every letter
+combination the blanks could stand for.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from scrabble.alphabet import Alphabet
+from scrabble.lexicon import build_graph
+
+BLANK = "*"
+
+
+class AnagramIndex:
+    """Words grouped by their sorted letters, searchable by rack."""
+
+    def __init__(self, words: Iterable[str], alphabet: Optional[Alphabet] = None):
+        """Build the index.
+
+        Args:
+            words: Uppercase words to include
+            alphabet: Letter codes to sort letters by. Letters of the words
+                that it lacks are appended; by default the words' letters are
+                coded in sorted order.
+        """
+        unique: Set[str] = set(words)
+        letters = {letter for word in unique for letter in word}
+        if alphabet is None:
+            alphabet = Alphabet("", sorted(letters))
+        else:
+            alphabet = alphabet.extended(letters)
+        self.alphabet = alphabet
+        grouped: Dict[bytes, List[str]] = {}
+        for word in unique:
+            grouped.setdefault(bytes(sorted(alphabet.encode(word))), []).append(word)
+        # Words of each key, in alphabetical order
+        self.words: Dict[bytes, Tuple[str, ...]] = {
+            key: tuple(sorted(group)) for key, group in grouped.items()
+        }
+        self.max_length = max((len(key) for key in self.words), default=0)
+        (
+            self.first_edge,
+            self.labels,
+            self.targets,
+            self.finals,
+            self.root,
+        ) = build_graph(sorted(self.words))
+        self.word_count = len(unique)
+
+    def _rack_counts(self, letters: str) -> Tuple[bytearray, int, int]:
+        """Count a rack's letters by code.
+
+        Args:
+            letters: Rack letters, blanks as '*'
+
+        Returns:
+            Tuple of (counts by code, number of blanks, number of letters the
+            alphabet does not know)
+        """
+        codes = self.alphabet.codes
+        counts = bytearray(self.alphabet.size)
+        blanks = unknown = 0
+        for letter in letters.upper():
+            if letter == BLANK:
+                blanks += 1
+            elif letter in codes:
+                counts[codes[letter]] += 1
+            else:
+                unknown += 1
+        return counts, blanks, unknown
+
+    def _search(
+        self, counts: bytearray, blanks: int, min_length: int, max_length: int
+    ) -> List[str]:
+        """Collect the words a rack can spell.
+
+        Args:
+            counts: Rack letters by code; restored before returning
+            blanks: Number of blanks on the rack
+            min_length: Shortest word to report
+            max_length: Longest word to report
+
+        Returns:
+            Words found, longest first, then alphabetically
+        """
+        first_edge, labels, targets, finals = (
+            self.first_edge,
+            self.labels,
+            self.targets,
+            self.finals,
+        )
+        words = self.words
+        path = bytearray(max_length)
+        found: List[str] = []
+
+        def walk(node: int, depth: int, blanks: int) -> None:
+            if finals[node] and depth >= min_length:
+                found.extend(words[bytes(path[:depth])])
+            if depth == max_length:
+                return
+            for edge in range(first_edge[node], first_edge[node + 1]):
+                code = labels[edge]
+                path[depth] = code
+                if counts[code]:
+                    # A rack tile is never worse than a blank for the same letter
+                    counts[code] -= 1
+                    walk(targets[edge], depth + 1, blanks)
+                    counts[code] += 1
+                elif blanks:
+                    walk(targets[edge], depth + 1, blanks - 1)
+
+        walk(self.root, 0, blanks)
+        found.sort(key=lambda word: (-len(word), word))
+        return found
+
+    def anagrams(self, letters: str) -> List[str]:
+        """Find the words that use every letter, such as bingos for a full rack.
+
+        Args:
+            letters: Rack letters, blanks as '*'
+
+        Returns:
+            Words spelled with all of the letters, alphabetically
+        """
+        counts, blanks, unknown = self._rack_counts(letters)
+        length = len(letters)
+        if unknown or length > self.max_length:
+            return []
+        return self._search(counts, blanks, length, length)
+
+    def subanagrams(self, letters: str, min_length: int = 2) -> List[str]:
+        """Find the words that use some or all of the letters.
+
+        Args:
+            letters: Rack letters, blanks as '*'
+            min_length: Shortest word to report
+
+        Returns:
+            Words spelled with a sub-multiset of the letters, longest first,
+            then alphabetically
+        """
+        counts, blanks, unknown = self._rack_counts(letters)
+        max_length = min(len(letters) - unknown, self.max_length)
+        if max_length < min_length:
+            return []
+        return self._search(counts, blanks, min_length, max_length)
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def node_count(self) -> int:
+        """Get the number of nodes in the graph.
+
+        Returns:
+            Number of nodes
+        """
+        return len(self.finals)
@@ -1,146 +1,233 @@
 """Board class for Scrabble game."""
 
-from typing import Dict, List, Optional, Tuple
-
+import copy
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from scrabble.alphabet import EMPTY, Alphabet, get_alphabet
+from scrabble.layout import (
+    CENTER,
+    DOUBLE_LETTER,
+    DOUBLE_WORD,
+    PREMIUM_MULTIPLIERS,
+    QUADRUPLE_LETTER,
+    QUADRUPLE_WORD,
+    TRIPLE_LETTER,
+    TRIPLE_WORD,
+    Layout,
+    get_layout,
+)
 from scrabble.tile import Tile
+from scrabble.zobrist import square_key
+
+if TYPE_CHECKING:
+    from scrabble.validator import WordValidator
+
+# A cross-check is None when the square has no perpendicular neighbours
+CrossCheck = Optional[FrozenSet[str]]
+
+
+# (row, col, points) of a tile about to be placed
+NewTile = Tuple[int, int, int]
+
+# A run of adjacent tiles on a row or column: (start, end, word, points), with
+# ``end`` exclusive and ``points`` the face value of its tiles
+Run = Tuple[int, int, str, int]
 
 
 class Board:
-    """Represents a 15x15 Scrabble board with premium squares."""
+    """Represents a Scrabble board with premium squares.
+
+    The geometry (size, center and premium squares) comes from a shared,
+    read-only ``Layout``; the standard 15x15 layout is used by default.
+    """
 
     # Premium square types
-    TRIPLE_WORD = "TW"
-    DOUBLE_WORD = "DW"
-    TRIPLE_LETTER = "TL"
-    DOUBLE_LETTER = "DL"
-    CENTER = "CENTER"
-
-    def __init__(self):
-        """Initialize an empty 15x15 Scrabble board."""
-        self.size = 15
-        self.grid: List[List[Optional[Tile]]] = [
-            [None for _ in range(self.size)] for _ in range(self.size)
-        ]
-        self.premium_squares = self._initialize_premium_squares()
-
-    def _initialize_premium_squares(self) -> Dict[Tuple[int, int], str]:
-        """Initialize premium square positions according to standard Scrabble layout.
+    TRIPLE_WORD = TRIPLE_WORD
+    DOUBLE_WORD = DOUBLE_WORD
+    TRIPLE_LETTER = TRIPLE_LETTER
+    DOUBLE_LETTER = DOUBLE_LETTER
+    QUADRUPLE_WORD = QUADRUPLE_WORD
+    QUADRUPLE_LETTER = QUADRUPLE_LETTER
+    CENTER = CENTER
+
+    # (letter multiplier, word multiplier) of each premium square type
+    PREMIUM_MULTIPLIERS = PREMIUM_MULTIPLIERS
+
+    def __init__(
+        self,
+        alphabet: Optional[Alphabet] = None,
+        layout: Union[Layout, str, None] = None,
+    ):
+        """Initialize an empty Scrabble board.
+
+        Args:
+            alphabet: Letter codes for ``letter_codes``. Defaults to the Dutch
+                alphabet.
+            layout: Board geometry, or the name of a registered one (see
+                ``scrabble.layout``). Defaults to the standard 15x15 board.
+
+        Raises:
+            ValueError: If no layout has the given name
+        """
+        if layout is None or isinstance(layout, str):
+            layout = get_layout(layout or "standard")
+        self.layout = layout
+        self.size = layout.size
+        self.alphabet = alphabet if alphabet is not None else get_alphabet("nl")
+        # Letter of each code, '' for EMPTY
+        self._code_letters: Tuple[str, ...] = ("",) + self.alphabet.letters
+        squares = self.size * self.size
+        # Board contents as flat arrays indexed by row * size + col: the code
+        # of the letter shown (EMPTY for empty squares), the tile's points and
+        # whether it is a blank. The transposed arrays are indexed by
+        # col * size + row, so a column is as contiguous as a row.
+        self.letter_codes = bytearray(squares)
+        self.tile_points = bytearray(squares)
+        self.blank_flags = bytearray(squares)
+        self.transposed_codes = bytearray(squares)
+        self.transposed_points = bytearray(squares)
+        # Tile objects, only handed out by get_tile and remove_tile
+        self._tiles: List[Optional[Tile]] = [None] * squares
+        # (row, col) of each square of each row ('H') and column ('V')
+        self._line_squares = layout.line_squares
+        self.premium_squares = layout.premium_squares
+        # Letter and word multiplier of every square, row-major and transposed
+        # like the square arrays, shared with the layout. A premium only
+        # counts for the tile placed on it; ``used_premiums`` has the bits of
+        # premium squares covered.
+        self.letter_multipliers = layout.letter_multipliers
+        self.word_multipliers = layout.word_multipliers
+        self.transposed_letter_multipliers = layout.transposed_letter_multipliers
+        self.transposed_word_multipliers = layout.transposed_word_multipliers
+        self.premium_mask = layout.premium_mask
+        self.used_premiums = 0
+        # Occupancy bitboards kept in sync with the grid. Bit row * size + col
+        # of ``occupied`` is set for every tile, bit col of ``row_masks[row]``
+        # and bit row of ``col_masks[col]`` likewise.
+        self.occupied = 0
+        self.row_masks = [0] * self.size
+        self.col_masks = [0] * self.size
+        self._full_mask = layout.full_mask
+        self._not_first_col = layout.not_first_col
+        self._not_last_col = layout.not_last_col
+        # Zobrist hash of the tiles on the board, see ``scrabble.zobrist``
+        self.zobrist = 0
+        self._validator: Optional["WordValidator"] = None
+        self._cross_letters: Tuple[str, ...] = ()
+        self._cross_version = -1
+        self._cross_checks: Dict[str, List[List[CrossCheck]]] = {}
+        self._cross_scores: Dict[str, List[List[int]]] = {}
+        # Lines whose cross-checks are stale: columns for 'H', rows for 'V'
+        self._dirty_lines: Dict[str, Set[int]] = {"H": set(), "V": set()}
+        # Runs of tiles on each row ('H') and column ('V'), listed per square:
+        # the run covering it, or None if it is empty. A line's list is built
+        # when first needed and dropped when a tile on the line changes.
+        self._runs: Dict[str, List[Optional[List[Optional[Run]]]]] = {
+            "H": [None] * self.size,
+            "V": [None] * self.size,
+        }
+
+    def copy(self) -> "Board":
+        """Copy the board for search.
+
+        The layout, the validator and the placed tiles themselves are
+        shared with the copy; the square arrays, bitboards and cross-check
+        caches are copied so either board can change independently.
 
         Returns:
-            Dictionary mapping (row, col) positions to premium square types
-        """
-        premium = {}
-
-        # Triple Word Score positions
-        tw_positions = [
-            (0, 0),
-            (0, 7),
-            (0, 14),
-            (7, 0),
-            (7, 14),
-            (14, 0),
-            (14, 7),
-            (14, 14),
-        ]
-        for pos in tw_positions:
-            premium[pos] = self.TRIPLE_WORD
-
-        # Double Word Score positions
-        dw_positions = [
-            (1, 1),
-            (2, 2),
-            (3, 3),
-            (4, 4),
-            (1, 13),
-            (2, 12),
-            (3, 11),
-            (4, 10),
-            (13, 1),
-            (12, 2),
-            (11, 3),
-            (10, 4),
-            (13, 13),
-            (12, 12),
-            (11, 11),
-            (10, 10),
-            (7, 7),  # Center square
-        ]
-        for pos in dw_positions:
-            if pos == (7, 7):
-                premium[pos] = self.CENTER
-            else:
-                premium[pos] = self.DOUBLE_WORD
-
-        # Triple Letter Score positions
-        tl_positions = [
-            (1, 5),
-            (1, 9),
-            (5, 1),
-            (5, 5),
-            (5, 9),
-            (5, 13),
-            (9, 1),
-            (9, 5),
-            (9, 9),
-            (9, 13),
-            (13, 5),
-            (13, 9),
-        ]
-        for pos in tl_positions:
-            premium[pos] = self.TRIPLE_LETTER
-
-        # Double Letter Score positions
-        dl_positions = [
-            (0, 3),
-            (0, 11),
-            (2, 6),
-            (2, 8),
-            (3, 0),
-            (3, 7),
-            (3, 14),
-            (6, 2),
-            (6, 6),
-            (6, 8),
-            (6, 12),
-            (7, 3),
-            (7, 11),
-            (8, 2),
-            (8, 6),
-            (8, 8),
-            (8, 12),
-            (11, 0),
-            (11, 7),
-            (11, 14),
-            (12, 6),
-            (12, 8),
-            (14, 3),
-            (14, 11),
-        ]
-        for pos in dl_positions:
-            premium[pos] = self.DOUBLE_LETTER
-
-        return premium
+            New board with the same tiles
+        """
+        board = Board.__new__(Board)
+        board.__dict__.update(self.__dict__)
+        board._tiles = self._tiles[:]
+        board.letter_codes = self.letter_codes[:]
+        board.tile_points = self.tile_points[:]
+        board.blank_flags = self.blank_flags[:]
+        board.transposed_codes = self.transposed_codes[:]
+        board.transposed_points = self.transposed_points[:]
+        board.row_masks = self.row_masks[:]
+        board.col_masks = self.col_masks[:]
+        board._cross_checks = {
+            direction: [line[:] for line in lines]
+            for direction, lines in self._cross_checks.items()
+        }
+        board._cross_scores = {
+            direction: [line[:] for line in lines]
+            for direction, lines in self._cross_scores.items()
+        }
+        board._dirty_lines = {
+            direction: set(lines) for direction, lines in self._dirty_lines.items()
+        }
+        board._runs = {direction: lines[:] for direction, lines in self._runs.items()}
+        return board
+
+    @property
+    def grid(self) -> Tuple[Tuple[Optional[Tile], ...], ...]:
+        """Read-only snapshot of the tiles as rows of ``Tile`` or None.
+
+        Rows are tuples, so writing to them raises instead of silently
+        missing the board; use ``place_tile`` and ``remove_tile``.
+        """
+        size = self.size
+        tiles = self._tiles
+        return tuple(tuple(tiles[row * size : (row + 1) * size]) for row in range(size))
+
+    def __deepcopy__(self, memo: Dict[int, object]) -> "Board":
+        board = Board.__new__(Board)
+        memo[id(self)] = board
+        # The layout and the views of it stay shared, like with ``copy``
+        layout = self.layout
+        for shared in (layout, layout.premium_squares, layout.line_squares):
+            memo[id(shared)] = shared
+        for name, value in self.__dict__.items():
+            setattr(board, name, copy.deepcopy(value, memo))
+        return board
 
     def get_tile(self, row: int, col: int) -> Optional[Tile]:
         """Get the tile at the specified position.
 
         Args:
-            row: Row index (0-14)
-            col: Column index (0-14)
+            row: Row index
+            col: Column index
 
         Returns:
             Tile at position or None if empty
         """
         if not self.is_valid_position(row, col):
             return None
-        return self.grid[row][col]
+        return self._tiles[row * self.size + col]
+
+    def get_letter(self, row: int, col: int) -> Optional[str]:
+        """Get the letter shown at a position, without touching the tile.
+
+        Args:
+            row: Row index
+            col: Column index
+
+        Returns:
+            The letter, or None if the position is empty or off the board
+        """
+        if not self.is_valid_position(row, col):
+            return None
+        return self._code_letters[self.letter_codes[row * self.size + col]] or None
 
     def place_tile(self, row: int, col: int, tile: Tile) -> bool:
         """Place a tile on the board.
 
         Args:
-            row: Row index (0-14)
-            col: Column index (0-14)
+            row: Row index
+            col: Column index
             tile: Tile to place
 
         Returns:
@@ -148,27 +235,417 @@ class Board:
         """
         if not self.is_valid_position(row, col):
             return False
-        if self.grid[row][col] is not None:
+        index = row * self.size + col
+        if self.letter_codes[index] != EMPTY:
             return False
-        self.grid[row][col] = tile
+        letter = tile.get_display_letter()
+        code = self.alphabet.codes.get(letter)
+        if code is None:
+            code = self._add_letter(letter)
+        transposed = col * self.size + row
+        self._tiles[index] = tile
+        self.letter_codes[index] = self.transposed_codes[transposed] = code
+        self.tile_points[index] = self.transposed_points[transposed] = tile.points
+        self.blank_flags[index] = tile.is_blank
+        self.zobrist ^= square_key(index, letter, tile.is_blank)
+        self.occupied |= 1 << index
+        self.used_premiums |= self.premium_mask & 1 << index
+        self.row_masks[row] |= 1 << col
+        self.col_masks[col] |= 1 << row
+        self._tiles_changed(row, col)
         return True
 
     def remove_tile(self, row: int, col: int) -> Optional[Tile]:
         """Remove and return the tile at the specified position.
 
         Args:
-            row: Row index (0-14)
-            col: Column index (0-14)
+            row: Row index
+            col: Column index
 
         Returns:
             Removed tile or None if position was empty
         """
         if not self.is_valid_position(row, col):
             return None
-        tile = self.grid[row][col]
-        self.grid[row][col] = None
+        index = row * self.size + col
+        tile = self._tiles[index]
+        if tile is not None:
+            letter = self._code_letters[self.letter_codes[index]]
+            self.zobrist ^= square_key(index, letter, bool(self.blank_flags[index]))
+            transposed = col * self.size + row
+            self._tiles[index] = None
+            self.letter_codes[index] = self.transposed_codes[transposed] = EMPTY
+            self.tile_points[index] = self.transposed_points[transposed] = 0
+            self.blank_flags[index] = 0
+            self.occupied &= ~(1 << index)
+            self.used_premiums &= ~(1 << index)
+            self.row_masks[row] &= ~(1 << col)
+            self.col_masks[col] &= ~(1 << row)
+            self._tiles_changed(row, col)
         return tile
 
+    def line_multipliers(self, direction: str, line: int) -> Tuple[bytes, bytes, int]:
+        """Get the contiguous multiplier arrays holding a row or column.
+
+        Args:
+            direction: 'H' for a row, 'V' for a column
+            line: Index of the row or column
+
+        Returns:
+            Tuple of (letter multipliers, word multipliers, offset of the
+            line's first square)
+        """
+        if direction == "H":
+            return self.letter_multipliers, self.word_multipliers, line * self.size
+        return (
+            self.transposed_letter_multipliers,
+            self.transposed_word_multipliers,
+            line * self.size,
+        )
+
+    def score_placement(self, tiles: Sequence[NewTile]) -> int:
+        """Score the words a placement would form, without placing it.
+
+        This is the one scoring routine of the game: ``Game.place_word``,
+        batch evaluation and the move generator all use it. Every word is
+        scored in one pass over array slices: the points of the tiles on the
+        board, plus the new tiles' points times their letter multipliers,
+        all times the new tiles' word multipliers. Squares that already hold
+        a tile never count their premium.
+
+        Args:
+            tiles: (row, col, points) of the new tiles, on empty squares of
+                one row or column with no gaps other than board tiles
+
+        Returns:
+            Sum of the scores of the main word and every cross word of two
+            or more letters; the bingo bonus is not included
+        """
+        if not tiles:
+            return 0
+        size = self.size
+        first_row = tiles[0][0]
+        if all(row == first_row for row, _, _ in tiles):
+            direction, cross, line = "H", "V", first_row
+            # (position along the main line, position across it, points)
+            along = [(col, row, points) for row, col, points in tiles]
+        else:
+            direction, cross, line = "V", "H", tiles[0][1]
+            along = list(tiles)
+
+        total = 0
+        runs = self.line_runs(direction, line)
+        first = min(along)[0]
+        last = max(along)[0]
+        before = runs[first - 1] if first > 0 else None
+        after = runs[last + 1] if last < size - 1 else None
+        if before or after or last > first:
+            _, points, base = self.line_arrays(direction, line)
+            letter_mult, word_mult, _ = self.line_multipliers(direction, line)
+            # Board tiles between the new ones, then the runs at either end
+            score = sum(points[base + first : base + last + 1])
+            score += (before[3] if before else 0) + (after[3] if after else 0)
+            multiplier = 1
+            for i, _, tile_points in along:
+                score += tile_points * letter_mult[base + i]
+                multiplier *= word_mult[base + i]
+            total = score * multiplier
+
+        letter_mult, word_mult, _ = self.line_multipliers(cross, 0)
+        all_runs = self._runs[cross]
+        for i, j, tile_points in along:
+            runs = all_runs[i] or self.line_runs(cross, i)
+            before = runs[j - 1] if j > 0 else None
+            after = runs[j + 1] if j < size - 1 else None
+            if before or after:
+                index = i * size + j
+                score = (before[3] if before else 0) + (after[3] if after else 0)
+                score += tile_points * letter_mult[index]
+                total += score * word_mult[index]
+        return total
+
+    def _add_letter(self, letter: str) -> int:
+        """Give a letter outside the board's alphabet a code.
+
+        The letter is appended to the alphabet, so existing codes stay valid.
+
+        Args:
+            letter: Letter to add
+
+        Returns:
+            Its code
+        """
+        self.alphabet = self.alphabet.extended(letter)
+        self._code_letters = ("",) + self.alphabet.letters
+        return self.alphabet.codes[letter]
+
+    def line_arrays(
+        self, direction: str, line: int
+    ) -> Tuple[bytearray, bytearray, int]:
+        """Get the contiguous arrays holding a row or column.
+
+        Args:
+            direction: 'H' for a row, 'V' for a column
+            line: Index of the row or column
+
+        Returns:
+            Tuple of (letter codes, tile points, offset of the line's first
+            square); square ``i`` of the line is at ``offset + i``
+        """
+        if direction == "H":
+            return self.letter_codes, self.tile_points, line * self.size
+        return self.transposed_codes, self.transposed_points, line * self.size
+
+    def _tiles_changed(self, row: int, col: int) -> None:
+        """Update derived state after the tile at a position changed.
+
+        Args:
+            row: Row index
+            col: Column index
+        """
+        # Horizontal words are constrained by their column, vertical by their row
+        self._dirty_lines["H"].add(col)
+        self._dirty_lines["V"].add(row)
+        self._runs["H"][row] = None
+        self._runs["V"][col] = None
+
+    def line_runs(self, direction: str, line: int) -> List[Optional[Run]]:
+        """Get the runs of tiles on a row or column.
+
+        Args:
+            direction: 'H' for a row, 'V' for a column
+            line: Index of the row or column
+
+        Returns:
+            For each square of the line, the run of tiles covering it, or
+            None if the square is empty. The list must not be modified.
+        """
+        runs = self._runs[direction][line]
+        if runs is None:
+            runs = self._runs[direction][line] = self._build_runs(direction, line)
+        return runs
+
+    def _build_runs(self, direction: str, line: int) -> List[Optional[Run]]:
+        """Find the runs of tiles on a row or column.
+
+        Args:
+            direction: 'H' for a row, 'V' for a column
+            line: Index of the row or column
+
+        Returns:
+            The run covering each square of the line, None for empty squares
+        """
+        size = self.size
+        codes, points, base = self.line_arrays(direction, line)
+        decode = self._code_letters
+        runs: List[Optional[Run]] = [None] * size
+        start = 0
+        while start < size:
+            if codes[base + start] == EMPTY:
+                start += 1
+                continue
+            end = codes.find(EMPTY, base + start, base + size)
+            end = size if end < 0 else end - base
+            word = "".join([decode[code] for code in codes[base + start : base + end]])
+            run = (start, end, word, sum(points[base + start : base + end]))
+            runs[start:end] = [run] * (end - start)
+            start = end
+        return runs
+
+    def word_run(self, row: int, col: int, direction: str) -> Optional[Run]:
+        """Get the run of tiles covering a square.
+
+        Args:
+            row: Row index
+            col: Column index
+            direction: 'H' for the run along the row, 'V' along the column
+
+        Returns:
+            The run, with ``start`` and ``end`` counted along the line, or
+            None if the square is empty or off the board
+        """
+        if not self.is_valid_position(row, col):
+            return None
+        if direction == "H":
+            return self.line_runs("H", row)[col]
+        return self.line_runs("V", col)[row]
+
+    def position_mask(self, positions: Iterable[Tuple[int, int]]) -> int:
+        """Get the bitboard with the given positions set.
+
+        Args:
+            positions: (row, col) tuples
+
+        Returns:
+            Bitmask with bit ``row * size + col`` set for every position
+        """
+        mask = 0
+        for row, col in positions:
+            mask |= 1 << (row * self.size + col)
+        return mask
+
+    def neighbour_mask(self, mask: int) -> int:
+        """Get the squares orthogonally adjacent to any square in a bitboard.
+
+        Args:
+            mask: Bitboard of squares
+
+        Returns:
+            Bitboard of their neighbours (which may overlap ``mask`` itself)
+        """
+        return (
+            (mask >> self.size)
+            | ((mask << self.size) & self._full_mask)
+            | ((mask << 1) & self._not_first_col)
+            | ((mask >> 1) & self._not_last_col)
+        )
+
+    def anchor_mask(self) -> int:
+        """Get the bitboard of anchors: empty squares next to a tile.
+
+        Returns:
+            Bitboard of anchor squares
+        """
+        return self.neighbour_mask(self.occupied) & ~self.occupied
+
+    @staticmethod
+    def span_mask(start: int, end: int) -> int:
+        """Get a line mask with bits ``start`` to ``end`` (inclusive) set.
+
+        Args:
+            start: First index
+            end: Last index
+
+        Returns:
+            Bitmask covering the span
+        """
+        return ((1 << (end - start + 1)) - 1) << start
+
+    def is_anchor(self, row: int, col: int) -> bool:
+        """Check if a position is an anchor: an empty square next to a tile.
+
+        Args:
+            row: Row index
+            col: Column index
+
+        Returns:
+            True if position is an anchor, False otherwise
+        """
+        if not self.is_valid_position(row, col):
+            return False
+        return bool(self.anchor_mask() >> (row * self.size + col) & 1)
+
+    def attach_validator(
+        self, validator: "WordValidator", letters: Iterable[str]
+    ) -> None:
+        """Start maintaining cross-checks against a validator.
+
+        Args:
+            validator: Validator deciding which perpendicular words are valid
+            letters: Letters that may be placed on the board
+        """
+        self._validator = validator
+        self._cross_letters = tuple(letters)
+        self._cross_version = validator.version
+        self._cross_checks = {
+            direction: [[None] * self.size for _ in range(self.size)]
+            for direction in ("H", "V")
+        }
+        self._cross_scores = {
+            direction: [[-1] * self.size for _ in range(self.size)]
+            for direction in ("H", "V")
+        }
+        self._dirty_lines = {"H": set(range(self.size)), "V": set(range(self.size))}
+
+    @property
+    def validator(self) -> Optional["WordValidator"]:
+        """The validator cross-checks are maintained against, if any."""
+        return self._validator
+
+    def get_cross_check(self, row: int, col: int, direction: str) -> CrossCheck:
+        """Get the letters that may be placed on an empty square.
+
+        Requires ``attach_validator`` to have been called.
+
+        Args:
+            row: Row index
+            col: Column index
+            direction: Direction of the word being played, 'H' or 'V'
+
+        Returns:
+            Letters forming a valid perpendicular word, or None if the square
+            has no perpendicular neighbours and any letter fits
+        """
+        self.update_cross_checks()
+        return self._cross_checks[direction][row][col]
+
+    def get_cross_score(self, row: int, col: int, direction: str) -> int:
+        """Get the face value of the perpendicular word through a square.
+
+        Requires ``attach_validator`` to have been called.
+
+        Args:
+            row: Row index
+            col: Column index
+            direction: Direction of the word being played, 'H' or 'V'
+
+        Returns:
+            Sum of the tile points next to the square in the perpendicular
+            direction, or -1 if a tile there would form no perpendicular word
+        """
+        self.update_cross_checks()
+        return self._cross_scores[direction][row][col]
+
+    def update_cross_checks(self) -> None:
+        """Recompute the cross-checks of lines changed since the last update.
+
+        Only the columns (for horizontal plays) and rows (for vertical plays)
+        touched by ``place_tile`` or ``remove_tile`` are recomputed. All lines
+        are recomputed when words were added to the validator.
+        """
+        if self._validator is None:
+            raise ValueError("No validator attached to the board")
+        if self._validator.version != self._cross_version:
+            self._cross_version = self._validator.version
+            self._dirty_lines = {"H": set(range(self.size)), "V": set(range(self.size))}
+        for direction, lines in self._dirty_lines.items():
+            for line in lines:
+                self._compute_cross_checks(direction, line)
+            lines.clear()
+
+    def _compute_cross_checks(self, direction: str, line: int) -> None:
+        """Compute the cross-checks of every square on one line.
+
+        Args:
+            direction: 'H' to compute a column's checks for horizontal plays,
+                'V' to compute a row's checks for vertical plays
+            line: Index of the column or row
+        """
+        size = self.size
+        # Horizontal plays are checked against the words in a column
+        runs = self.line_runs("V" if direction == "H" else "H", line)
+        checks = self._cross_checks[direction]
+        scores = self._cross_scores[direction]
+        validator = self._validator
+        if validator is None:
+            raise ValueError("No validator attached to the board")
+        hooks = validator.get_hook_table()
+        allowed = hooks.mask(self._cross_letters)
+        for i in range(size):
+            r, c = (i, line) if direction == "H" else (line, i)
+            checks[r][c] = None
+            scores[r][c] = -1
+            if runs[i] is not None:
+                continue
+            before = runs[i - 1] if i > 0 else None
+            after = runs[i + 1] if i < size - 1 else None
+            if before is None and after is None:
+                continue
+            prefix = before[2] if before else ""
+            suffix = after[2] if after else ""
+            checks[r][c] = hooks.letters(hooks.hooks(prefix, suffix) & allowed)
+            scores[r][c] = (before[3] if before else 0) + (after[3] if after else 0)
+
     def is_valid_position(self, row: int, col: int) -> bool:
         """Check if a position is valid on the board.
 
@@ -193,7 +670,7 @@ class Board:
         """
         if not self.is_valid_position(row, col):
             return False
-        return self.grid[row][col] is None
+        return not self.row_masks[row] >> col & 1
 
     def get_premium_square(self, row: int, col: int) -> Optional[str]:
         """Get the premium square type at the specified position.
@@ -217,7 +694,7 @@ class Board:
         Returns:
             True if position is center, False otherwise
         """
-        return row == 7 and col == 7
+        return (row, col) == self.layout.center
 
     def is_board_empty(self) -> bool:
         """Check if the board is completely empty.
@@ -225,11 +702,7 @@ class Board:
         Returns:
             True if board is empty, False otherwise
         """
-        for row in self.grid:
-            for tile in row:
-                if tile is not None:
-                    return False
-        return True
+        return self.occupied == 0
 
     def get_word_at(
         self, row: int, col: int, direction: str
@@ -244,47 +717,28 @@ class Board:
         Returns:
             Tuple of (word string, list of positions)
         """
-        word = []
-        positions = []
-
-        if direction == "H":
-            # Move left to find start of word
-            start_col = col
-            while start_col > 0 and self.grid[row][start_col - 1] is not None:
-                start_col -= 1
-
-            # Read word from start
-            c = start_col
-            while c < self.size and self.grid[row][c] is not None:
-                tile = self.grid[row][c]
-                word.append(tile.get_display_letter())
-                positions.append((row, c))
-                c += 1
-        else:  # Vertical
-            # Move up to find start of word
-            start_row = row
-            while start_row > 0 and self.grid[start_row - 1][col] is not None:
-                start_row -= 1
-
-            # Read word from start
-            r = start_row
-            while r < self.size and self.grid[r][col] is not None:
-                tile = self.grid[r][col]
-                word.append(tile.get_display_letter())
-                positions.append((r, col))
-                r += 1
-
-        return ("".join(word), positions)
+        size = self.size
+        if not (0 <= row < size and 0 <= col < size):
+            return ("", [])
+        line, i = (row, col) if direction == "H" else (col, row)
+        runs = self._runs[direction][line] or self.line_runs(direction, line)
+        # An empty square reads the word ending just before it, if any
+        run = runs[i] or (runs[i - 1] if i > 0 else None)
+        if run is None:
+            return ("", [])
+        start, end, word, _ = run
+        return (word, self._line_squares[direction][line][start:end])
 
     def __repr__(self) -> str:
         """String representation of the board."""
         lines = []
         lines.append("   " + " ".join(f"{i:2d}" for i in range(self.size)))
-        for i, row in enumerate(self.grid):
+        for i in range(self.size):
             row_str = f"{i:2d} "
-            for j, tile in enumerate(row):
-                if tile:
-                    row_str += f" {tile.get_display_letter()} "
+            for j in range(self.size):
+                letter = self.get_letter(i, j)
+                if letter:
+                    row_str += f" {letter} "
                 else:
                     premium = self.get_premium_square(i, j)
                     if premium:
@@ -293,3 +747,113 @@ class Board:
                         row_str += " . "
             lines.append(row_str)
         return "\n".join(lines)
+
+
+class BoardOverlay:
+    """Read-only view of a board with a candidate placement laid on top.
+
+    Evaluating a move needs the words it would form, but neither a copy of
+    the grid nor changes to it. The overlay answers queries from a small
+    dict of pending tiles and falls through to the underlying board for
+    every other square, so one overlay can be reused for many candidates.
+    """
+
+    def __init__(self, board: Board, placement: Iterable[Tuple[int, int, Tile]] = ()):
+        """Initialize the overlay.
+
+        Args:
+            board: Board to read through to
+            placement: Pending (row, col, tile) tuples
+        """
+        self.board = board
+        self.size = board.size
+        self.pending: Dict[Tuple[int, int], Tile] = {}
+        self.set_placement(placement)
+
+    def set_placement(self, placement: Iterable[Tuple[int, int, Tile]]) -> None:
+        """Replace the pending tiles.
+
+        Args:
+            placement: Pending (row, col, tile) tuples
+        """
+        self.pending = {(row, col): tile for row, col, tile in placement}
+
+    def get_tile(self, row: int, col: int) -> Optional[Tile]:
+        """Get the pending or placed tile at a position.
+
+        Args:
+            row: Row index
+            col: Column index
+
+        Returns:
+            Tile at position or None if empty
+        """
+        tile = self.pending.get((row, col))
+        if tile is None:
+            return self.board.get_tile(row, col)
+        return tile
+
+    def is_valid_position(self, row: int, col: int) -> bool:
+        """Check if a position is valid on the board."""
+        return self.board.is_valid_position(row, col)
+
+    def is_empty(self, row: int, col: int) -> bool:
+        """Check if a position is empty on the board and in the placement."""
+        return (row, col) not in self.pending and self.board.is_empty(row, col)
+
+    def get_premium_square(self, row: int, col: int) -> Optional[str]:
+        """Get the premium square type at the specified position."""
+        return self.board.get_premium_square(row, col)
+
+    def get_word_at(
+        self, row: int, col: int, direction: str
+    ) -> Tuple[str, List[Tuple[int, int]]]:
+        """Get the word through a position, including pending tiles.
+
+        Args:
+            row: Row of a square in the word
+            col: Column of a square in the word
+            direction: 'H' for horizontal, 'V' for vertical
+
+        Returns:
+            Tuple of (word string, list of positions)
+        """
+        board = self.board
+        if not board.is_valid_position(row, col):
+            return ("", [])
+        horizontal = direction == "H"
+        line, i = (row, col) if horizontal else (col, row)
+        runs = board.line_runs(direction, line)
+        # Letters of the pending tiles on this line, by position along it
+        pending = {
+            (c if horizontal else r): tile.get_display_letter()
+            for (r, c), tile in self.pending.items()
+            if (r if horizontal else c) == line
+        }
+        if not pending:
+            return board.get_word_at(row, col, direction)
+
+        # Jump over whole runs of board tiles and single pending tiles
+        start = i
+        while start > 0:
+            run = runs[start - 1]
+            if start - 1 in pending:
+                start -= 1
+            elif run is not None:
+                start = run[0]
+            else:
+                break
+        parts = []
+        end = start
+        while end < board.size:
+            run = runs[end]
+            if end in pending:
+                parts.append(pending[end])
+                end += 1
+            elif run is not None:
+                parts.append(run[2])
+                end = run[1]
+            else:
+                break
+        squares = board._line_squares[direction][line]
+        return ("".join(parts), squares[start:end])
@@ -0,0 +1,43 @@
+"""Command-line lexicon compiler.
+
+Turns a plain-text word list into a compiled lexicon file that
+``WordValidator`` memory-maps instead of parsing::
+
+    python -m scrabble.compiler words.txt words.lex
+
+Word lists may be compressed, and several lists are combined into one
+lexicon::
+
+    python -m scrabble.compiler base.txt.xz house-rules.txt words.lex
+"""
+
+import argparse
+from typing import Optional, Sequence
+
+from scrabble.lexicon import compile_lexicon, read_words
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Compile plain-text word lists into a compiled lexicon file.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m scrabble.compiler",
+        description="Compile word lists (one word per line, optionally gzip, "
+        "xz or bzip2 compressed) into a binary lexicon that WordValidator can "
+        "memory-map.",
+    )
+    parser.add_argument("sources", nargs="+", help="plain-text word lists")
+    parser.add_argument("output", help="compiled lexicon file to write")
+    args = parser.parse_args(argv)
+    lexicon = compile_lexicon(read_words(args.sources), args.output)
+    print(
+        f"Compiled {len(lexicon)} words into {lexicon.node_count()} nodes: "
+        f"{args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""GADDAG word graph used for move generation.
+
+A GADDAG stores every word once for each of its letters: the letters before
+that point in reverse, a separator, then the rest of the word. Starting from
+any letter already on the board (or any square a tile could go), a search
+can therefore extend a word leftwards first and then rightwards without ever
+guessing where the word starts. The graph is minimized with the same builder
+as the DAWG lexicon.
+"""
+
+from typing import Iterable, Optional, Set
+
+from scrabble.alphabet import EMPTY, Alphabet
+from scrabble.lexicon import build_graph
+
+SEPARATOR = "^"
+SEPARATOR_CODE = EMPTY
+
+
+class Gaddag:
+    """Minimized GADDAG over a word list.
+
+    Edge label ``SEPARATOR_CODE`` marks the switch from the reversed prefix
+    to the suffix; other labels are letter codes of ``alphabet``. A node is
+    final when the path leading to it spells a complete entry.
+    """
+
+    def __init__(self, words: Iterable[str], alphabet: Optional[Alphabet] = None):
+        """Build the GADDAG.
+
+        Args:
+            words: Uppercase words to include
+            alphabet: Letter codes to use. Letters of the words that it lacks
+                are appended; by default the words' letters are coded in
+                sorted order.
+        """
+        unique: Set[str] = set(words)
+        letters = {letter for word in unique for letter in word}
+        if alphabet is None:
+            alphabet = Alphabet("", sorted(letters))
+        else:
+            alphabet = alphabet.extended(letters)
+        self.alphabet = alphabet
+        # Letter of each edge label, the separator first
+        self.letters = SEPARATOR + "".join(alphabet.letters)
+        self.codes = dict(alphabet.codes)
+        self.codes[SEPARATOR] = SEPARATOR_CODE
+        sequences = set()
+        for word in unique:
+            encoded = bytes(self.codes[letter] for letter in word)
+            for split in range(1, len(encoded) + 1):
+                sequences.add(
+                    encoded[split - 1 :: -1]
+                    + bytes((SEPARATOR_CODE,))
+                    + encoded[split:]
+                )
+        (
+            self.first_edge,
+            self.labels,
+            self.targets,
+            self.finals,
+            self.root,
+        ) = build_graph(sorted(sequences))
+        self.word_count = len(unique)
+
+    def child(self, node: int, letter: str) -> int:
+        """Follow the edge labelled ``letter`` out of ``node``.
+
+        Args:
+            node: Node to start from
+            letter: Letter, or ``SEPARATOR``
+
+        Returns:
+            Destination node, or -1 if there is no such edge
+        """
+        code = self.codes.get(letter)
+        if code is None:
+            return -1
+        index = self.labels.find(code, self.first_edge[node], self.first_edge[node + 1])
+        return self.targets[index] if index >= 0 else -1
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str) or not word:
+            return False
+        node = self.root
+        for letter in word[::-1] + SEPARATOR:
+            node = self.child(node, letter)
+            if node < 0:
+                return False
+        return bool(self.finals[node])
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def node_count(self) -> int:
+        """Get the number of nodes in the graph.
+
+        Returns:
+            Number of nodes
+        """
+        return len(self.finals)
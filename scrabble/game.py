@@ -1,12 +1,46 @@
 """Main Game class for Scrabble with official rules implementation."""
 
-from typing import Dict, List, Optional, Tuple
+import copy
+import random
+import weakref
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
-from scrabble.board import Board
+from scrabble.alphabet import get_alphabet
+from scrabble.board import Board, BoardOverlay
 from scrabble.language import SUPPORTED_LANGUAGES, get_language_name, load_translations
+from scrabble.layout import Layout
+from scrabble.movegen import Move, MoveGenerator
 from scrabble.player import Player
+from scrabble.registry import ValidatorRegistry, default_registry
 from scrabble.tile import Tile, TileBag
-from scrabble.validator import WordValidator
+from scrabble.wordlist import DictionaryFiles
+from scrabble.zobrist import turn_key
+
+
+class _MoveRecord:
+    """What ``Game.pop_move`` needs to take back one move."""
+
+    __slots__ = (
+        "player_index",
+        "rack",
+        "scores",
+        "turn_number",
+        "consecutive_passes",
+        "game_over",
+        "positions",
+        "drawn",
+    )
+
+    def __init__(self, game: "Game"):
+        player = game.get_current_player()
+        self.player_index = game.current_player_index
+        self.rack = list(player.rack)
+        self.scores = [p.score for p in game.players]
+        self.turn_number = game.turn_number
+        self.consecutive_passes = game.consecutive_passes
+        self.game_over = game.game_over
+        self.positions: List[Tuple[int, int]] = []
+        self.drawn: List[Tuple[int, Tile]] = []
 
 
 class Game:
@@ -15,13 +49,28 @@ class Game:
     RACK_SIZE = 7
     BINGO_BONUS = 50  # Bonus for using all 7 tiles
 
-    def __init__(self, player_names: List[str], dictionary_file: Optional[str] = None, language: str = "nl"):
+    def __init__(
+        self,
+        player_names: List[str],
+        dictionary_file: Optional[DictionaryFiles] = None,
+        language: str = "nl",
+        registry: Optional[ValidatorRegistry] = None,
+        rng: Optional[random.Random] = None,
+        layout: Union[Layout, str, None] = None,
+    ):
         """Initialize a new game.
 
         Args:
             player_names: List of player names
-            dictionary_file: Optional path to dictionary file
+            dictionary_file: Optional path to dictionary file, or paths of
+                several word lists to combine
             language: Language code ('en', 'nl', or 'fi'). Defaults to 'nl'.
+            registry: Registry that shares lexicons between games. Defaults
+                to the process-wide ``default_registry``.
+            rng: Random number generator for the tile bag. Pass a seeded
+                ``random.Random`` to replay the same game.
+            layout: Board geometry, or the name of a registered layout.
+                Defaults to the standard 15x15 board.
         """
         if len(player_names) < 2:
             raise ValueError("At least 2 players are required")
@@ -38,19 +87,36 @@ class Game:
 
         self.language = language
         self.translations = load_translations(language)
-        self.board = Board()
-        self.tile_bag = TileBag(language)
-        self.validator = WordValidator(dictionary_file)
+        self.alphabet = get_alphabet(language)
+        self.board = Board(self.alphabet, layout)
+        self.tile_bag = TileBag(language, rng)
+        if registry is None:
+            registry = default_registry
+        self._registry = registry
+        self.validator = registry.acquire(language, dictionary_file)
+        self._release_validator = weakref.finalize(
+            self, registry.release, self.validator
+        )
+        self.board.attach_validator(self.validator, self.alphabet.letters)
         self.players = [Player(name, i) for i, name in enumerate(player_names)]
         self.current_player_index = 0
         self.game_over = False
         self.turn_number = 0
         self.consecutive_passes = 0
+        self._journal: List[_MoveRecord] = []
 
         # Initialize player racks
         for player in self.players:
             player.add_tiles(self.tile_bag.draw(self.RACK_SIZE))
 
+    def close(self) -> None:
+        """Release the game's hold on the shared lexicon.
+
+        Called automatically when the game is garbage collected; calling it
+        explicitly frees the lexicon as soon as the last game using it ends.
+        """
+        self._release_validator()
+
     def get_text(self, key: str) -> str:
         """Get translated text for a given key.
         
@@ -70,6 +136,20 @@ class Game:
         """
         return self.players[self.current_player_index]
 
+    @property
+    def zobrist(self) -> int:
+        """64-bit Zobrist hash of the position.
+
+        Covers the tiles on the board, every player's rack and the player to
+        move, but not the scores. Equal positions reached in different ways
+        hash the same, which makes the hash a key for a
+        ``scrabble.zobrist.TranspositionTable``.
+        """
+        key = self.board.zobrist ^ turn_key(self.current_player_index)
+        for player in self.players:
+            key ^= player.zobrist
+        return key
+
     def next_player(self) -> None:
         """Move to the next player."""
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
@@ -86,51 +166,33 @@ class Game:
         Returns:
             Tuple of (success, message, score)
         """
-        if not word_placement:
-            return False, "No tiles placed", 0
-
-        # Check if player has the tiles
         player = self.get_current_player()
-        tiles_to_place = [tile for _, _, tile in word_placement]
-
-        if not self._player_has_tiles(player, tiles_to_place):
-            return False, "Player does not have these tiles", 0
-
-        # Validate placement rules
-        valid, message = self._validate_placement(word_placement)
+        valid, message, _, score = self.evaluate_placement(word_placement, player)
         if not valid:
             return False, message, 0
 
-        # Temporarily place tiles on board
-        placed_tiles = []
-        for row, col, tile in word_placement:
-            if self.board.place_tile(row, col, tile):
-                placed_tiles.append((row, col, tile))
-            else:
-                # Rollback
-                self._rollback_placement(placed_tiles)
-                return False, f"Cannot place tile at ({row}, {col})", 0
-
-        # Get all formed words and validate
-        words = self._get_all_formed_words(word_placement)
-
-        # Validate all words
-        invalid_words = []
-        for word, _ in words:
-            if not self.validator.is_valid_word(word):
-                invalid_words.append(word)
+        self._commit_placement(player, word_placement, score)
+        return True, f"Valid! Score: {score} points", score
 
-        if invalid_words:
-            # Rollback
-            self._rollback_placement(placed_tiles)
-            return False, f"Invalid word(s): {', '.join(invalid_words)}", 0
+    def _commit_placement(
+        self,
+        player: Player,
+        word_placement: List[Tuple[int, int, Tile]],
+        score: int,
+    ) -> List[Tuple[int, Tile]]:
+        """Play a placement that ``evaluate_placement`` accepted.
 
-        # Calculate score
-        score = self._calculate_score(word_placement, words)
+        Args:
+            player: Current player
+            word_placement: List of (row, col, tile) tuples
+            score: Score of the placement
 
-        # Check for bingo (all 7 tiles used)
-        if len(word_placement) == self.RACK_SIZE:
-            score += self.BINGO_BONUS
+        Returns:
+            (position, tile) pairs drawn from the bag to refill the rack
+        """
+        for row, col, tile in word_placement:
+            self.board.place_tile(row, col, tile)
+        tiles_to_place = [tile for _, _, tile in word_placement]
 
         # Remove tiles from player's rack
         for tile in tiles_to_place:
@@ -140,8 +202,8 @@ class Game:
         player.add_score(score)
 
         # Draw new tiles
-        new_tiles = self.tile_bag.draw(len(tiles_to_place))
-        player.add_tiles(new_tiles)
+        drawn = self.tile_bag.take(len(tiles_to_place))
+        player.add_tiles([tile for _, tile in drawn])
 
         # Reset consecutive passes
         self.consecutive_passes = 0
@@ -152,7 +214,213 @@ class Game:
         # Check for game end
         self._check_game_end()
 
-        return True, f"Valid! Score: {score} points", score
+        return drawn
+
+    def push_move(
+        self, word_placement: Optional[List[Tuple[int, int, Tile]]]
+    ) -> Tuple[bool, str, int]:
+        """Play a move that can be taken back with ``pop_move``.
+
+        Only what the move changes is recorded: the squares it covers, the
+        player's rack, the tiles drawn, the scores and the turn counters.
+        The bag's random state is not restored; snapshot it with
+        ``tile_bag.get_rng_state`` to redraw the same tiles after undoing.
+
+        Args:
+            word_placement: List of (row, col, tile) tuples, or None to pass
+
+        Returns:
+            Tuple of (success, message, score). Failed moves change nothing
+            and are not recorded.
+        """
+        record = _MoveRecord(self)
+        if word_placement is None:
+            _, message = self.pass_turn()
+            score = 0
+        else:
+            player = self.get_current_player()
+            valid, message, _, score = self.evaluate_placement(word_placement, player)
+            if not valid:
+                return False, message, 0
+            record.positions = [(row, col) for row, col, _ in word_placement]
+            record.drawn = self._commit_placement(player, word_placement, score)
+            message = f"Valid! Score: {score} points"
+        self._journal.append(record)
+        return True, message, score
+
+    def pop_move(self) -> None:
+        """Take back the last move played with ``push_move``.
+
+        Raises:
+            IndexError: If there is no move to take back
+        """
+        if not self._journal:
+            raise IndexError("No move to undo")
+        record = self._journal.pop()
+        for row, col in reversed(record.positions):
+            self.board.remove_tile(row, col)
+        self.tile_bag.put_back(record.drawn)
+        self.players[record.player_index].rack = record.rack
+        for player, score in zip(self.players, record.scores):
+            player.score = score
+        self.current_player_index = record.player_index
+        self.turn_number = record.turn_number
+        self.consecutive_passes = record.consecutive_passes
+        self.game_over = record.game_over
+
+    def clone(self) -> "Game":
+        """Copy the game cheaply, e.g. to explore moves in another thread.
+
+        The premium layout, validator, translations and placed tiles are
+        shared; the board, bag and players are copied. The clone starts with
+        an empty ``pop_move`` history.
+
+        Returns:
+            Independent game in the same position
+        """
+        game = Game.__new__(Game)
+        game.__dict__.update(self.__dict__)
+        game.board = self.board.copy()
+        game.tile_bag = self.tile_bag.copy()
+        game.players = [player.copy() for player in self.players]
+        game._journal = []
+        self._registry.retain(self.validator)
+        game._release_validator = weakref.finalize(
+            game, self._registry.release, self.validator
+        )
+        return game
+
+    def __deepcopy__(self, memo: Dict[int, object]) -> "Game":
+        game = Game.__new__(Game)
+        memo[id(self)] = game
+        # The validator and its lexicon are shared, like with ``clone``
+        memo[id(self.validator)] = self.validator
+        for name, value in self.__dict__.items():
+            if name not in ("_registry", "_release_validator"):
+                setattr(game, name, copy.deepcopy(value, memo))
+        game._registry = self._registry
+        self._registry.retain(self.validator)
+        game._release_validator = weakref.finalize(
+            game, self._registry.release, self.validator
+        )
+        return game
+
+    def evaluate_placement(
+        self,
+        word_placement: List[Tuple[int, int, Tile]],
+        player: Optional[Player] = None,
+    ) -> Tuple[bool, str, List[str], int]:
+        """Check and score a placement without playing it.
+
+        The board, the player's rack and the tile bag are left untouched.
+
+        Args:
+            word_placement: List of (row, col, tile) tuples
+            player: Player whose rack must hold the tiles (defaults to the
+                current player)
+
+        Returns:
+            Tuple of (valid, message, formed words, score). The score
+            includes the bingo bonus and is 0 for invalid placements.
+        """
+        if player is None:
+            player = self.get_current_player()
+        return self._evaluate(word_placement, player, BoardOverlay(self.board))
+
+    def evaluate_placements(
+        self,
+        placements: Iterable[List[Tuple[int, int, Tile]]],
+        player: Optional[Player] = None,
+    ) -> List[Tuple[bool, str, List[str], int]]:
+        """Check and score several candidate placements.
+
+        Args:
+            placements: Candidate placements, each a list of (row, col, tile)
+            player: Player whose rack must hold the tiles (defaults to the
+                current player)
+
+        Returns:
+            One ``evaluate_placement`` result per candidate, in order
+        """
+        if player is None:
+            player = self.get_current_player()
+        overlay = BoardOverlay(self.board)
+        return [
+            self._evaluate(word_placement, player, overlay)
+            for word_placement in placements
+        ]
+
+    def _evaluate(
+        self,
+        word_placement: List[Tuple[int, int, Tile]],
+        player: Player,
+        overlay: BoardOverlay,
+    ) -> Tuple[bool, str, List[str], int]:
+        """Evaluate a placement using a reusable overlay of the board.
+
+        Args:
+            word_placement: List of (row, col, tile) tuples
+            player: Player whose rack must hold the tiles
+            overlay: Overlay of ``self.board`` to lay the tiles on
+
+        Returns:
+            Tuple of (valid, message, formed words, score)
+        """
+        if not word_placement:
+            return False, "No tiles placed", [], 0
+
+        # Check if player has the tiles
+        tiles_to_place = [tile for _, _, tile in word_placement]
+        if not self._player_has_tiles(player, tiles_to_place):
+            return False, "Player does not have these tiles", [], 0
+
+        # Validate placement rules
+        valid, message = self._validate_placement(word_placement)
+        if not valid:
+            return False, message, [], 0
+
+        seen = set()
+        for row, col, _ in word_placement:
+            if not self.board.is_valid_position(row, col) or (row, col) in seen:
+                return False, f"Cannot place tile at ({row}, {col})", [], 0
+            seen.add((row, col))
+
+        # Get all formed words and validate
+        overlay.set_placement(word_placement)
+        words = self._get_all_formed_words(word_placement, overlay)
+        formed = [word for word, _ in words]
+        invalid_words = [
+            word for word in formed if not self.validator.is_valid_word(word)
+        ]
+        if invalid_words:
+            return False, f"Invalid word(s): {', '.join(invalid_words)}", formed, 0
+
+        score = self.board.score_placement(
+            [(row, col, tile.points) for row, col, tile in word_placement]
+        )
+
+        # Check for bingo (all 7 tiles used)
+        if len(word_placement) == self.RACK_SIZE:
+            score += self.BINGO_BONUS
+
+        return True, f"Valid! Score: {score} points", formed, score
+
+    def generate_moves(self, player: Optional[Player] = None) -> List[Move]:
+        """Generate every legal placement for a player's rack.
+
+        Args:
+            player: Player whose rack to use (defaults to the current player)
+
+        Returns:
+            Legal moves with their scores, highest score first. Use
+            ``Move.to_placement`` to turn a move into a ``place_word`` call.
+        """
+        if player is None:
+            player = self.get_current_player()
+        generator = MoveGenerator(
+            self.board, self.validator, self.RACK_SIZE, self.BINGO_BONUS
+        )
+        return generator.generate(player.rack)
 
     def _player_has_tiles(self, player: Player, tiles: List[Tile]) -> bool:
         """Check if player has all the tiles.
@@ -164,13 +432,7 @@ class Game:
         Returns:
             True if player has all tiles, False otherwise
         """
-        rack_copy = player.rack.copy()
-        for tile in tiles:
-            try:
-                rack_copy.remove(tile)
-            except ValueError:
-                return False
-        return True
+        return player.rack.has_tiles(tiles)
 
     def _validate_placement(
         self, word_placement: List[Tuple[int, int, Tile]]
@@ -201,19 +463,19 @@ class Game:
         if len(set(rows)) == 1:
             # Horizontal word
             row = rows[0]
-            cols_sorted = sorted(cols)
             # Check continuity (including already placed tiles)
-            for i in range(cols_sorted[0], cols_sorted[-1] + 1):
-                if i not in cols and self.board.is_empty(row, i):
-                    return False, "Tiles must form a continuous word"
+            line = self.board.row_masks[row] | sum(1 << c for c in set(cols))
+            span = Board.span_mask(min(cols), max(cols))
+            if line & span != span:
+                return False, "Tiles must form a continuous word"
         elif len(set(cols)) == 1:
             # Vertical word
             col = cols[0]
-            rows_sorted = sorted(rows)
             # Check continuity (including already placed tiles)
-            for i in range(rows_sorted[0], rows_sorted[-1] + 1):
-                if i not in rows and self.board.is_empty(i, col):
-                    return False, "Tiles must form a continuous word"
+            line = self.board.col_masks[col] | sum(1 << r for r in set(rows))
+            span = Board.span_mask(min(rows), max(rows))
+            if line & span != span:
+                return False, "Tiles must form a continuous word"
         else:
             return False, "Tiles must be placed in a single row or column"
 
@@ -239,14 +501,8 @@ class Game:
         Returns:
             True if connected, False otherwise
         """
-        for row, col in positions:
-            # Check adjacent squares
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                adj_row, adj_col = row + dr, col + dc
-                if self.board.is_valid_position(adj_row, adj_col):
-                    if not self.board.is_empty(adj_row, adj_col):
-                        return True
-        return False
+        neighbours = self.board.neighbour_mask(self.board.position_mask(positions))
+        return bool(neighbours & self.board.occupied)
 
     def _rollback_placement(self, placed_tiles: List[Tuple[int, int, Tile]]) -> None:
         """Remove placed tiles from board.
@@ -258,16 +514,21 @@ class Game:
             self.board.remove_tile(row, col)
 
     def _get_all_formed_words(
-        self, word_placement: List[Tuple[int, int, Tile]]
+        self,
+        word_placement: List[Tuple[int, int, Tile]],
+        board: Optional[Union[Board, BoardOverlay]] = None,
     ) -> List[Tuple[str, List[Tuple[int, int]]]]:
         """Get all words formed by the placement.
 
         Args:
             word_placement: List of (row, col, tile) tuples
+            board: Board holding the placed tiles (defaults to ``self.board``)
 
         Returns:
             List of (word, positions) tuples
         """
+        if board is None:
+            board = self.board
         words = []
         positions = [(row, col) for row, col, _ in word_placement]
 
@@ -278,76 +539,30 @@ class Game:
         if len(set(rows)) == 1:
             # Horizontal main word
             row = rows[0]
-            word, word_positions = self.board.get_word_at(row, min(cols), "H")
+            word, word_positions = board.get_word_at(row, min(cols), "H")
             if len(word) > 1:
                 words.append((word, word_positions))
 
             # Check perpendicular words
             for row, col in positions:
-                word, word_positions = self.board.get_word_at(row, col, "V")
+                word, word_positions = board.get_word_at(row, col, "V")
                 if len(word) > 1:
                     words.append((word, word_positions))
         else:
             # Vertical main word
             col = cols[0]
-            word, word_positions = self.board.get_word_at(min(rows), col, "V")
+            word, word_positions = board.get_word_at(min(rows), col, "V")
             if len(word) > 1:
                 words.append((word, word_positions))
 
             # Check perpendicular words
             for row, col in positions:
-                word, word_positions = self.board.get_word_at(row, col, "H")
+                word, word_positions = board.get_word_at(row, col, "H")
                 if len(word) > 1:
                     words.append((word, word_positions))
 
         return words
 
-    def _calculate_score(
-        self,
-        word_placement: List[Tuple[int, int, Tile]],
-        words: List[Tuple[str, List[Tuple[int, int]]]],
-    ) -> int:
-        """Calculate the score for a move.
-
-        Args:
-            word_placement: List of (row, col, tile) tuples
-            words: List of formed words with positions
-
-        Returns:
-            Total score
-        """
-        total_score = 0
-        new_positions = {(row, col) for row, col, _ in word_placement}
-
-        for word, positions in words:
-            word_score = 0
-            word_multiplier = 1
-
-            for row, col in positions:
-                tile = self.board.get_tile(row, col)
-                if tile is None:
-                    continue
-
-                tile_score = tile.points
-
-                # Apply premium squares only for newly placed tiles
-                if (row, col) in new_positions:
-                    premium = self.board.get_premium_square(row, col)
-                    if premium == Board.DOUBLE_LETTER:
-                        tile_score *= 2
-                    elif premium == Board.TRIPLE_LETTER:
-                        tile_score *= 3
-                    elif premium in [Board.DOUBLE_WORD, Board.CENTER]:
-                        word_multiplier *= 2
-                    elif premium == Board.TRIPLE_WORD:
-                        word_multiplier *= 3
-
-                word_score += tile_score
-
-            total_score += word_score * word_multiplier
-
-        return total_score
-
     def exchange_tiles(self, tiles: List[Tile]) -> Tuple[bool, str]:
         """Exchange tiles with the bag.
 
@@ -0,0 +1,229 @@
+"""Board geometries: size, center square and premium squares.
+
+A ``Layout`` is built once and shared, read-only, by every board that uses
+it. Layouts are registered by name; ``standard`` is the 15x15 board of the
+official rules. Other geometries, such as 21x21 boards or club variants, can
+be described as rows of text and registered with ``register_layout``.
+"""
+
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+# Premium square types
+TRIPLE_WORD = "TW"
+DOUBLE_WORD = "DW"
+TRIPLE_LETTER = "TL"
+DOUBLE_LETTER = "DL"
+QUADRUPLE_WORD = "QW"
+QUADRUPLE_LETTER = "QL"
+CENTER = "CENTER"
+
+# (letter multiplier, word multiplier) of each premium square type
+PREMIUM_MULTIPLIERS: Mapping[str, Tuple[int, int]] = MappingProxyType(
+    {
+        DOUBLE_LETTER: (2, 1),
+        TRIPLE_LETTER: (3, 1),
+        QUADRUPLE_LETTER: (4, 1),
+        DOUBLE_WORD: (1, 2),
+        CENTER: (1, 2),
+        TRIPLE_WORD: (1, 3),
+        QUADRUPLE_WORD: (1, 4),
+    }
+)
+
+# Characters of ``Layout.from_rows``
+ROW_SYMBOLS = {
+    ".": None,
+    "d": DOUBLE_LETTER,
+    "t": TRIPLE_LETTER,
+    "q": QUADRUPLE_LETTER,
+    "D": DOUBLE_WORD,
+    "T": TRIPLE_WORD,
+    "Q": QUADRUPLE_WORD,
+    "*": CENTER,
+}
+
+STANDARD_ROWS = (
+    "T..d...T...d..T",
+    ".D...t...t...D.",
+    "..D...d.d...D..",
+    "d..D...d...D..d",
+    "....D.....D....",
+    ".t...t...t...t.",
+    "..d...d.d...d..",
+    "T..d...*...d..T",
+    "..d...d.d...d..",
+    ".t...t...t...t.",
+    "....D.....D....",
+    "d..D...d...D..d",
+    "..D...d.d...D..",
+    ".D...t...t...D.",
+    "T..d...T...d..T",
+)
+
+
+class Layout:
+    """Geometry of a board, with its premium squares as flat arrays.
+
+    The arrays are ``bytes`` indexed like the board's square arrays: row-major
+    by ``row * size + col``, and transposed by ``col * size + row``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        premium_squares: Mapping[Tuple[int, int], str],
+        center: Optional[Tuple[int, int]] = None,
+    ):
+        """Build a layout.
+
+        Args:
+            name: Name to register the layout under
+            size: Number of rows and columns
+            premium_squares: Premium square type of each (row, col)
+            center: Square the first word must cover. Defaults to the middle
+                square of the board.
+
+        Raises:
+            ValueError: If the size, a square or a premium type is invalid
+        """
+        if not 2 <= size <= 255:
+            raise ValueError(f"Board size must be between 2 and 255, not {size}")
+        if center is None:
+            center = (size // 2, size // 2)
+        for row, col in [center, *premium_squares]:
+            if not (0 <= row < size and 0 <= col < size):
+                raise ValueError(f"Square ({row}, {col}) is off a {size}x{size} board")
+        unknown = set(premium_squares.values()) - set(PREMIUM_MULTIPLIERS)
+        if unknown:
+            raise ValueError(f"Unknown premium square types: {sorted(unknown)}")
+
+        self.name = name
+        self.size = size
+        self.center = center
+        self.center_index = center[0] * size + center[1]
+        self.premium_squares: Mapping[Tuple[int, int], str] = MappingProxyType(
+            dict(premium_squares)
+        )
+        letter_mult = bytearray([1]) * (size * size)
+        word_mult = bytearray([1]) * (size * size)
+        self.premium_mask = 0
+        for (row, col), premium in premium_squares.items():
+            index = row * size + col
+            letter_mult[index], word_mult[index] = PREMIUM_MULTIPLIERS[premium]
+            self.premium_mask |= 1 << index
+        self.letter_multipliers = bytes(letter_mult)
+        self.word_multipliers = bytes(word_mult)
+        self.transposed_letter_multipliers = self.transpose(letter_mult)
+        self.transposed_word_multipliers = self.transpose(word_mult)
+        # Bitboard masks used to shift occupancy without wrapping around
+        self.full_mask = (1 << (size * size)) - 1
+        first_col = sum(1 << (row * size) for row in range(size))
+        self.not_first_col = self.full_mask & ~first_col
+        self.not_last_col = self.full_mask & ~(first_col << (size - 1))
+        # (row, col) of each square of each row ('H') and column ('V'); the
+        # lists are shared and must not be modified
+        self.line_squares: Dict[str, List[List[Tuple[int, int]]]] = {
+            "H": [[(r, c) for c in range(size)] for r in range(size)],
+            "V": [[(r, c) for r in range(size)] for c in range(size)],
+        }
+
+    @classmethod
+    def from_rows(
+        cls, name: str, rows: Sequence[str], center: Optional[Tuple[int, int]] = None
+    ) -> "Layout":
+        """Build a square layout from one string per row.
+
+        Each character is a square: '.' plain, 'd'/'t'/'q' double, triple or
+        quadruple letter, 'D'/'T'/'Q' double, triple or quadruple word, and
+        '*' the center (a double word square the first word must cover).
+
+        Args:
+            name: Name of the layout
+            rows: The rows, all as long as there are rows
+            center: Square the first word must cover. Defaults to the '*'
+                square, or the middle of the board if there is none.
+
+        Returns:
+            The layout
+
+        Raises:
+            ValueError: If the rows are not square or use unknown characters
+        """
+        size = len(rows)
+        premium_squares: Dict[Tuple[int, int], str] = {}
+        for row, line in enumerate(rows):
+            if len(line) != size:
+                raise ValueError(f"Row {row} has {len(line)} squares, expected {size}")
+            for col, symbol in enumerate(line):
+                if symbol not in ROW_SYMBOLS:
+                    raise ValueError(f"Unknown square {symbol!r} at ({row}, {col})")
+                premium = ROW_SYMBOLS[symbol]
+                if premium is not None:
+                    premium_squares[(row, col)] = premium
+                if premium == CENTER and center is None:
+                    center = (row, col)
+        return cls(name, size, premium_squares, center)
+
+    def transpose(self, array: Sequence[int]) -> bytes:
+        """Get a row-major square array in column-major order.
+
+        Args:
+            array: Array indexed by ``row * size + col``
+
+        Returns:
+            Array indexed by ``col * size + row``
+        """
+        size = self.size
+        return bytes(
+            array[row * size + col] for col in range(size) for row in range(size)
+        )
+
+    def __copy__(self) -> "Layout":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, object]) -> "Layout":
+        # Layouts are read-only and shared by every board using them
+        return self
+
+    def __repr__(self) -> str:
+        return f"Layout({self.name!r}, {self.size}x{self.size})"
+
+
+_layouts: Dict[str, Layout] = {}
+
+
+def register_layout(layout: Layout) -> Layout:
+    """Make a layout available by name to ``get_layout`` and ``Board``.
+
+    Args:
+        layout: Layout to register; replaces any layout of the same name
+
+    Returns:
+        The layout
+    """
+    _layouts[layout.name] = layout
+    return layout
+
+
+def get_layout(name: str = "standard") -> Layout:
+    """Get a registered layout.
+
+    Args:
+        name: Name of the layout
+
+    Returns:
+        The shared layout
+
+    Raises:
+        ValueError: If no layout has that name
+    """
+    if name not in _layouts:
+        raise ValueError(
+            f"Unknown board layout: {name}. Choose from {sorted(_layouts)}"
+        )
+    return _layouts[name]
+
+
+register_layout(Layout.from_rows("standard", STANDARD_ROWS))
@@ -0,0 +1,1062 @@
+"""Lexicon backends used by the word validator.
+
+A lexicon answers two questions: is a string a word, and is it the prefix of
+any word. ``SetLexicon`` keeps the words in a plain Python set, while
+``DawgLexicon`` stores them in a minimized directed acyclic word graph (DAWG)
+flattened into a handful of compact arrays, so shared suffixes such as
+``-EN`` or ``-HEID`` are stored once for the whole word list.
+
+A DAWG can also be compiled into a binary file with ``compile_lexicon`` and
+loaded with ``load_compiled_lexicon``. The loader memory-maps the file and
+walks the graph directly on the mapped bytes, so loading is near-instant and
+every process using the same file shares one copy in the OS page cache.
+Compiled files also hold the hook table of the words (see ``HookTable``).
+Compile a word list from the command line with::
+
+    python -m scrabble.compiler words.txt words.lex
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from scrabble.wordlist import DictionaryFiles, read_word_lists
+
+LEXICON_MAGIC = b"SCRBLDWG"
+LEXICON_FORMAT_VERSION = 2
+
+# magic, version, word_count, node_count, edge_count, root, alphabet size in bytes
+_HEADER = struct.Struct("<8sIIIIII")
+# node_count, edge_count, root of the graph of reversed words (version 2 on)
+_REVERSED_HEADER = struct.Struct("<III")
+
+T = TypeVar("T")
+
+IntArray = Union[array, memoryview]
+ByteArray = Union[bytearray, memoryview]
+
+
+class _DeadlinePassed(Exception):
+    """Raised inside a pattern search when its deadline has passed."""
+
+
+def _until(items: Iterable[T], deadline: Optional[float]) -> Iterable[T]:
+    """Pass items through, raising ``_DeadlinePassed`` once the deadline passes.
+
+    Args:
+        items: Items to pass through
+        deadline: ``time.perf_counter()`` value to stop at, or None for no
+            limit, in which case ``items`` is returned as is
+
+    Returns:
+        Iterable over the items
+    """
+    if deadline is None:
+        return items
+
+    def checked() -> Iterator[T]:
+        clock = time.perf_counter
+        for i, item in enumerate(items):
+            if not i & 1023 and clock() > deadline:
+                raise _DeadlinePassed
+            yield item
+
+    return checked()
+
+
+class Lexicon(ABC):
+    """Read-only collection of uppercase words.
+
+    Words passed to the query methods are expected to be normalised to
+    uppercase already; ``WordValidator`` takes care of that.
+    """
+
+    @abstractmethod
+    def __contains__(self, word: object) -> bool: ...
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[str]: ...
+
+    @abstractmethod
+    def has_prefix(self, prefix: str) -> bool:
+        """Check whether any word in the lexicon starts with ``prefix``.
+
+        Args:
+            prefix: Uppercase prefix to look up
+
+        Returns:
+            True if at least one word starts with the prefix
+        """
+
+    def match(self, pattern: str, deadline: Optional[float] = None) -> Iterator[str]:
+        """Stream the words matching a wildcard pattern, in sorted order.
+
+        ``?`` stands for any one letter and ``*`` for any run of letters,
+        possibly empty; other characters match themselves. ``?K???`` finds
+        the five-letter words with K second, ``B??T*`` the words starting
+        with B and having T fourth.
+
+        The base implementation builds a DAWG of the words on first use
+        (see ``cached_index``) and searches that. The build counts against
+        the deadline: if it passes first, nothing is found and nothing is
+        cached, and a later query with more time builds the DAWG again.
+
+        Args:
+            pattern: Uppercase pattern
+            deadline: ``time.perf_counter()`` value at which to stop
+                searching, or None to search the whole lexicon
+
+        Returns:
+            Iterator over the matching words
+        """
+        try:
+            dawg = self.cached_index(
+                "dawg", lambda: DawgLexicon.from_words(self, deadline=deadline)
+            )
+        except _DeadlinePassed:
+            return iter(())
+        return dawg.match(pattern, deadline)
+
+    def hook_table(self) -> "HookTable":
+        """Get the front and back hooks of the words, building them on first use.
+
+        Returns:
+            Hook table shared by every user of this lexicon
+        """
+        return self.cached_index("hooks", lambda: HookTable.from_words(self))
+
+    @abstractmethod
+    def memory_usage(self) -> int:
+        """Estimate the number of bytes held by this lexicon.
+
+        Returns:
+            Approximate size in bytes
+        """
+
+    def close(self) -> None:
+        """Release resources held by the lexicon, such as file mappings."""
+
+    def cached_index(self, name: str, build: Callable[[], T]) -> T:
+        """Get a derived index, building it on first use.
+
+        Indexes such as the GADDAG are expensive to build but depend only on
+        the words, so they are built once per lexicon and shared by every
+        validator and game using it.
+
+        Args:
+            name: Name of the index
+            build: Function building the index
+
+        Returns:
+            The cached index
+        """
+        cache = self.__dict__.setdefault("_indexes", {})
+        if name not in cache:
+            cache[name] = build()
+        return cache[name]
+
+
+class SetLexicon(Lexicon):
+    """Lexicon backed by a Python set of strings."""
+
+    def __init__(self, words: Iterable[str] = ()):
+        """Initialize the lexicon.
+
+        Args:
+            words: Uppercase words to include
+        """
+        self.words: Set[str] = set(words)
+        self._sorted: Optional[List[str]] = None
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.words
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words)
+
+    def has_prefix(self, prefix: str) -> bool:
+        if self._sorted is None or len(self._sorted) != len(self.words):
+            self._sorted = sorted(self.words)
+        index = bisect_left(self._sorted, prefix)
+        return index < len(self._sorted) and self._sorted[index].startswith(prefix)
+
+    def memory_usage(self) -> int:
+        return sys.getsizeof(self.words) + sum(sys.getsizeof(w) for w in self.words)
+
+
+class _BuildNode:
+    """Mutable graph node used while building a DAWG."""
+
+    __slots__ = ("edges", "final", "index")
+
+    def __init__(self) -> None:
+        self.edges: Dict[int, "_BuildNode"] = {}
+        self.final = False
+        self.index = -1
+
+    def signature(self) -> Tuple[bool, Tuple[Tuple[int, int], ...]]:
+        return (
+            self.final,
+            tuple(sorted((code, child.index) for code, child in self.edges.items())),
+        )
+
+
+def build_graph(
+    sequences: Iterable[bytes], deadline: Optional[float] = None
+) -> Tuple[array, bytearray, array, bytearray, int]:
+    """Build a minimized acyclic graph from sorted, unique code sequences.
+
+    Uses the incremental construction of Daciuk et al.: once the input moves
+    past a node it can never change again, so it is merged with an equivalent
+    node that is already registered or registered itself.
+
+    Args:
+        sequences: Byte strings in strictly increasing order
+        deadline: ``time.perf_counter()`` value at which to give up, or None
+
+    Returns:
+        Tuple of (first_edge, labels, targets, finals, root) where the edges
+        of node ``n`` are ``first_edge[n]:first_edge[n + 1]``, sorted by label
+
+    Raises:
+        _DeadlinePassed: If the deadline passes during the build
+    """
+    register: Dict[Tuple[bool, Tuple[Tuple[int, int], ...]], _BuildNode] = {}
+    nodes: List[_BuildNode] = []
+    root = _BuildNode()
+    unchecked: List[Tuple[_BuildNode, int, _BuildNode]] = []
+    previous = b""
+
+    def minimize(down_to: int) -> None:
+        while len(unchecked) > down_to:
+            parent, code, child = unchecked.pop()
+            signature = child.signature()
+            existing = register.get(signature)
+            if existing is not None:
+                parent.edges[code] = existing
+            else:
+                child.index = len(nodes)
+                nodes.append(child)
+                register[signature] = child
+
+    for sequence in _until(sequences, deadline):
+        if sequence <= previous and previous:
+            raise ValueError("Sequences must be sorted and unique")
+        common = 0
+        limit = min(len(sequence), len(previous))
+        while common < limit and sequence[common] == previous[common]:
+            common += 1
+        minimize(common)
+        node = unchecked[-1][2] if unchecked else root
+        for code in sequence[common:]:
+            child = _BuildNode()
+            node.edges[code] = child
+            unchecked.append((node, code, child))
+            node = child
+        node.final = True
+        previous = sequence
+    minimize(0)
+    root.index = len(nodes)
+    nodes.append(root)
+
+    first_edge = array("I", [0])
+    labels = bytearray()
+    targets = array("I")
+    finals = bytearray(len(nodes))
+    for node in _until(nodes, deadline):
+        for code in sorted(node.edges):
+            labels.append(code)
+            targets.append(node.edges[code].index)
+        first_edge.append(len(labels))
+        finals[node.index] = node.final
+    return first_edge, labels, targets, finals, root.index
+
+
+def read_words(file_path: DictionaryFiles) -> Set[str]:
+    """Read a word list with one word per line.
+
+    Words are stripped and uppercased; words shorter than two letters are
+    skipped since they can never be played. Compressed lists and several
+    lists at once are read as described in ``scrabble.wordlist``.
+
+    Args:
+        file_path: Path or paths of the word lists
+
+    Returns:
+        Set of normalised words
+    """
+    return read_word_lists(file_path)
+
+
+class DawgLexicon(Lexicon):
+    """Lexicon stored as a minimized directed acyclic word graph.
+
+    Letters are mapped to small integer codes through ``alphabet`` so edge
+    labels fit in a single byte. Lookups walk the graph one letter at a
+    time and never materialise the word list.
+    """
+
+    def __init__(
+        self,
+        alphabet: str,
+        first_edge: IntArray,
+        labels: ByteArray,
+        targets: IntArray,
+        finals: ByteArray,
+        root: int,
+        word_count: int,
+    ):
+        """Initialize the lexicon from an already built graph.
+
+        Use ``DawgLexicon.from_words`` to build one from a word list.
+
+        Args:
+            alphabet: Letters in code order
+            first_edge: Offset of the first edge of every node
+            labels: Letter code of every edge
+            targets: Destination node of every edge
+            finals: Non-zero for nodes that end a word
+            root: Index of the root node
+            word_count: Number of words in the graph
+        """
+        self.alphabet = alphabet
+        self.first_edge = first_edge
+        self.labels = labels
+        self.targets = targets
+        self.finals = finals
+        self.root = root
+        self.word_count = word_count
+        self._code_bytes = {
+            letter: bytes((code,)) for code, letter in enumerate(alphabet)
+        }
+
+    @classmethod
+    def from_words(
+        cls,
+        words: Iterable[str],
+        alphabet: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> "DawgLexicon":
+        """Build a minimized DAWG from uppercase words.
+
+        Args:
+            words: Words to include; duplicates are ignored
+            alphabet: Letters in code order. Defaults to the words' letters
+                in sorted order.
+            deadline: ``time.perf_counter()`` value at which to give up, or
+                None
+
+        Returns:
+            New DawgLexicon
+
+        Raises:
+            _DeadlinePassed: If the deadline passes during the build
+        """
+        unique = set(words)
+        if alphabet is None:
+            alphabet = "".join(sorted({letter for word in unique for letter in word}))
+        if len(alphabet) > 255:
+            raise ValueError("Lexicon alphabet is limited to 255 letters")
+        codes = {letter: code for code, letter in enumerate(alphabet)}
+        encoded = sorted(
+            bytes(codes[letter] for letter in word) for word in _until(unique, deadline)
+        )
+        first_edge, labels, targets, finals, root = build_graph(encoded, deadline)
+        return cls(alphabet, first_edge, labels, targets, finals, root, len(unique))
+
+    def _walk(self, word: str, node: Optional[int] = None) -> int:
+        """Follow ``word`` from the root, or from another node.
+
+        Args:
+            word: Uppercase string to follow
+            node: Node to start from instead of the root
+
+        Returns:
+            Node reached, or -1 if the path does not exist
+        """
+        first_edge = self.first_edge
+        # Built graphs keep their labels in a bytearray; the mapped
+        # subclass, whose labels are a memoryview, overrides this method
+        labels = cast(bytearray, self.labels)
+        targets = self.targets
+        code_bytes = self._code_bytes
+        if node is None:
+            node = self.root
+        for letter in word:
+            code = code_bytes.get(letter)
+            if code is None:
+                return -1
+            index = labels.find(code, first_edge[node], first_edge[node + 1])
+            if index < 0:
+                return -1
+            node = targets[index]
+        return node
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        node = self._walk(word)
+        return node >= 0 and bool(self.finals[node])
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def __iter__(self) -> Iterator[str]:
+        alphabet = self.alphabet
+        stack = [(self.root, "")]
+        while stack:
+            node, prefix = stack.pop()
+            if self.finals[node]:
+                yield prefix
+            start, end = self.first_edge[node], self.first_edge[node + 1]
+            for index in range(end - 1, start - 1, -1):
+                stack.append(
+                    (self.targets[index], prefix + alphabet[self.labels[index]])
+                )
+
+    def has_prefix(self, prefix: str) -> bool:
+        return self._walk(prefix) >= 0
+
+    def match(self, pattern: str, deadline: Optional[float] = None) -> Iterator[str]:
+        # The pattern runs as a bit-parallel automaton: bit i of a state is
+        # set while pattern position i can still be reached by the prefix
+        # walked so far, so every word is visited once, however many stars.
+        # Nodes are shared between words, so whether any match lies below a
+        # (node, state) pair is remembered and dead branches are never
+        # entered twice; the walk itself only follows branches with matches.
+        alphabet = self.alphabet
+        star_mask = 0
+        letter_masks = [0] * len(alphabet)
+        for position, symbol in enumerate(pattern):
+            if symbol == "*":
+                star_mask |= 1 << position
+            for code, letter in enumerate(alphabet):
+                if symbol == "?" or symbol == letter:
+                    letter_masks[code] |= 1 << position
+        accept = 1 << len(pattern)
+        shift = len(pattern) + 1
+        first_edge, labels, targets, finals = (
+            self.first_edge,
+            self.labels,
+            self.targets,
+            self.finals,
+        )
+        steps: Dict[int, int] = {}
+        live: Dict[int, bool] = {}
+
+        def step(state: int, code: int) -> int:
+            key = state << 8 | code
+            stepped = steps.get(key)
+            if stepped is None:
+                stepped = (state & letter_masks[code]) << 1 | state & star_mask
+                # A star may match nothing, so reaching it reaches what follows
+                while stepped | (stepped & star_mask) << 1 != stepped:
+                    stepped |= (stepped & star_mask) << 1
+                steps[key] = stepped
+            return stepped
+
+        def is_live(node: int, state: int) -> bool:
+            key = node << shift | state
+            known = live.get(key)
+            if known is None:
+                if deadline is not None and time.perf_counter() > deadline:
+                    raise _DeadlinePassed
+                known = bool(finals[node] and state & accept)
+                if not known:
+                    for index in range(first_edge[node], first_edge[node + 1]):
+                        code = labels[index]
+                        stepped = steps.get(state << 8 | code)
+                        if stepped is None:
+                            stepped = step(state, code)
+                        if stepped:
+                            target = targets[index]
+                            alive = live.get(target << shift | stepped)
+                            if alive is None:
+                                alive = is_live(target, stepped)
+                            if alive:
+                                known = True
+                                break
+                live[key] = known
+            return known
+
+        start = 1
+        while start | (start & star_mask) << 1 != start:
+            start |= (start & star_mask) << 1
+        stack = [(self.root, "", start)]
+        visited = 0
+        try:
+            while stack:
+                node, prefix, state = stack.pop()
+                visited += 1
+                if deadline is not None and not visited & 255:
+                    if time.perf_counter() > deadline:
+                        return
+                if finals[node] and state & accept:
+                    yield prefix
+                for index in range(first_edge[node + 1] - 1, first_edge[node] - 1, -1):
+                    code = labels[index]
+                    stepped = steps.get(state << 8 | code)
+                    if stepped is None:
+                        stepped = step(state, code)
+                    if not stepped:
+                        continue
+                    target = targets[index]
+                    alive = live.get(target << shift | stepped)
+                    if alive is None:
+                        alive = is_live(target, stepped)
+                    if alive:
+                        stack.append((target, prefix + alphabet[code], stepped))
+        except _DeadlinePassed:
+            return
+
+    def hook_table(self) -> "HookTable":
+        return self.cached_index("hooks", lambda: HookTable.from_graph(self))
+
+    def hook_masks(self) -> ByteArray:
+        """Get the letters that complete a word in one step from each node.
+
+        Returns:
+            ``hook_mask_width(alphabet)`` bytes per node: a little-endian
+            mask with bit ``code`` set when the edge with that label leads
+            to a final node
+        """
+        first_edge, labels, targets, finals = (
+            self.first_edge,
+            self.labels,
+            self.targets,
+            self.finals,
+        )
+        width = hook_mask_width(self.alphabet)
+        masks = bytearray()
+        for node in range(len(finals)):
+            mask = 0
+            for index in range(first_edge[node], first_edge[node + 1]):
+                if finals[targets[index]]:
+                    mask |= 1 << labels[index]
+            masks += mask.to_bytes(width, "little")
+        return masks
+
+    def node_count(self) -> int:
+        """Get the number of nodes in the graph.
+
+        Returns:
+            Number of nodes
+        """
+        return len(self.finals)
+
+    def memory_usage(self) -> int:
+        return (
+            sys.getsizeof(self.first_edge)
+            + sys.getsizeof(self.labels)
+            + sys.getsizeof(self.targets)
+            + sys.getsizeof(self.finals)
+        )
+
+    def save(self, file_path: str) -> None:
+        """Write the graph in the compiled lexicon format.
+
+        The file starts with a fixed header followed by the alphabet and the
+        graph arrays. Integer arrays are stored as little-endian uint32 and
+        aligned to four bytes so they can be mapped in place. The hook table
+        follows: the graph of the reversed words, then the hook masks of
+        both graphs.
+
+        The file is written under a temporary name and renamed over the
+        destination, so lexicons that have the old file mapped keep reading
+        the old contents.
+
+        Args:
+            file_path: Destination path
+        """
+        alphabet = self.alphabet.encode("utf-8")
+        alphabet += b"\0" * (-len(alphabet) % 4)
+        hooks = self.hook_table()
+        backward = hooks.backward
+        graph = _graph_bytes(self)
+        f = tempfile.NamedTemporaryFile(
+            "wb",
+            dir=os.path.dirname(os.path.abspath(file_path)),
+            prefix=".lexicon-",
+            suffix=".tmp",
+            delete=False,
+        )
+        try:
+            f.write(
+                _HEADER.pack(
+                    LEXICON_MAGIC,
+                    LEXICON_FORMAT_VERSION,
+                    self.word_count,
+                    len(self.finals),
+                    len(self.labels),
+                    self.root,
+                    len(alphabet),
+                )
+            )
+            f.write(alphabet)
+            f.write(graph)
+            f.write(b"\0" * (-len(graph) % 4))
+            f.write(
+                _REVERSED_HEADER.pack(
+                    len(backward.finals), len(backward.labels), backward.root
+                )
+            )
+            f.write(_graph_bytes(backward))
+            f.write(bytes(hooks.forward_masks))
+            f.write(bytes(hooks.backward_masks))
+            f.close()
+            # Temporary files are private to the owner; compiled files are not
+            os.chmod(f.name, 0o644)
+            os.replace(f.name, file_path)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+
+
+class MappedDawgLexicon(DawgLexicon):
+    """DAWG lexicon whose arrays live in a memory-mapped compiled file.
+
+    The graph arrays are ``memoryview`` slices of the mapping, so no Python
+    object is created per word or per node. Use ``load_compiled_lexicon`` to
+    open one.
+    """
+
+    def __init__(self, file_path: str, reverse: bool = False):
+        """Map a compiled lexicon file.
+
+        Args:
+            file_path: Path to a file written by ``compile_lexicon``
+            reverse: Map the file's graph of reversed words instead, which
+                the hook table uses to find front hooks
+
+        Raises:
+            ValueError: If the file is not a compiled lexicon of a supported
+                version, is truncated, or lacks the requested graph
+        """
+        with open(file_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            header = _read_header(self._mmap[: _HEADER.size])
+            if reverse and header[1] < 2:
+                raise ValueError("Compiled lexicon has no reversed graph")
+            alphabet_size = header[6]
+            raw_alphabet = self._mmap[_HEADER.size : _HEADER.size + alphabet_size]
+            alphabet = raw_alphabet.rstrip(b"\0").decode("utf-8")
+            if len(self._mmap) < _file_size(self._mmap, header, alphabet):
+                raise ValueError("Compiled lexicon file is truncated")
+        except ValueError:
+            self._mmap.close()
+            raise
+        _, version, word_count, node_count, edge_count, root, _ = header
+        self.file_path = file_path
+        view = memoryview(self._mmap)
+        offset = _HEADER.size + alphabet_size
+        self._views = [view]
+        self._hook_masks: Optional[memoryview] = None
+        if version >= 2:
+            # Skip ahead to the reversed graph and the hook masks
+            width = hook_mask_width(alphabet)
+            masks = offset + _graph_size(node_count, edge_count)
+            masks += -masks % 4
+            reversed_graph = _REVERSED_HEADER.unpack_from(self._mmap, masks)
+            masks += _REVERSED_HEADER.size
+            reversed_offset = masks
+            masks += _graph_size(reversed_graph[0], reversed_graph[1])
+            if reverse:
+                masks += node_count * width
+                offset = reversed_offset
+                node_count, edge_count, root = reversed_graph
+            self._hook_masks = view[masks : masks + node_count * width]
+            self._views.append(self._hook_masks)
+        first_edge = view[offset : offset + 4 * (node_count + 1)].cast("I")
+        offset += 4 * (node_count + 1)
+        targets = view[offset : offset + 4 * edge_count].cast("I")
+        offset += 4 * edge_count
+        self._label_base = offset
+        labels = view[offset : offset + edge_count]
+        offset += edge_count
+        finals = view[offset : offset + node_count]
+        self._views += [first_edge, targets, labels, finals]
+        super().__init__(
+            alphabet, first_edge, labels, targets, finals, root, word_count
+        )
+        self._reversed: Optional[MappedDawgLexicon] = None
+        if version >= 2 and not reverse:
+            self._reversed = MappedDawgLexicon(file_path, reverse=True)
+            hooks = HookTable(self, self._reversed)
+            self.cached_index("hooks", lambda: hooks)
+
+    def hook_masks(self) -> ByteArray:
+        if self._hook_masks is not None:
+            return self._hook_masks
+        return super().hook_masks()
+
+    def _walk(self, word: str, node: Optional[int] = None) -> int:
+        # memoryview has no find(); search the mapping itself instead.
+        first_edge = self.first_edge
+        targets = self.targets
+        code_bytes = self._code_bytes
+        find = self._mmap.find
+        base = self._label_base
+        if node is None:
+            node = self.root
+        for letter in word:
+            code = code_bytes.get(letter)
+            if code is None:
+                return -1
+            index = find(code, base + first_edge[node], base + first_edge[node + 1])
+            if index < 0:
+                return -1
+            node = targets[index - base]
+        return node
+
+    def memory_usage(self) -> int:
+        # The mapping is backed by the page cache and shared between processes.
+        return len(self._mmap)
+
+    def close(self) -> None:
+        if self._reversed is not None:
+            self._reversed.close()
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+
+class HookTable:
+    """Front and back hooks of every string, looked up in two word graphs.
+
+    A back hook of a word is a letter that can follow it to make another
+    word (KAT -> KATS); a front hook can precede it (EN -> BEN). The back
+    hooks of a string depend only on the node it reaches in the DAWG, so they
+    are stored once per node as a letter mask. Front hooks are the back hooks
+    of the reversed string in a second DAWG of the reversed words. Masks have
+    bit ``code`` set for the letter at that position of ``alphabet``.
+    """
+
+    def __init__(self, forward: DawgLexicon, backward: DawgLexicon):
+        """Initialize the table from the two graphs.
+
+        Use ``HookTable.from_words`` or ``Lexicon.hook_table`` to build one.
+
+        Args:
+            forward: Graph of the words
+            backward: Graph of the reversed words, with the same alphabet
+        """
+        if forward.alphabet != backward.alphabet:
+            raise ValueError("Both graphs must use the same alphabet")
+        self.alphabet = forward.alphabet
+        self.codes = {letter: code for code, letter in enumerate(self.alphabet)}
+        self.forward = forward
+        self.backward = backward
+        self.forward_masks = forward.hook_masks()
+        self.backward_masks = backward.hook_masks()
+        self._width = hook_mask_width(self.alphabet)
+        self._letter_sets: Dict[int, FrozenSet[str]] = {}
+
+    @classmethod
+    def from_graph(cls, forward: DawgLexicon) -> "HookTable":
+        """Build the table for a DAWG lexicon.
+
+        Args:
+            forward: Graph of the words
+
+        Returns:
+            New HookTable sharing ``forward``
+        """
+        backward = DawgLexicon.from_words(
+            (word[::-1] for word in forward), forward.alphabet
+        )
+        return cls(forward, backward)
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "HookTable":
+        """Build the table for a word list.
+
+        Args:
+            words: Uppercase words
+
+        Returns:
+            New HookTable
+        """
+        return cls.from_graph(DawgLexicon.from_words(words))
+
+    def _mask(self, masks: ByteArray, node: int) -> int:
+        start = node * self._width
+        return int.from_bytes(masks[start : start + self._width], "little")
+
+    def back_hooks(self, prefix: str) -> int:
+        """Get the letters that make a word when appended to ``prefix``.
+
+        Args:
+            prefix: Uppercase string, not necessarily a word
+
+        Returns:
+            Letter mask
+        """
+        node = self.forward._walk(prefix)
+        return self._mask(self.forward_masks, node) if node >= 0 else 0
+
+    def front_hooks(self, suffix: str) -> int:
+        """Get the letters that make a word when put before ``suffix``.
+
+        Args:
+            suffix: Uppercase string, not necessarily a word
+
+        Returns:
+            Letter mask
+        """
+        node = self.backward._walk(suffix[::-1])
+        return self._mask(self.backward_masks, node) if node >= 0 else 0
+
+    def hooks(self, prefix: str, suffix: str) -> int:
+        """Get the letters that make a word between ``prefix`` and ``suffix``.
+
+        This is the cross-check of an empty square with ``prefix`` on one
+        side and ``suffix`` on the other. With both sides non-empty, each
+        letter that can follow the prefix is tried against the suffix.
+
+        Args:
+            prefix: Uppercase string before the letter
+            suffix: Uppercase string after the letter
+
+        Returns:
+            Letter mask
+        """
+        if not suffix:
+            return self.back_hooks(prefix)
+        if not prefix:
+            return self.front_hooks(suffix)
+        forward = self.forward
+        node = forward._walk(prefix)
+        if node < 0:
+            return 0
+        labels, targets, finals = forward.labels, forward.targets, forward.finals
+        mask = 0
+        for index in range(forward.first_edge[node], forward.first_edge[node + 1]):
+            end = forward._walk(suffix, targets[index])
+            if end >= 0 and finals[end]:
+                mask |= 1 << labels[index]
+        return mask
+
+    def letters(self, mask: int) -> FrozenSet[str]:
+        """Get the letters of a mask.
+
+        Args:
+            mask: Letter mask
+
+        Returns:
+            The letters, as a set shared by every caller asking for this mask
+        """
+        letters = self._letter_sets.get(mask)
+        if letters is None:
+            letters = frozenset(
+                letter for code, letter in enumerate(self.alphabet) if mask >> code & 1
+            )
+            self._letter_sets[mask] = letters
+        return letters
+
+    def mask(self, letters: Iterable[str]) -> int:
+        """Get the mask of some letters.
+
+        Args:
+            letters: Letters; ones outside the alphabet are ignored
+
+        Returns:
+            Letter mask
+        """
+        codes = self.codes
+        mask = 0
+        for letter in letters:
+            if letter in codes:
+                mask |= 1 << codes[letter]
+        return mask
+
+
+def _graph_bytes(graph: DawgLexicon) -> bytes:
+    """Serialize the arrays of a graph for a compiled lexicon file."""
+    first_edge = array("I", graph.first_edge)
+    targets = array("I", graph.targets)
+    if sys.byteorder != "little":
+        first_edge.byteswap()
+        targets.byteswap()
+    return (
+        first_edge.tobytes()
+        + targets.tobytes()
+        + bytes(graph.labels)
+        + bytes(graph.finals)
+    )
+
+
+def _graph_size(node_count: int, edge_count: int) -> int:
+    """Get the number of bytes ``_graph_bytes`` writes for a graph."""
+    return 4 * (node_count + 1) + 4 * edge_count + edge_count + node_count
+
+
+def _file_size(data: mmap.mmap, header: Tuple, alphabet: str) -> int:
+    """Get the number of bytes a compiled lexicon file needs.
+
+    Args:
+        data: Mapped file
+        header: Fields from ``_read_header``
+        alphabet: Decoded alphabet of the file
+
+    Returns:
+        Minimum file size; when the file ends before the reversed graph's
+        header, the size up to the end of that header
+    """
+    _, version, _, node_count, edge_count, _, alphabet_size = header
+    size = _HEADER.size + alphabet_size + _graph_size(node_count, edge_count)
+    if version < 2:
+        return size
+    size += -size % 4
+    if len(data) < size + _REVERSED_HEADER.size:
+        return size + _REVERSED_HEADER.size
+    reversed_nodes, reversed_edges, _ = _REVERSED_HEADER.unpack_from(data, size)
+    size += _REVERSED_HEADER.size + _graph_size(reversed_nodes, reversed_edges)
+    return size + (node_count + reversed_nodes) * hook_mask_width(alphabet)
+
+
+def hook_mask_width(alphabet: str) -> int:
+    """Get the number of bytes of one hook mask over an alphabet."""
+    return (len(alphabet) + 7) // 8
+
+
+def _read_header(data: bytes) -> Tuple[bytes, int, int, int, int, int, int]:
+    """Parse and check a compiled lexicon header.
+
+    Args:
+        data: The first ``_HEADER.size`` bytes of the file
+
+    Returns:
+        The unpacked header fields
+
+    Raises:
+        ValueError: If the data is not a supported compiled lexicon header
+    """
+    if len(data) < _HEADER.size or not data.startswith(LEXICON_MAGIC):
+        raise ValueError("Not a compiled lexicon file")
+    header = _HEADER.unpack(data)
+    if not 1 <= header[1] <= LEXICON_FORMAT_VERSION:
+        raise ValueError(f"Unsupported compiled lexicon version: {header[1]}")
+    return header
+
+
+def is_compiled_lexicon(file_path: str) -> bool:
+    """Check whether a file is a compiled lexicon.
+
+    Args:
+        file_path: Path to check
+
+    Returns:
+        True if the file starts with the compiled lexicon magic bytes
+    """
+    with open(file_path, "rb") as f:
+        return f.read(len(LEXICON_MAGIC)) == LEXICON_MAGIC
+
+
+def compile_lexicon(words: Iterable[str], file_path: str) -> DawgLexicon:
+    """Build a DAWG from a word list and write it as a compiled lexicon.
+
+    Args:
+        words: Uppercase words to include
+        file_path: Destination path
+
+    Returns:
+        The in-memory lexicon that was written
+    """
+    lexicon = DawgLexicon.from_words(words)
+    lexicon.save(file_path)
+    return lexicon
+
+
+def load_compiled_lexicon(file_path: str) -> DawgLexicon:
+    """Open a compiled lexicon file.
+
+    On little-endian machines the file is memory-mapped and searched in
+    place, hook table included. Elsewhere the arrays are read into memory and
+    byte-swapped, and the hook table is rebuilt when first needed.
+
+    Args:
+        file_path: Path to a file written by ``compile_lexicon``
+
+    Returns:
+        Lexicon backed by the file
+
+    Raises:
+        ValueError: If the file is not a compiled lexicon of this version
+    """
+    if sys.byteorder == "little":
+        return MappedDawgLexicon(file_path)
+
+    with open(file_path, "rb") as f:
+        data = f.read()
+    header = _read_header(data[: _HEADER.size])
+    _, _, word_count, node_count, edge_count, root, alphabet_size = header
+    offset = _HEADER.size
+    alphabet = data[offset : offset + alphabet_size].rstrip(b"\0").decode("utf-8")
+    offset += alphabet_size
+    first_edge = array("I", data[offset : offset + 4 * (node_count + 1)])
+    offset += 4 * (node_count + 1)
+    targets = array("I", data[offset : offset + 4 * edge_count])
+    offset += 4 * edge_count
+    first_edge.byteswap()
+    targets.byteswap()
+    labels = bytearray(data[offset : offset + edge_count])
+    finals = bytearray(data[offset + edge_count : offset + edge_count + node_count])
+    return DawgLexicon(alphabet, first_edge, labels, targets, finals, root, word_count)
+
+
+LEXICON_BACKENDS: Dict[str, Callable[[Iterable[str]], Lexicon]] = {
+    "set": SetLexicon,
+    "dawg": DawgLexicon.from_words,
+}
+
+
+def build_lexicon(words: Iterable[str], backend: str = "set") -> Lexicon:
+    """Build a lexicon with the requested backend.
+
+    Args:
+        words: Uppercase words to include
+        backend: Backend name, one of ``LEXICON_BACKENDS``
+
+    Returns:
+        New lexicon
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    try:
+        factory = LEXICON_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown lexicon backend: {backend}. "
+            f"Choose from {sorted(LEXICON_BACKENDS)}"
+        ) from None
+    return factory(words)
@@ -0,0 +1,167 @@
+"""On-disk cache of compiled lexicons.
+
+Parsing a large word list and building its graph takes far longer than
+mapping a compiled lexicon, and every new worker process would otherwise
+repeat it. A ``LexiconCache`` compiles each distinct dictionary once into a
+cache directory and maps the compiled file from then on.
+
+Cache files are keyed by a hash of the word lists' contents, the language
+and the compiled format version, so an edited word list or a newer format
+gets a new file instead of a stale one. Files are written under a temporary
+name and renamed into place, so processes sharing the directory either see
+a complete file or none, and a process that already mapped a file keeps it
+intact if another one replaces it.
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+from typing import Optional
+
+from scrabble.lexicon import (
+    LEXICON_FORMAT_VERSION,
+    DawgLexicon,
+    compile_lexicon,
+    load_compiled_lexicon,
+)
+from scrabble.wordlist import (
+    DictionaryFiles,
+    LoadReport,
+    dictionary_files,
+    read_word_lists,
+)
+
+# Bytes hashed per read
+_CHUNK_SIZE = 1 << 20
+
+
+class LexiconCache:
+    """Directory of compiled lexicons keyed by their source word lists."""
+
+    def __init__(self, directory: str):
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory; created when first written to
+        """
+        self.directory = directory
+
+    def key(self, files: DictionaryFiles, language: Optional[str] = None) -> str:
+        """Hash the contents of word lists into a cache key.
+
+        Args:
+            files: Path or paths of the word lists, in load order
+            language: Language of the words
+
+        Returns:
+            Hex digest identifying the compiled lexicon
+
+        Raises:
+            OSError: If a file cannot be read
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{LEXICON_FORMAT_VERSION}\0{language or ''}\0".encode())
+        for file_path in dictionary_files(files):
+            digest.update(b"\0file\0")
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def path(self, key: str, language: Optional[str] = None) -> str:
+        """Get the path of the cache file for a key.
+
+        Args:
+            key: Key from ``key``
+            language: Language of the words
+
+        Returns:
+            Path inside the cache directory
+        """
+        name = f"{language or 'any'}-v{LEXICON_FORMAT_VERSION}-{key}.lex"
+        return os.path.join(self.directory, name)
+
+    def compiled_path(
+        self,
+        files: DictionaryFiles,
+        language: Optional[str] = None,
+        report: Optional[LoadReport] = None,
+        rebuild: bool = False,
+    ) -> str:
+        """Get the compiled lexicon of word lists, compiling it on a miss.
+
+        Args:
+            files: Path or paths of the word lists
+            language: Language of the words
+            report: Report to record the hit or miss into; on a miss the word
+                lists are read into it
+            rebuild: Compile again even if the cache file exists
+
+        Returns:
+            Path of the compiled lexicon in the cache
+
+        Raises:
+            OSError: If a file cannot be read or the cache cannot be written
+            ValueError: If a word list is corrupt
+        """
+        path = self.path(self.key(files, language), language)
+        hit = not rebuild and os.path.exists(path)
+        if report is not None:
+            report.cache_hit = hit
+        if not hit:
+            self._compile(files, path, report)
+        return path
+
+    def load(
+        self,
+        files: DictionaryFiles,
+        language: Optional[str] = None,
+        report: Optional[LoadReport] = None,
+    ) -> DawgLexicon:
+        """Map the compiled lexicon of word lists, compiling it on a miss.
+
+        A cache file that cannot be loaded, for example one left by an older
+        release or cut short, is compiled again.
+
+        Args:
+            files: Path or paths of the word lists
+            language: Language of the words
+            report: Report to record the hit or miss into
+
+        Returns:
+            The mapped lexicon
+
+        Raises:
+            OSError: If a file cannot be read or the cache cannot be written
+            ValueError: If a word list is corrupt
+        """
+        path = self.compiled_path(files, language, report)
+        try:
+            return load_compiled_lexicon(path)
+        except (ValueError, struct.error, OSError):
+            path = self.compiled_path(files, language, report, rebuild=True)
+            return load_compiled_lexicon(path)
+
+    def _compile(
+        self, files: DictionaryFiles, path: str, report: Optional[LoadReport]
+    ) -> None:
+        """Compile word lists into a cache file, replacing it atomically.
+
+        Args:
+            files: Path or paths of the word lists
+            path: Cache file to write
+            report: Report to read the word lists into
+        """
+        words = read_word_lists(files, report)
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.directory, prefix=".lexicon-", suffix=".tmp"
+        )
+        os.close(fd)
+        try:
+            compile_lexicon(words, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,340 @@
+"""Legal move generation on top of the GADDAG index."""
+
+import copy
+from typing import Callable, Iterable, List, Tuple
+
+from scrabble.alphabet import EMPTY, UNKNOWN
+from scrabble.board import Board
+from scrabble.gaddag import SEPARATOR_CODE
+from scrabble.tile import Tile
+from scrabble.validator import WordValidator
+
+
+class Move:
+    """A legal placement found by the move generator."""
+
+    __slots__ = ("word", "row", "col", "direction", "tiles", "score")
+
+    def __init__(
+        self,
+        word: str,
+        row: int,
+        col: int,
+        direction: str,
+        tiles: List[Tuple[int, int, str, bool]],
+        score: int,
+    ):
+        """Initialize a move.
+
+        Args:
+            word: Main word formed by the move
+            row: Row of the first letter of the main word
+            col: Column of the first letter of the main word
+            direction: 'H' for horizontal, 'V' for vertical
+            tiles: Placed tiles as (row, col, letter, is_blank) tuples
+            score: Score of the move, including any bingo bonus
+        """
+        self.word = word
+        self.row = row
+        self.col = col
+        self.direction = direction
+        self.tiles = tiles
+        self.score = score
+
+    def to_placement(self, rack: Iterable[Tile]) -> List[Tuple[int, int, Tile]]:
+        """Pick the rack tiles for this move, ready for ``Game.place_word``.
+
+        Blank tiles are copied and the copies assigned the letter they stand
+        for, so the rack itself is left untouched.
+
+        Args:
+            rack: Tiles on the player's rack, such as a ``Rack``
+
+        Returns:
+            List of (row, col, tile) tuples
+
+        Raises:
+            ValueError: If the rack does not hold the tiles for this move
+        """
+        available = list(rack)
+        placement = []
+        for row, col, letter, is_blank in self.tiles:
+            for tile in available:
+                if (tile.is_blank and is_blank) or (
+                    not tile.is_blank and not is_blank and tile.letter == letter
+                ):
+                    break
+            else:
+                raise ValueError(f"Rack has no tile for {letter} at ({row}, {col})")
+            available.remove(tile)
+            if is_blank:
+                tile = copy.copy(tile)
+                tile.set_blank_letter(letter)
+            placement.append((row, col, tile))
+        return placement
+
+    def __repr__(self) -> str:
+        return (
+            f"Move({self.word}, ({self.row}, {self.col}), {self.direction}, "
+            f"score={self.score})"
+        )
+
+
+class MoveGenerator:
+    """Enumerates every legal placement of a rack on a board.
+
+    Implements Gordon's GADDAG algorithm: for every anchor square (an empty
+    square next to a tile, or the center on an empty board) words are grown
+    leftwards from the anchor and then rightwards, constrained by the
+    letters already on the board, the rack and the cross-checks of each
+    square. Each placement is generated exactly once, from its leftmost
+    anchor, and scored with ``Board.score_placement``.
+    """
+
+    def __init__(
+        self,
+        board: Board,
+        validator: WordValidator,
+        rack_size: int = 7,
+        bingo_bonus: int = 50,
+    ):
+        """Initialize the move generator.
+
+        Args:
+            board: Board to generate moves on
+            validator: Validator whose dictionary words may be formed
+            rack_size: Number of tiles that earns the bingo bonus
+            bingo_bonus: Bonus for using a full rack
+        """
+        self.board = board
+        self.validator = validator
+        self.gaddag = validator.get_gaddag()
+        if board.validator is not validator:
+            board.attach_validator(validator, self.gaddag.alphabet.letters)
+        self.rack_size = rack_size
+        self.bingo_bonus = bingo_bonus
+
+    def generate(self, rack: Iterable[Tile]) -> List[Move]:
+        """Generate all legal moves for a rack.
+
+        Args:
+            rack: Tiles available to the player
+
+        Returns:
+            Legal moves, highest score first
+        """
+        alphabet = self.gaddag.alphabet
+        # Rack tile counts and letter points, indexed by letter code
+        counts = bytearray(alphabet.size)
+        letter_points = [0] * alphabet.size
+        for tile in rack:
+            if tile.is_blank:
+                counts[alphabet.blank_code] += 1
+            else:
+                code = alphabet.codes.get(tile.letter)
+                if code is not None:
+                    counts[code] += 1
+                    letter_points[code] = tile.points
+
+        size = self.board.size
+        board = self.board
+        if board.is_board_empty():
+            anchor_mask = board.position_mask([board.layout.center])
+        else:
+            anchor_mask = board.anchor_mask()
+        moves: List[Move] = []
+        for direction in ("H", "V"):
+            for line in range(size):
+                if direction == "H":
+                    squares = [(line, i) for i in range(size)]
+                else:
+                    squares = [(i, line) for i in range(size)]
+                self._generate_line(
+                    squares,
+                    line,
+                    direction,
+                    anchor_mask,
+                    counts,
+                    letter_points,
+                    moves.append,
+                )
+        moves.sort(key=lambda move: move.score, reverse=True)
+        return moves
+
+    def _generate_line(
+        self,
+        squares: List[Tuple[int, int]],
+        index: int,
+        direction: str,
+        anchor_mask: int,
+        rack: bytearray,
+        letter_points: List[int],
+        emit: Callable[[Move], None],
+    ) -> None:
+        """Generate the moves whose main word lies on one row or column.
+
+        Args:
+            squares: Board positions of the line, in reading order
+            index: Row (for 'H') or column (for 'V') of the line
+            direction: 'H' or 'V'
+            anchor_mask: Bitboard of the squares new words must cover one of
+            rack: Remaining tile counts per letter code, blanks under the
+                alphabet's ``blank_code``
+            letter_points: Point value of each rack letter, by letter code
+            emit: Callback receiving each generated move
+        """
+        board = self.board
+        gaddag = self.gaddag
+        size = board.size
+        n = len(squares)
+        # Code of the letter on each square, EMPTY for empty squares. The
+        # GADDAG's alphabet extends the board's, so board codes carry over
+        # unless the board has since coded letters of its own.
+        codes = gaddag.codes
+        board_codes, _, base = board.line_arrays(direction, index)
+        line = list(board_codes[base : base + n])
+        board_letters = board.alphabet.letters
+        if gaddag.alphabet.letters[: len(board_letters)] != board_letters:
+            line = [
+                codes.get(board_letters[code - 1], UNKNOWN) if code else EMPTY
+                for code in line
+            ]
+
+        anchors = [bool(anchor_mask >> (row * size + col) & 1) for row, col in squares]
+        if not any(anchors):
+            return
+
+        # Cross-checks as bitmasks of allowed letter codes; -1 allows all
+        checks = [-1] * n
+        for i, (row, col) in enumerate(squares):
+            if line[i] != EMPTY:
+                continue
+            allowed = board.get_cross_check(row, col, direction)
+            if allowed is not None:
+                checks[i] = sum(
+                    1 << codes[letter] for letter in allowed if letter in codes
+                )
+
+        letters = gaddag.letters
+        blank = gaddag.alphabet.blank_code
+        first_edge = gaddag.first_edge
+        labels = gaddag.labels
+        targets = gaddag.targets
+        finals = gaddag.finals
+        score_placement = board.score_placement
+        placed: List[Tuple[int, int, bool]] = []
+
+        def record(start: int, end: int) -> None:
+            if direction == "V" and len(placed) == 1 and checks[placed[0][0]] != -1:
+                # A single tile that also forms a horizontal word was already
+                # generated as a horizontal move.
+                return
+            new_codes = {pos: code for pos, code, _ in placed}
+            word = "".join(
+                letters[line[i] or new_codes[i]] for i in range(start, end + 1)
+            )
+            score = score_placement(
+                [
+                    squares[pos] + (0 if is_blank else letter_points[code],)
+                    for pos, code, is_blank in placed
+                ]
+            )
+            if len(placed) == self.rack_size:
+                score += self.bingo_bonus
+            tiles = [
+                squares[pos] + (letters[code], is_blank)
+                for pos, code, is_blank in placed
+            ]
+            row, col = squares[start]
+            emit(Move(word, row, col, direction, tiles, score))
+
+        def extend(
+            pos: int,
+            node: int,
+            left: bool,
+            start: int,
+            anchor: int,
+        ) -> None:
+            code = line[pos]
+            if code != EMPTY:
+                index = labels.find(code, first_edge[node], first_edge[node + 1])
+                if index >= 0:
+                    advance(
+                        pos,
+                        targets[index],
+                        left,
+                        start,
+                        anchor,
+                    )
+                return
+
+            allowed = checks[pos]
+            for index in range(first_edge[node], first_edge[node + 1]):
+                code = labels[index]
+                if code == SEPARATOR_CODE or not allowed >> code & 1:
+                    continue
+                for key, is_blank in ((code, False), (blank, True)):
+                    if not rack[key]:
+                        continue
+                    rack[key] -= 1
+                    placed.append((pos, code, is_blank))
+                    advance(
+                        pos,
+                        targets[index],
+                        left,
+                        start,
+                        anchor,
+                    )
+                    placed.pop()
+                    rack[key] += 1
+
+        def advance(
+            pos: int,
+            node: int,
+            left: bool,
+            start: int,
+            anchor: int,
+        ) -> None:
+            if left:
+                start = pos
+                if pos == 0 or line[pos - 1] == EMPTY:
+                    lo = first_edge[node]
+                    if lo < first_edge[node + 1] and labels[lo] == SEPARATOR_CODE:
+                        switch = targets[lo]
+                        if finals[switch] and (
+                            anchor == n - 1 or line[anchor + 1] == EMPTY
+                        ):
+                            record(start, anchor)
+                        if anchor + 1 < n:
+                            extend(
+                                anchor + 1,
+                                switch,
+                                False,
+                                start,
+                                anchor,
+                            )
+                # Stop before another empty anchor: placements covering it
+                # are generated from that anchor instead.
+                if pos > 0 and (line[pos - 1] != EMPTY or not anchors[pos - 1]):
+                    extend(
+                        pos - 1,
+                        node,
+                        True,
+                        start,
+                        anchor,
+                    )
+            else:
+                if finals[node] and (pos == n - 1 or line[pos + 1] == EMPTY):
+                    record(start, pos)
+                if pos + 1 < n:
+                    extend(
+                        pos + 1,
+                        node,
+                        False,
+                        start,
+                        anchor,
+                    )
+
+        for anchor in range(n):
+            if anchors[anchor]:
+                extend(anchor, gaddag.root, True, anchor, anchor)
@@ -1,7 +1,9 @@
 """Player class for Scrabble game."""
 
-from typing import List
+import copy
+from typing import Iterable, List
 
+from scrabble.rack import Rack
 from scrabble.tile import Tile
 
 
@@ -17,16 +19,46 @@ class Player:
         """
         self.name = name
         self.player_id = player_id
-        self.rack: List[Tile] = []
+        self.rack = []
         self.score = 0
 
+    @property
+    def rack(self) -> Rack:
+        """Tiles on the player's rack.
+
+        Assigning a list of tiles replaces the rack.
+        """
+        return self._rack
+
+    @rack.setter
+    def rack(self, tiles: Iterable[Tile]) -> None:
+        self._rack = Rack(tiles, self.player_id)
+
+    @property
+    def zobrist(self) -> int:
+        """Zobrist hash of the rack contents, independent of tile order."""
+        return self._rack.zobrist
+
+    def copy(self) -> "Player":
+        """Copy the player with an independent rack.
+
+        Blank tiles are copied; lettered tiles are shared.
+
+        Returns:
+            New player with the same name, rack and score
+        """
+        player = Player(self.name, self.player_id)
+        player.rack = [copy.copy(tile) for tile in self.rack]
+        player.score = self.score
+        return player
+
     def add_tiles(self, tiles: List[Tile]) -> None:
         """Add tiles to the player's rack.
 
         Args:
             tiles: List of tiles to add
         """
-        self.rack.extend(tiles)
+        self.rack.add(tiles)
 
     def remove_tile(self, tile: Tile) -> bool:
         """Remove a tile from the player's rack.
@@ -39,9 +71,9 @@ class Player:
         """
         try:
             self.rack.remove(tile)
-            return True
         except ValueError:
             return False
+        return True
 
     def has_tiles(self) -> bool:
         """Check if player has any tiles.
@@ -0,0 +1,183 @@
+"""Rack class for Scrabble game."""
+
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+from scrabble.tile import Tile
+from scrabble.zobrist import rack_key
+
+BLANK = "*"
+
+
+class Rack:
+    """The tiles on a player's rack, kept as a list and as letter counts.
+
+    Behaves like the list of tiles it replaces (iteration, indexing,
+    slicing, ``remove``, comparison with lists), while per-letter counts
+    make multiset checks independent of the rack size. Blank tiles are
+    counted under ``'*'``. Tiles compare by letter and points, so the
+    membership checks count ``(letter, points)`` pairs too, matching what
+    ``remove`` will find. The rack's Zobrist hash is kept up to date as
+    tiles come and go.
+    """
+
+    def __init__(self, tiles: Iterable[Tile] = (), seat: int = 0):
+        """Initialize a rack.
+
+        Args:
+            tiles: Tiles on the rack
+            seat: Player id, used to key the Zobrist hash
+        """
+        self.seat = seat
+        self._tiles: List[Tile] = []
+        self.counts: Dict[str, int] = {}
+        # Tiles by (letter, points), the fields Tile equality compares
+        self._tile_counts: Dict[Tuple[str, int], int] = {}
+        self.zobrist = 0
+        self.add(tiles)
+
+    def add(self, tiles: Iterable[Tile]) -> None:
+        """Put tiles on the rack.
+
+        Args:
+            tiles: Tiles to add
+        """
+        counts = self.counts
+        tile_counts = self._tile_counts
+        for tile in tiles:
+            self._tiles.append(tile)
+            count = counts.get(tile.letter, 0)
+            self.zobrist ^= rack_key(self.seat, tile.letter, count)
+            counts[tile.letter] = count + 1
+            key = (tile.letter, tile.points)
+            tile_counts[key] = tile_counts.get(key, 0) + 1
+
+    def subtract(self, tiles: Iterable[Tile]) -> None:
+        """Take tiles off the rack.
+
+        Args:
+            tiles: Tiles to remove
+
+        Raises:
+            ValueError: If the rack does not hold all of the tiles. The rack
+                is left unchanged in that case.
+        """
+        tiles = list(tiles)
+        if not self.has_tiles(tiles):
+            raise ValueError("Rack does not hold these tiles")
+        for tile in tiles:
+            self.remove(tile)
+
+    def remove(self, tile: Tile) -> None:
+        """Take one tile off the rack.
+
+        Args:
+            tile: Tile to remove
+
+        Raises:
+            ValueError: If the tile is not on the rack
+        """
+        self._tiles.remove(tile)
+        count = self.counts[tile.letter] - 1
+        self.zobrist ^= rack_key(self.seat, tile.letter, count)
+        if count:
+            self.counts[tile.letter] = count
+        else:
+            del self.counts[tile.letter]
+        key = (tile.letter, tile.points)
+        count = self._tile_counts[key] - 1
+        if count:
+            self._tile_counts[key] = count
+        else:
+            del self._tile_counts[key]
+
+    def count(self, letter: str) -> int:
+        """Count the tiles with a letter, or blanks for ``'*'``.
+
+        Args:
+            letter: Letter to count
+
+        Returns:
+            Number of tiles
+        """
+        return self.counts.get(letter, 0)
+
+    @property
+    def blanks(self) -> int:
+        """Number of blank tiles on the rack."""
+        return self.counts.get(BLANK, 0)
+
+    def has_tiles(self, tiles: Iterable[Tile]) -> bool:
+        """Check if the rack holds all of the tiles.
+
+        Args:
+            tiles: Tiles to check for; repeated tiles must all be present.
+                A tile matches a rack tile with the same letter and points.
+
+        Returns:
+            True if every tile is on the rack, False otherwise
+        """
+        counts = self._tile_counts
+        needed: Dict[Tuple[str, int], int] = {}
+        for tile in tiles:
+            key = (tile.letter, tile.points)
+            n = needed.get(key, 0) + 1
+            if n > counts.get(key, 0):
+                return False
+            needed[key] = n
+        return True
+
+    def can_spell(self, letters: str) -> bool:
+        """Check if the rack can supply letters, using blanks for missing ones.
+
+        Args:
+            letters: Letters needed
+
+        Returns:
+            True if the rack's tiles cover ``letters``, False otherwise
+        """
+        counts = self.counts
+        needed: Dict[str, int] = {}
+        missing = 0
+        for letter in letters:
+            n = needed.get(letter, 0) + 1
+            needed[letter] = n
+            if n > counts.get(letter, 0):
+                missing += 1
+        return missing <= counts.get(BLANK, 0)
+
+    def key(self) -> str:
+        """Get an order-independent key of the rack contents.
+
+        Returns:
+            The tile letters sorted, blanks as '*', e.g. ``'*AEKT'``
+        """
+        return "".join(letter * n for letter, n in sorted(self.counts.items()))
+
+    def copy(self) -> List[Tile]:
+        """Get the tiles as a new list."""
+        return list(self._tiles)
+
+    def __iter__(self) -> Iterator[Tile]:
+        return iter(self._tiles)
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def __contains__(self, tile: object) -> bool:
+        return (
+            isinstance(tile, Tile)
+            and self._tile_counts.get((tile.letter, tile.points), 0) > 0
+        )
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tile, List[Tile]]:
+        return self._tiles[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Rack):
+            return self._tiles == other._tiles
+        if isinstance(other, list):
+            return self._tiles == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Rack({self._tiles!r})"
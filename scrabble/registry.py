@@ -0,0 +1,192 @@
+"""Process-wide registry of lexicons shared between games."""
+
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from scrabble.lexicon import Lexicon
+from scrabble.validator import WordValidator
+from scrabble.wordlist import DictionaryFiles, dictionary_files
+
+# (absolute path, modification time, size) of each dictionary file
+FileKey = Tuple[Tuple[str, int, int], ...]
+RegistryKey = Tuple[str, FileKey, str]
+
+
+class _Entry:
+    """A loaded lexicon and the number of games using it."""
+
+    __slots__ = ("lexicon", "refcount")
+
+    def __init__(self, lexicon: Lexicon):
+        self.lexicon = lexicon
+        self.refcount = 0
+
+
+class ValidatorRegistry:
+    """Hands out validators that share one read-only lexicon per dictionary.
+
+    Lexicons are keyed by language, dictionary paths, the files' modification
+    times and sizes, and the lexicon backend, so a dictionary that changes on
+    disk is loaded again. Games still using the old copy keep it as long as
+    the file was replaced rather than rewritten in place: compiled lexicons
+    are mapped, and ``compile_lexicon`` renames a new file over the old one
+    for that reason.
+    Every ``acquire`` must be paired with a ``release``; a lexicon is closed
+    and evicted as soon as no game uses it anymore.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            cache_dir: Directory of compiled lexicons that plain-text
+                dictionaries are compiled into and mapped from (see
+                ``scrabble.lexicon_cache``), shared by every process using it
+        """
+        self.cache_dir = cache_dir
+        self._entries: Dict[RegistryKey, _Entry] = {}
+        self._keys: Dict[int, RegistryKey] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        language: str,
+        dictionary_file: Optional[DictionaryFiles],
+        backend: str = "set",
+    ) -> RegistryKey:
+        """Build the registry key for a dictionary.
+
+        Args:
+            language: Language code of the game
+            dictionary_file: Path or paths of the dictionary files (optional)
+            backend: Lexicon backend used for plain-text dictionaries
+
+        Returns:
+            Key identifying the dictionary contents
+
+        Raises:
+            OSError: If a dictionary file does not exist
+        """
+        files = []
+        for path in dictionary_files(dictionary_file):
+            stat = os.stat(path)
+            files.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+        return (language, tuple(files), backend)
+
+    def acquire(
+        self,
+        language: str = "nl",
+        dictionary_file: Optional[DictionaryFiles] = None,
+        backend: str = "set",
+    ) -> WordValidator:
+        """Get a validator backed by the shared lexicon for a dictionary.
+
+        The lexicon is loaded on first use. The returned validator is a thin
+        per-game view: words added to it with ``add_word`` do not leak into
+        other games.
+
+        Args:
+            language: Language code of the game
+            dictionary_file: Path or paths of the dictionary files (optional)
+            backend: Lexicon backend used for plain-text dictionaries
+
+        Returns:
+            Validator sharing the registry's lexicon
+
+        Raises:
+            OSError: If a dictionary file cannot be read
+            ValueError: If a dictionary file is corrupt
+        """
+        key = self.make_key(language, dictionary_file, backend)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                lexicon = WordValidator(
+                    dictionary_file,
+                    backend,
+                    language=language,
+                    cache_dir=self.cache_dir,
+                ).lexicon
+                entry = _Entry(lexicon)
+                self._entries[key] = entry
+                self._keys[id(lexicon)] = key
+            entry.refcount += 1
+            return WordValidator(
+                backend=backend, lexicon=entry.lexicon, language=language
+            )
+
+    def retain(self, validator: WordValidator) -> None:
+        """Take another hold on an acquired validator's lexicon.
+
+        Used when a game is cloned and shares its parent's validator. Every
+        ``retain`` must be paired with a ``release``.
+
+        Args:
+            validator: Validator obtained from ``acquire``
+
+        Raises:
+            ValueError: If the validator's lexicon is not managed here
+        """
+        with self._lock:
+            key = self._keys.get(id(validator.lexicon))
+            if key is None:
+                raise ValueError("Validator was not acquired from this registry")
+            self._entries[key].refcount += 1
+
+    def release(self, validator: WordValidator) -> None:
+        """Return a validator obtained from ``acquire``.
+
+        Args:
+            validator: Validator to release
+
+        Raises:
+            ValueError: If the validator's lexicon is not managed here
+        """
+        with self._lock:
+            key = self._keys.get(id(validator.lexicon))
+            if key is None:
+                raise ValueError("Validator was not acquired from this registry")
+            entry = self._entries[key]
+            entry.refcount -= 1
+            if entry.refcount == 0:
+                del self._entries[key]
+                del self._keys[id(entry.lexicon)]
+                entry.lexicon.close()
+
+    def stats(self) -> List[Dict]:
+        """Report usage of every loaded lexicon.
+
+        Returns:
+            One dictionary per lexicon with its language, dictionary file
+            (None for the built-in words, a tuple of paths for combined
+            word lists), backend, number of games using it, word count and estimated
+            memory in bytes
+        """
+        with self._lock:
+            return [
+                {
+                    "language": key[0],
+                    "dictionary_file": _describe_files(key[1]),
+                    "backend": key[2],
+                    "games": entry.refcount,
+                    "words": len(entry.lexicon),
+                    "memory_bytes": entry.lexicon.memory_usage(),
+                }
+                for key, entry in self._entries.items()
+            ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _describe_files(files: FileKey) -> Optional[DictionaryFiles]:
+    """Get the dictionary paths of a registry key as passed to ``acquire``."""
+    paths = tuple(path for path, _, _ in files)
+    if len(paths) == 1:
+        return paths[0]
+    return paths or None
+
+
+# Set SCRABBLE_LEXICON_CACHE to a directory to cache compiled dictionaries
+default_registry = ValidatorRegistry(os.environ.get("SCRABBLE_LEXICON_CACHE"))
@@ -0,0 +1,335 @@
+"""Headless self-play simulation of complete games.
+
+A ``Simulator`` plays whole games between pluggable strategies without any
+console output. Every game is driven by its own seeded ``random.Random``, so
+a result can be replayed from its seed, and results are yielded one by one
+as games finish together with running throughput figures.
+
+Usage:
+    python -m scrabble.simulator [--games N] [--seed S] [--strategies A B]
+"""
+
+import argparse
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from scrabble.game import Game
+from scrabble.movegen import Move
+from scrabble.registry import ValidatorRegistry, default_registry
+from scrabble.wordlist import DictionaryFiles
+
+
+class Strategy(ABC):
+    """Chooses which move a simulated player makes."""
+
+    name = "strategy"
+
+    @abstractmethod
+    def choose(
+        self, game: Game, moves: List[Move], rng: random.Random
+    ) -> Optional[Move]:
+        """Pick a move for the current player.
+
+        Args:
+            game: Game in progress
+            moves: Legal moves for the current player, highest score first
+            rng: The game's random number generator
+
+        Returns:
+            Move to play, or None to pass
+        """
+
+
+class GreedyStrategy(Strategy):
+    """Always plays the highest scoring move."""
+
+    name = "greedy"
+
+    def choose(
+        self, game: Game, moves: List[Move], rng: random.Random
+    ) -> Optional[Move]:
+        return moves[0] if moves else None
+
+
+class RandomStrategy(Strategy):
+    """Plays a uniformly random legal move."""
+
+    name = "random"
+
+    def choose(
+        self, game: Game, moves: List[Move], rng: random.Random
+    ) -> Optional[Move]:
+        return rng.choice(moves) if moves else None
+
+
+class LongestWordStrategy(Strategy):
+    """Plays the move that uses the most tiles, breaking ties on score."""
+
+    name = "longest"
+
+    def choose(
+        self, game: Game, moves: List[Move], rng: random.Random
+    ) -> Optional[Move]:
+        if not moves:
+            return None
+        return max(moves, key=lambda move: (len(move.tiles), move.score))
+
+
+STRATEGIES: Dict[str, type] = {
+    strategy.name: strategy
+    for strategy in (GreedyStrategy, RandomStrategy, LongestWordStrategy)
+}
+
+
+def get_strategy(name: str) -> Strategy:
+    """Create a strategy by name.
+
+    Args:
+        name: Name of a registered strategy
+
+    Returns:
+        New strategy instance
+
+    Raises:
+        ValueError: If no strategy has that name
+    """
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {name}. Choose from {sorted(STRATEGIES)}")
+    return STRATEGIES[name]()
+
+
+class GameResult:
+    """Outcome of one simulated game."""
+
+    __slots__ = ("seed", "strategies", "scores", "winner", "turns", "moves", "elapsed")
+
+    def __init__(
+        self,
+        seed: int,
+        strategies: List[str],
+        scores: List[int],
+        winner: Optional[int],
+        turns: int,
+        moves: int,
+        elapsed: float,
+    ):
+        """Initialize a game result.
+
+        Args:
+            seed: Seed that reproduces the game
+            strategies: Strategy name of each seat, in turn order
+            scores: Final score of each seat
+            winner: Seat index of the winner, or None for a shared top score
+            turns: Number of turns taken, including passes
+            moves: Number of words placed
+            elapsed: Wall-clock seconds spent playing the game
+        """
+        self.seed = seed
+        self.strategies = strategies
+        self.scores = scores
+        self.winner = winner
+        self.turns = turns
+        self.moves = moves
+        self.elapsed = elapsed
+
+    def to_dict(self) -> Dict:
+        """Get the result as a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return (
+            f"GameResult(seed={self.seed}, scores={self.scores}, "
+            f"winner={self.winner}, turns={self.turns})"
+        )
+
+
+class SimulationStats:
+    """Running totals and throughput of a simulation."""
+
+    def __init__(self) -> None:
+        """Initialize empty totals."""
+        self.games = 0
+        self.moves = 0
+        self.turns = 0
+        self.elapsed = 0.0
+
+    def add(self, result: GameResult) -> None:
+        """Account for a finished game.
+
+        Args:
+            result: Result of the game
+        """
+        self.games += 1
+        self.moves += result.moves
+        self.turns += result.turns
+
+    @property
+    def games_per_second(self) -> float:
+        """Games finished per second of wall-clock time."""
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def moves_per_second(self) -> float:
+        """Words placed per second of wall-clock time."""
+        return self.moves / self.elapsed if self.elapsed else 0.0
+
+
+class Simulator:
+    """Plays complete games between strategies without any console output."""
+
+    def __init__(
+        self,
+        strategies: Sequence[Strategy],
+        language: str = "nl",
+        dictionary_file: Optional[DictionaryFiles] = None,
+        registry: Optional[ValidatorRegistry] = None,
+        max_turns: int = 500,
+        layout: str = "standard",
+    ):
+        """Initialize the simulator.
+
+        Args:
+            strategies: One strategy per seat, in turn order (2 to 4)
+            language: Language code of the simulated games
+            dictionary_file: Optional path to dictionary file, or paths of
+                several word lists to combine
+            registry: Registry that shares the lexicon between games.
+                Defaults to the process-wide ``default_registry``.
+            max_turns: Turn limit after which a game is stopped
+            layout: Name of the registered board layout to play on
+        """
+        if not 2 <= len(strategies) <= 4:
+            raise ValueError("A game needs 2 to 4 strategies")
+        self.strategies = list(strategies)
+        self.language = language
+        self.dictionary_file = dictionary_file
+        self.registry = registry if registry is not None else default_registry
+        self.max_turns = max_turns
+        self.layout = layout
+        self.stats = SimulationStats()
+
+    def play(
+        self, seed: int, strategies: Optional[Sequence[Strategy]] = None
+    ) -> GameResult:
+        """Play one game.
+
+        Args:
+            seed: Seed for the tile bag and the strategies
+            strategies: Seating for this game only (defaults to the
+                simulator's strategies)
+
+        Returns:
+            Result of the game
+        """
+        if strategies is None:
+            strategies = self.strategies
+        start = time.perf_counter()
+        rng = random.Random(seed)
+        names = [strategy.name for strategy in strategies]
+        game = Game(
+            [f"{name}-{seat}" for seat, name in enumerate(names)],
+            dictionary_file=self.dictionary_file,
+            language=self.language,
+            registry=self.registry,
+            rng=rng,
+            layout=self.layout,
+        )
+        moves = 0
+        try:
+            while not game.game_over and game.turn_number < self.max_turns:
+                strategy = strategies[game.current_player_index]
+                move = strategy.choose(game, game.generate_moves(), rng)
+                if move is None:
+                    game.pass_turn()
+                    continue
+                placement = move.to_placement(game.get_current_player().rack)
+                success, message, _ = game.place_word(placement)
+                if not success:
+                    raise RuntimeError(
+                        f"{strategy.name} chose an illegal move: {message}"
+                    )
+                moves += 1
+            scores = [player.score for player in game.players]
+            turns = game.turn_number
+        finally:
+            game.close()
+
+        best = max(scores)
+        winners = [seat for seat, score in enumerate(scores) if score == best]
+        return GameResult(
+            seed,
+            names,
+            scores,
+            winners[0] if len(winners) == 1 else None,
+            turns,
+            moves,
+            time.perf_counter() - start,
+        )
+
+    def run(self, games: int, seed: int = 0) -> Iterator[GameResult]:
+        """Play a series of games, yielding each result as it finishes.
+
+        Game ``i`` is played with seed ``seed + i``. ``stats`` is updated
+        before every result is yielded. The lexicon and its move generation
+        index are kept loaded for the whole series instead of being released
+        after every game.
+
+        Args:
+            games: Number of games to play
+            seed: Seed of the first game
+
+        Yields:
+            Result of each game, in order
+        """
+        start = time.perf_counter() - self.stats.elapsed
+        validator = self.registry.acquire(self.language, self.dictionary_file)
+        try:
+            for index in range(games):
+                result = self.play(seed + index)
+                self.stats.add(result)
+                self.stats.elapsed = time.perf_counter() - start
+                yield result
+        finally:
+            self.registry.release(validator)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a simulation from the command line and print a summary."""
+    parser = argparse.ArgumentParser(description="Simulate self-play games.")
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--language", default="nl")
+    parser.add_argument(
+        "--dictionary",
+        action="append",
+        help="dictionary file to play with; repeat to combine word lists",
+    )
+    parser.add_argument("--layout", default="standard", help="board layout name")
+    parser.add_argument(
+        "--strategies", nargs="+", default=["greedy", "greedy"], choices=STRATEGIES
+    )
+    args = parser.parse_args(argv)
+
+    simulator = Simulator(
+        [get_strategy(name) for name in args.strategies],
+        language=args.language,
+        dictionary_file=args.dictionary,
+        layout=args.layout,
+    )
+    wins = [0] * len(args.strategies)
+    for result in simulator.run(args.games, args.seed):
+        if result.winner is not None:
+            wins[result.winner] += 1
+    stats = simulator.stats
+    print(
+        f"{stats.games} games, {stats.moves} moves in {stats.elapsed:.2f}s: "
+        f"{stats.games_per_second:.2f} games/s, {stats.moves_per_second:.1f} moves/s"
+    )
+    for seat, name in enumerate(args.strategies):
+        print(f"  seat {seat} ({name}): {wins[seat]} wins")
+
+
+if __name__ == "__main__":
+    main()
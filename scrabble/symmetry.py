@@ -0,0 +1,281 @@
+"""Symmetries of the board, to key caches by equivalence class.
+
+The standard layout looks the same after any of the 8 rotations and
+reflections of the square, but words only read left to right and top to
+bottom. A symmetry that reverses the reading order of a line turns a word
+around; laying its tiles out again in reading order puts other letters on
+the premium squares, so the image scores differently even on an empty board.
+Only the identity and the transpose (the mirror in the main diagonal, which
+swaps rows and columns) keep every word readable and every score unchanged.
+They are the symmetries under which plays are equivalent.
+
+A cache stores results under the canonical key of a position, in the
+position's canonical orientation, and maps them back with the inverse of the
+symmetry that brought the position there::
+
+    key, symmetry = canonical_position(board)
+    moves = cache.get(key)
+    if moves is None:
+        moves = [symmetry.move(m) for m in generate(board)]
+        cache.store(key, moves)
+    moves = [symmetry.inverse().move(m) for m in moves]
+"""
+
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple, TypeVar
+
+from scrabble.board import Board
+from scrabble.layout import Layout
+from scrabble.movegen import Move
+from scrabble.zobrist import square_key
+
+T = TypeVar("T")
+
+
+class Symmetry:
+    """One of the 8 rotations and reflections of a square board.
+
+    A symmetry first swaps rows and columns if ``transpose`` is set, then
+    mirrors the rows top to bottom and the columns left to right as flagged.
+    """
+
+    def __init__(
+        self, name: str, size: int, transpose: bool, flip_rows: bool, flip_cols: bool
+    ):
+        """Initialize a symmetry.
+
+        Args:
+            name: Name, e.g. 'rotate90'
+            size: Number of rows and columns of the board
+            transpose: Whether rows and columns are swapped
+            flip_rows: Whether rows are mirrored after the swap
+            flip_cols: Whether columns are mirrored after the swap
+        """
+        self.name = name
+        self.size = size
+        self.transpose = transpose
+        self.flip_rows = flip_rows
+        self.flip_cols = flip_cols
+
+    @property
+    def keeps_reading_order(self) -> bool:
+        """Whether every word still reads left to right and top to bottom."""
+        return not (self.flip_rows or self.flip_cols)
+
+    def square(self, row: int, col: int) -> Tuple[int, int]:
+        """Map a square.
+
+        Args:
+            row: Row index
+            col: Column index
+
+        Returns:
+            (row, col) of the image of the square
+        """
+        if self.transpose:
+            row, col = col, row
+        if self.flip_rows:
+            row = self.size - 1 - row
+        if self.flip_cols:
+            col = self.size - 1 - col
+        return row, col
+
+    def direction(self, direction: str) -> str:
+        """Map a word direction.
+
+        Args:
+            direction: 'H' for horizontal, 'V' for vertical
+
+        Returns:
+            Direction of the image of a word in that direction
+        """
+        if self.transpose:
+            return "V" if direction == "H" else "H"
+        return direction
+
+    def inverse(self) -> "Symmetry":
+        """Get the symmetry that undoes this one."""
+        flags = (self.transpose, self.flip_rows, self.flip_cols)
+        if self.transpose:
+            # Mirroring rows after a swap mirrors columns before it
+            flags = (True, self.flip_cols, self.flip_rows)
+        for symmetry in symmetries(self.size):
+            if (symmetry.transpose, symmetry.flip_rows, symmetry.flip_cols) == flags:
+                return symmetry
+        raise AssertionError("Every symmetry of the square has an inverse")
+
+    def placement(
+        self, placement: Sequence[Tuple[int, int, T]]
+    ) -> List[Tuple[int, int, T]]:
+        """Map the tiles of one play.
+
+        Args:
+            placement: (row, col, tile) tuples, in any order
+
+        Returns:
+            The mapped tuples, in reading order
+
+        Raises:
+            ValueError: If the symmetry reverses the reading order
+        """
+        if not self.keeps_reading_order:
+            raise ValueError(f"{self.name} reverses the reading order of words")
+        mapped = [(*self.square(row, col), tile) for row, col, tile in placement]
+        return sorted(mapped, key=lambda item: (item[0], item[1]))
+
+    def move(self, move: Move) -> Move:
+        """Map a move found by the move generator.
+
+        Args:
+            move: Move to map
+
+        Returns:
+            The mapped move, with the same word and score
+
+        Raises:
+            ValueError: If the symmetry reverses the reading order
+        """
+        placed = self.placement(
+            [
+                (row, col, (letter, is_blank))
+                for row, col, letter, is_blank in move.tiles
+            ]
+        )
+        row, col = self.square(move.row, move.col)
+        return Move(
+            move.word,
+            row,
+            col,
+            self.direction(move.direction),
+            [(row, col, letter, is_blank) for row, col, (letter, is_blank) in placed],
+            move.score,
+        )
+
+    def __repr__(self) -> str:
+        return f"Symmetry({self.name}, {self.size}x{self.size})"
+
+
+@lru_cache(maxsize=None)
+def symmetries(size: int) -> Tuple[Symmetry, ...]:
+    """Get the 8 symmetries of a square board, the identity first.
+
+    Args:
+        size: Number of rows and columns
+
+    Returns:
+        The symmetries
+    """
+    return tuple(
+        Symmetry(name, size, *flags)
+        for name, flags in [
+            ("identity", (False, False, False)),
+            ("transpose", (True, False, False)),
+            ("rotate90", (True, False, True)),
+            ("rotate180", (False, True, True)),
+            ("rotate270", (True, True, False)),
+            ("flip_rows", (False, True, False)),
+            ("flip_cols", (False, False, True)),
+            ("anti_transpose", (True, True, True)),
+        ]
+    )
+
+
+@lru_cache(maxsize=None)
+def layout_symmetries(layout: Layout) -> Tuple[Symmetry, ...]:
+    """Get the symmetries that map a layout onto itself.
+
+    Args:
+        layout: Board layout
+
+    Returns:
+        The symmetries that keep the center and every premium square in
+        place, the identity first
+    """
+    premiums = layout.premium_squares
+    return tuple(
+        symmetry
+        for symmetry in symmetries(layout.size)
+        if symmetry.square(*layout.center) == layout.center
+        and all(
+            premiums.get(symmetry.square(row, col)) == premium
+            for (row, col), premium in premiums.items()
+        )
+    )
+
+
+def position_symmetries(board: Board) -> Tuple[Symmetry, ...]:
+    """Get the symmetries under which a position's plays are equivalent.
+
+    Args:
+        board: Board to check
+
+    Returns:
+        The layout symmetries that keep the reading order, the identity
+        first
+    """
+    found = layout_symmetries(board.layout)
+    return tuple(symmetry for symmetry in found if symmetry.keeps_reading_order)
+
+
+def board_hash(board: Board, symmetry: Symmetry) -> int:
+    """Get the Zobrist hash the board would have after a symmetry.
+
+    Args:
+        board: Board to hash
+        symmetry: Symmetry to apply
+
+    Returns:
+        64-bit hash, equal to ``board.zobrist`` for the identity
+    """
+    size = board.size
+    codes = board.letter_codes
+    blanks = board.blank_flags
+    letters = ("",) + board.alphabet.letters
+    key = 0
+    occupied = board.occupied
+    while occupied:
+        low = occupied & -occupied
+        index = low.bit_length() - 1
+        occupied ^= low
+        row, col = symmetry.square(*divmod(index, size))
+        key ^= square_key(row * size + col, letters[codes[index]], bool(blanks[index]))
+    return key
+
+
+def canonical_position(board: Board) -> Tuple[int, Symmetry]:
+    """Get a key shared by all orientations of a position.
+
+    Args:
+        board: Board to key
+
+    Returns:
+        Tuple of (key, symmetry): the smallest Zobrist hash over the
+        position's symmetries, and the symmetry that turns the board into
+        that orientation
+    """
+    best = None
+    for symmetry in position_symmetries(board):
+        key = (
+            board.zobrist
+            if symmetry.name == "identity"
+            else board_hash(board, symmetry)
+        )
+        if best is None or key < best[0]:
+            best = (key, symmetry)
+    assert best is not None
+    return best
+
+
+def canonical_move(move: Move, found: Iterable[Symmetry]) -> Tuple[Move, Symmetry]:
+    """Get one representative of a move's images.
+
+    Args:
+        move: Move to canonicalise
+        found: Symmetries to consider, e.g. from ``position_symmetries``
+
+    Returns:
+        Tuple of (move, symmetry): the image that sorts first by direction
+        and tiles, and the symmetry that produced it
+    """
+    images = [(symmetry.move(move), symmetry) for symmetry in found]
+    return min(images, key=lambda image: (image[0].direction, image[0].tiles))
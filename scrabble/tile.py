@@ -1,5 +1,6 @@
 """Tile and TileBag classes for Scrabble game."""
 
+import copy
 import random
 from typing import List, Optional
 from typing import Dict, List, Optional, Tuple
@@ -8,7 +9,17 @@ from scrabble.language import get_letter_distribution
 
 
 class Tile:
-    """Represents a Scrabble tile with a letter and point value."""
+    """Represents a Scrabble tile with a letter and point value.
+
+    Lettered tiles never change once made, so bags share one canonical
+    instance per language and letter (see ``canonical``). Blank tiles hold
+    the letter chosen in play and are separate objects in every game.
+    """
+
+    __slots__ = ("letter", "points", "is_blank", "blank_letter")
+
+    # Canonical lettered tiles by (language, letter, points)
+    _interned: Dict[Tuple[str, str, int], "Tile"] = {}
 
     # Dutch Scrabble letter distribution and scores
     LETTER_DISTRIBUTION = {
@@ -51,7 +62,28 @@ class Tile:
         self.letter = letter.upper()
         self.points = points
         self.is_blank = letter == "*"
-        self.blank_letter = None  # For blank tiles, stores chosen letter
+        # For blank tiles, stores chosen letter
+        self.blank_letter: Optional[str] = None
+
+    @classmethod
+    def canonical(cls, language: str, letter: str, points: int) -> "Tile":
+        """Get the shared tile for a letter of a language.
+
+        Args:
+            language: Language code of the tile set
+            letter: The letter on the tile (or '*' for blank)
+            points: Point value of the tile
+
+        Returns:
+            The interned tile, or a new tile for blanks
+        """
+        if letter == "*":
+            return cls(letter, points)
+        key = (language, letter, points)
+        tile = cls._interned.get(key)
+        if tile is None:
+            tile = cls._interned[key] = cls(letter, points)
+        return tile
 
     def set_blank_letter(self, letter: str) -> None:
         """Set the letter for a blank tile.
@@ -74,37 +106,112 @@ class Tile:
         return f"Tile({self.letter}, {self.points})"
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Tile):
             return False
         return self.letter == other.letter and self.points == other.points
 
+    def __copy__(self) -> "Tile":
+        if not self.is_blank:
+            return self
+        tile = Tile(self.letter, self.points)
+        tile.blank_letter = self.blank_letter
+        return tile
+
+    def __deepcopy__(self, memo: Dict[int, object]) -> "Tile":
+        return self.__copy__()
+
 
 class TileBag:
     """Manages the bag of tiles for a Scrabble game."""
 
     def __init__(self):
         """Initialize a tile bag with the standard Dutch Scrabble distribution."""
-    def __init__(self, language: str = "nl"):
+    def __init__(self, language: str = "nl", rng: Optional[random.Random] = None):
         """Initialize a tile bag with the distribution for the specified language.
         
         Args:
             language: Language code ('en', 'nl', or 'fi'). Defaults to 'nl'.
+            rng: Random number generator for draws. Defaults to a new,
+                unseeded ``random.Random``; pass a seeded one for
+                reproducible games.
         """
         self.language = language
+        self.rng = rng if rng is not None else random.Random()
         self.letter_distribution = get_letter_distribution(language)
         self.tiles: List[Tile] = []
         self._initialize_tiles()
-        self.shuffle()
+
+    def copy(self) -> "TileBag":
+        """Copy the bag, including the state of its random number generator.
+
+        Blank tiles are copied; lettered tiles are shared.
+
+        Returns:
+            New bag holding the same tiles in the same order
+        """
+        bag = TileBag.__new__(TileBag)
+        bag.__dict__.update(self.__dict__)
+        bag.tiles = [copy.copy(tile) for tile in self.tiles]
+        bag.rng = random.Random()
+        bag.rng.setstate(self.rng.getstate())
+        return bag
 
     def _initialize_tiles(self) -> None:
         """Create all tiles according to the language distribution."""
         for letter, (count, points) in self.letter_distribution.items():
             for _ in range(count):
-                self.tiles.append(Tile(letter, points))
+                self.tiles.append(Tile.canonical(self.language, letter, points))
 
     def shuffle(self) -> None:
-        """Shuffle the tiles in the bag."""
-        random.shuffle(self.tiles)
+        """Shuffle the tiles in the bag.
+
+        Draws already pick tiles at random, so the bag never needs this.
+        """
+        self.rng.shuffle(self.tiles)
+
+    def get_rng_state(self) -> object:
+        """Snapshot the state of the bag's random number generator.
+
+        Returns:
+            State to pass to ``set_rng_state``
+        """
+        return self.rng.getstate()
+
+    def set_rng_state(self, state: object) -> None:
+        """Restore a snapshot taken with ``get_rng_state``.
+
+        Together with the bag's contents this makes the following draws
+        repeat exactly.
+
+        Args:
+            state: State returned by ``get_rng_state``
+        """
+        self.rng.setstate(state)  # type: ignore[arg-type]
+
+    def take(self, count: int = 1) -> List[Tuple[int, Tile]]:
+        """Draw random tiles, reporting where each one was taken from.
+
+        Each tile is swapped with the last one in the bag and popped, so a
+        draw costs O(count) however full the bag is.
+
+        Args:
+            count: Number of tiles to draw
+
+        Returns:
+            (position, tile) pairs in the order drawn, for ``put_back``
+        """
+        tiles = self.tiles
+        randrange = self.rng.randrange
+        taken = []
+        for _ in range(min(count, len(tiles))):
+            index = randrange(len(tiles))
+            tile = tiles[index]
+            tiles[index] = tiles[-1]
+            tiles.pop()
+            taken.append((index, tile))
+        return taken
 
     def draw(self, count: int = 1) -> List[Tile]:
         """Draw tiles from the bag.
@@ -115,10 +222,7 @@ class TileBag:
         Returns:
             List of drawn tiles
         """
-        drawn = []
-        for _ in range(min(count, len(self.tiles))):
-            drawn.append(self.tiles.pop())
-        return drawn
+        return [tile for _, tile in self.take(count)]
 
     def draw_one(self) -> Optional[Tile]:
         """Draw a single tile from the bag.
@@ -126,18 +230,27 @@ class TileBag:
         Returns:
             A single tile or None if bag is empty
         """
-        if self.tiles:
-            return self.tiles.pop()
-        return None
+        drawn = self.take(1)
+        return drawn[0][1] if drawn else None
 
     def return_tiles(self, tiles: List[Tile]) -> None:
-        """Return tiles to the bag and shuffle.
+        """Return tiles to the bag.
 
         Args:
             tiles: List of tiles to return to the bag
         """
         self.tiles.extend(tiles)
-        self.shuffle()
+
+    def put_back(self, taken: List[Tuple[int, Tile]]) -> None:
+        """Undo a ``take``, restoring the bag to its exact previous order.
+
+        Args:
+            taken: Pairs returned by the last ``take``
+        """
+        tiles = self.tiles
+        for index, tile in reversed(taken):
+            tiles.append(tile)
+            tiles[index], tiles[-1] = tiles[-1], tiles[index]
 
     def remaining_count(self) -> int:
         """Get the number of tiles remaining in the bag."""
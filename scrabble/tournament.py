@@ -0,0 +1,295 @@
+"""Multiprocess tournaments between self-play strategies.
+
+A ``Tournament`` shards its games over a ``ProcessPoolExecutor``. Plain-text
+dictionaries are compiled once to the memory-mapped lexicon format, so every
+worker maps the same file instead of parsing its own copy. When
+``default_registry`` has a lexicon cache, the compiled file is kept there for
+later runs. With the ``fork`` start method the parent also loads the lexicon
+and its move generation index before the pool starts, and the workers
+inherit both copy-on-write. Results stream back in batches as workers finish
+them and are aggregated per entrant: a strategy seated twice, as in a mirror
+match, gets one entry per seat.
+
+Usage:
+    python -m scrabble.tournament greedy greedy [--games N] [--workers N]
+"""
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Sequence, Set
+
+from scrabble.layout import get_layout
+from scrabble.lexicon import compile_lexicon, is_compiled_lexicon, read_words
+from scrabble.lexicon_cache import LexiconCache
+from scrabble.registry import default_registry
+from scrabble.simulator import GameResult, Simulator, get_strategy
+from scrabble.wordlist import DictionaryFiles, dictionary_files
+
+# Per-process simulator, set up by ``_init_worker``
+_simulator: Optional[Simulator] = None
+
+
+def _init_worker(
+    strategies: List[str],
+    language: str,
+    dictionary_file: Optional[DictionaryFiles],
+    layout: str,
+) -> None:
+    """Load the shared lexicon once for the lifetime of a worker process."""
+    global _simulator
+    _simulator = Simulator(
+        [get_strategy(name) for name in strategies],
+        language=language,
+        dictionary_file=dictionary_file,
+        layout=layout,
+    )
+    # Never released: the lexicon lives as long as the worker
+    default_registry.acquire(language, dictionary_file).get_gaddag()
+
+
+def _play_batch(games: List[int], seed: int) -> List[GameResult]:
+    """Play a batch of tournament games in a worker process.
+
+    Game ``i`` is played with seed ``seed + i`` and the seats rotated by
+    ``i`` places, so every strategy moves first equally often.
+    """
+    assert _simulator is not None
+    strategies = _simulator.strategies
+    results = []
+    for index in games:
+        shift = index % len(strategies)
+        results.append(
+            _simulator.play(seed + index, strategies[shift:] + strategies[:shift])
+        )
+    return results
+
+
+class StrategyStats:
+    """Aggregated results of one tournament entrant."""
+
+    def __init__(self, name: str):
+        """Initialize empty results.
+
+        Args:
+            name: Entrant name: the strategy name, with ``#`` and the
+                entrant's index appended if the strategy is entered twice
+        """
+        self.name = name
+        self.games = 0
+        self.wins = 0
+        self.ties = 0
+        self.scores: List[int] = []
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of games won outright."""
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_score(self) -> float:
+        """Average final score."""
+        return statistics.mean(self.scores) if self.scores else 0.0
+
+    @property
+    def score_stdev(self) -> float:
+        """Sample standard deviation of the final scores."""
+        return statistics.stdev(self.scores) if len(self.scores) > 1 else 0.0
+
+    def score_histogram(self, bin_width: int = 50) -> Dict[int, int]:
+        """Count final scores per bin.
+
+        Args:
+            bin_width: Width of each bin in points
+
+        Returns:
+            Mapping of bin start to number of scores in the bin
+        """
+        histogram: Dict[int, int] = {}
+        for score in self.scores:
+            start = score // bin_width * bin_width
+            histogram[start] = histogram.get(start, 0) + 1
+        return dict(sorted(histogram.items()))
+
+
+class Tournament:
+    """Plays many games between strategies on a pool of worker processes."""
+
+    def __init__(
+        self,
+        strategies: Sequence[str],
+        games: int,
+        workers: Optional[int] = None,
+        seed: int = 0,
+        language: str = "nl",
+        dictionary_file: Optional[DictionaryFiles] = None,
+        batch_size: Optional[int] = None,
+        layout: str = "standard",
+    ):
+        """Initialize the tournament.
+
+        Args:
+            strategies: Strategy names, one per seat (2 to 4)
+            games: Number of games to play
+            workers: Number of worker processes (defaults to the CPU count)
+            seed: Seed of the first game; game ``i`` uses ``seed + i``
+            language: Language code of the games
+            dictionary_file: Optional path to a plain-text or compiled
+                dictionary, or paths of several word lists to combine
+            batch_size: Games per task sent to a worker. Defaults to a size
+                that gives each worker about eight batches.
+            layout: Name of the registered board layout to play on
+
+        Raises:
+            ValueError: If the number of strategies is wrong, a strategy is
+                unknown, or the layout is unknown
+        """
+        if not 2 <= len(strategies) <= 4:
+            raise ValueError("A game needs 2 to 4 strategies")
+        for name in strategies:
+            get_strategy(name)
+        get_layout(layout)
+        self.strategies = list(strategies)
+        self.games = games
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.language = language
+        self.dictionary_file = dictionary_file
+        self.layout = layout
+        self.batch_size = batch_size or max(1, games // (self.workers * 8))
+        # Name of each entrant, in the order of ``strategies``
+        self.entrants = [
+            name if self.strategies.count(name) == 1 else f"{name}#{i}"
+            for i, name in enumerate(self.strategies)
+        ]
+        self.standings: Dict[str, StrategyStats] = {
+            entrant: StrategyStats(entrant) for entrant in self.entrants
+        }
+        self.games_played = 0
+        self.elapsed = 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """Games finished per second of wall-clock time."""
+        return self.games_played / self.elapsed if self.elapsed else 0.0
+
+    def run(self) -> Iterator[GameResult]:
+        """Play the tournament, yielding each result as its batch finishes.
+
+        ``standings`` is updated before every result is yielded.
+
+        Yields:
+            Game results, in completion order
+        """
+        start = time.perf_counter()
+        with tempfile.TemporaryDirectory() as tmp:
+            dictionary_file = self.dictionary_file
+            files = dictionary_files(dictionary_file)
+            if files and not (len(files) == 1 and is_compiled_lexicon(files[0])):
+                if default_registry.cache_dir:
+                    cache = LexiconCache(default_registry.cache_dir)
+                    dictionary_file = cache.compiled_path(files, self.language)
+                else:
+                    compiled = os.path.join(tmp, "lexicon.lex")
+                    compile_lexicon(read_words(files), compiled)
+                    dictionary_file = compiled
+
+            warm = None
+            if multiprocessing.get_start_method() == "fork":
+                warm = default_registry.acquire(self.language, dictionary_file)
+                warm.get_gaddag()
+            try:
+                with ProcessPoolExecutor(
+                    self.workers,
+                    initializer=_init_worker,
+                    initargs=(
+                        self.strategies,
+                        self.language,
+                        dictionary_file,
+                        self.layout,
+                    ),
+                ) as executor:
+                    pending: Set[Future] = {
+                        executor.submit(
+                            _play_batch,
+                            list(range(i, min(i + self.batch_size, self.games))),
+                            self.seed,
+                        )
+                        for i in range(0, self.games, self.batch_size)
+                    }
+                    while pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            for result in future.result():
+                                self._record(result)
+                                self.elapsed = time.perf_counter() - start
+                                yield result
+            finally:
+                if warm is not None:
+                    default_registry.release(warm)
+
+    def _record(self, result: GameResult) -> None:
+        """Add a finished game to the standings.
+
+        Args:
+            result: Result of the game
+        """
+        self.games_played += 1
+        # Undo the seat rotation of ``_play_batch``
+        shift = (result.seed - self.seed) % len(self.entrants)
+        for seat, name in enumerate(result.strategies):
+            entrant = (seat + shift) % len(self.entrants)
+            assert self.strategies[entrant] == name
+            stats = self.standings[self.entrants[entrant]]
+            stats.games += 1
+            stats.scores.append(result.scores[seat])
+            if result.winner == seat:
+                stats.wins += 1
+            elif result.winner is None and result.scores[seat] == max(result.scores):
+                stats.ties += 1
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a tournament from the command line and print the standings."""
+    parser = argparse.ArgumentParser(description="Run a self-play tournament.")
+    parser.add_argument("strategies", nargs="+", help="strategy name per seat")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--language", default="nl")
+    parser.add_argument(
+        "--dictionary",
+        action="append",
+        help="dictionary file to play with; repeat to combine word lists",
+    )
+    parser.add_argument("--layout", default="standard", help="board layout name")
+    args = parser.parse_args(argv)
+
+    tournament = Tournament(
+        args.strategies,
+        args.games,
+        workers=args.workers,
+        seed=args.seed,
+        language=args.language,
+        dictionary_file=args.dictionary,
+        layout=args.layout,
+    )
+    for _ in tournament.run():
+        pass
+    print(
+        f"{tournament.games_played} games on {tournament.workers} workers in "
+        f"{tournament.elapsed:.2f}s ({tournament.games_per_second:.2f} games/s)"
+    )
+    for stats in tournament.standings.values():
+        print(
+            f"  {stats.name:10s} win rate {stats.win_rate:6.1%}  "
+            f"score {stats.mean_score:6.1f} +/- {stats.score_stdev:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
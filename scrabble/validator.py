@@ -1,40 +1,150 @@
 """Word validator for Scrabble game with Dutch word dictionary."""
 
-import os
-from typing import Optional, Set
+import re
+import time
+from itertools import chain, islice
+from typing import AbstractSet, Iterable, Iterator, Optional, Set
+
+from scrabble.alphabet import get_alphabet
+from scrabble.anagram import AnagramIndex
+from scrabble.gaddag import Gaddag
+from scrabble.lexicon import (
+    HookTable,
+    Lexicon,
+    SetLexicon,
+    build_lexicon,
+    is_compiled_lexicon,
+    load_compiled_lexicon,
+)
+from scrabble.lexicon_cache import LexiconCache
+from scrabble.wordlist import (
+    DictionaryFiles,
+    LoadReport,
+    dictionary_files,
+    notify_load,
+    read_word_lists,
+)
+
+
+class ValidWords(AbstractSet[str]):
+    """Set view of the words a validator accepts."""
+
+    def __init__(self, validator: "WordValidator"):
+        """Initialize the view.
+
+        Args:
+            validator: Validator whose words to show
+        """
+        self._validator = validator
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self._validator.is_valid_word(word)
+
+    def __iter__(self) -> Iterator[str]:
+        return chain(self._validator.lexicon, self._validator.extra_words)
+
+    def __len__(self) -> int:
+        return self._validator.get_word_count()
+
+    def add(self, word: str) -> None:
+        """Add a word, like ``WordValidator.add_word``."""
+        self._validator.add_word(word)
+
+    def update(self, words: Iterable[str]) -> None:
+        """Add several words, like ``WordValidator.add_word``."""
+        for word in words:
+            self._validator.add_word(word)
 
 
 class WordValidator:
     """Validates words against a Dutch dictionary."""
 
-    def __init__(self, dictionary_file: Optional[str] = None):
+    def __init__(
+        self,
+        dictionary_file: Optional[DictionaryFiles] = None,
+        backend: str = "set",
+        lexicon: Optional[Lexicon] = None,
+        language: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+    ):
         """Initialize the word validator.
 
         Args:
-            dictionary_file: Path to dictionary file (optional)
+            dictionary_file: Path to a dictionary file, or paths of several
+                word lists to combine (optional)
+            backend: Lexicon backend, 'set' or 'dawg'. Defaults to 'set'.
+            lexicon: Already loaded lexicon to share instead of loading one.
+                Words added with ``add_word`` stay local to this validator.
+            language: Language of the words. When given, indexes such as the
+                GADDAG use that language's letter codes (see
+                ``scrabble.alphabet``).
+            cache_dir: Directory of compiled lexicons (see
+                ``scrabble.lexicon_cache``). Plain-text word lists are
+                compiled into it once and mapped from it afterwards, whatever
+                the backend.
         """
-        self.valid_words: Set[str] = set()
-        if dictionary_file and os.path.exists(dictionary_file):
+        self.backend = backend
+        self.language = language
+        self.cache_dir = cache_dir
+        self.lexicon: Lexicon = SetLexicon()
+        self.extra_words: Set[str] = set()
+        # Bumped whenever the set of valid words changes
+        self.version = 0
+        self._gaddag: Optional[Gaddag] = None
+        self._gaddag_extra_count = 0
+        self._anagrams: Optional[AnagramIndex] = None
+        self._anagrams_extra_count = 0
+        self._hooks: Optional[HookTable] = None
+        self._hooks_extra_count = 0
+        # Statistics of the dictionary load, if this validator loaded one
+        self.load_report: Optional[LoadReport] = None
+        if lexicon is not None:
+            self.lexicon = lexicon
+        elif dictionary_file:
             self._load_dictionary(dictionary_file)
         else:
             # Initialize with a basic set of common Dutch words
             self._initialize_basic_dictionary()
 
-    def _load_dictionary(self, file_path: str) -> None:
-        """Load dictionary from file.
+    def _load_dictionary(self, file_path: DictionaryFiles) -> None:
+        """Load dictionary from one or more files.
+
+        A compiled lexicon file (see ``scrabble.lexicon.compile_lexicon``) is
+        memory-mapped as-is. Plain-text word lists, compressed or not, are
+        streamed, combined and built with the configured backend (see
+        ``scrabble.wordlist``), or taken from the compiled lexicon cache when
+        there is one. The load is reported to the load listeners.
 
         Args:
-            file_path: Path to dictionary file
+            file_path: Path or paths of the dictionary files
+
+        Raises:
+            OSError: If a file cannot be read or the cache cannot be written
+            ValueError: If a word list is corrupt, or a compiled lexicon is
+                combined with other files
         """
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    word = line.strip().upper()
-                    if word and len(word) >= 2:
-                        self.valid_words.add(word)
-        except Exception as e:
-            print(f"Error loading dictionary: {e}")
-            self._initialize_basic_dictionary()
+        start = time.perf_counter()
+        files = dictionary_files(file_path)
+        compiled = [path for path in files if is_compiled_lexicon(path)]
+        if compiled and len(files) > 1:
+            raise ValueError(
+                f"Compiled lexicon {compiled[0]} cannot be combined with other "
+                "word lists; compile them together instead"
+            )
+        report = LoadReport(files, compiled=bool(compiled))
+        if compiled:
+            self.lexicon = load_compiled_lexicon(compiled[0])
+            report.words = len(self.lexicon)
+        elif self.cache_dir:
+            cache = LexiconCache(self.cache_dir)
+            self.lexicon = cache.load(files, self.language, report)
+            report.compiled = True
+            report.words = len(self.lexicon)
+        else:
+            self.lexicon = build_lexicon(read_word_lists(files, report), self.backend)
+        report.elapsed = time.perf_counter() - start
+        self.load_report = report
+        notify_load(report)
 
     def _initialize_basic_dictionary(self) -> None:
         """Initialize a basic dictionary with common Dutch words for testing."""
@@ -247,7 +357,17 @@ class WordValidator:
             "BANAAN",
         ]
 
-        self.valid_words = set(basic_words)
+        self.lexicon = build_lexicon(basic_words, self.backend)
+
+    @property
+    def valid_words(self) -> "ValidWords":
+        """Set-like view of every valid word, dictionary and added words.
+
+        Kept for code written when the words were a plain set: ``add``
+        goes through ``add_word``. Words cannot be removed, since the
+        dictionary lexicon is shared read-only.
+        """
+        return ValidWords(self)
 
     def add_word(self, word: str) -> None:
         """Add a word to the dictionary.
@@ -255,7 +375,10 @@ class WordValidator:
         Args:
             word: Word to add
         """
-        self.valid_words.add(word.upper())
+        word = word.upper()
+        if word not in self.lexicon and word not in self.extra_words:
+            self.extra_words.add(word)
+            self.version += 1
 
     def is_valid_word(self, word: str) -> bool:
         """Check if a word is valid.
@@ -268,7 +391,125 @@ class WordValidator:
         """
         if not word or len(word) < 2:
             return False
-        return word.upper() in self.valid_words
+        word = word.upper()
+        return word in self.lexicon or word in self.extra_words
+
+    def is_valid_prefix(self, prefix: str) -> bool:
+        """Check if any valid word starts with the given prefix.
+
+        Args:
+            prefix: Prefix to check
+
+        Returns:
+            True if at least one word starts with the prefix, False otherwise
+        """
+        prefix = prefix.upper()
+        if self.lexicon.has_prefix(prefix):
+            return True
+        return any(word.startswith(prefix) for word in self.extra_words)
+
+    def match(
+        self,
+        pattern: str,
+        limit: Optional[int] = None,
+        time_budget: Optional[float] = None,
+    ) -> Iterator[str]:
+        """Stream the valid words matching a wildcard pattern.
+
+        ``?`` stands for any one letter and ``*`` for any run of letters,
+        possibly empty: ``?A?T``, ``B??T*``, or ``?K???`` for the five-letter
+        words with K second. The search walks the lexicon's word graph, so it
+        only visits prefixes the pattern allows, and yields words as it finds
+        them.
+
+        Args:
+            pattern: Pattern to match, in any case
+            limit: Maximum number of words to yield
+            time_budget: Seconds after which to stop searching, counted from
+                the first request for a word. Words found so far are kept.
+
+        Returns:
+            Iterator over the matching words; dictionary words come in
+            sorted order, followed by words added with ``add_word``
+        """
+        pattern = pattern.upper()
+        deadline = None
+        if time_budget is not None:
+            deadline = time.perf_counter() + time_budget
+        matches = self.lexicon.match(pattern, deadline)
+        if self.extra_words:
+            regex = re.compile(
+                "".join(
+                    (
+                        ".*"
+                        if symbol == "*"
+                        else "." if symbol == "?" else re.escape(symbol)
+                    )
+                    for symbol in pattern
+                )
+            )
+            added = sorted(word for word in self.extra_words if regex.fullmatch(word))
+            matches = chain(matches, added)
+        yield from islice(matches, limit)
+
+    def get_gaddag(self) -> Gaddag:
+        """Get a GADDAG over all valid words, for move generation.
+
+        The GADDAG of the lexicon itself is built once and shared by every
+        validator using that lexicon. Validators with words added through
+        ``add_word`` build their own copy that includes them.
+
+        Returns:
+            GADDAG over the dictionary words
+        """
+        alphabet = get_alphabet(self.language) if self.language else None
+        if not self.extra_words:
+            return self.lexicon.cached_index(
+                f"gaddag:{self.language}", lambda: Gaddag(self.lexicon, alphabet)
+            )
+        if self._gaddag is None or self._gaddag_extra_count != len(self.extra_words):
+            self._gaddag = Gaddag(chain(self.lexicon, self.extra_words), alphabet)
+            self._gaddag_extra_count = len(self.extra_words)
+        return self._gaddag
+
+    def get_anagram_index(self) -> AnagramIndex:
+        """Get an anagram index over all valid words, for rack lookups.
+
+        Shared between validators like the GADDAG (see ``get_gaddag``).
+
+        Returns:
+            Anagram index over the dictionary words
+        """
+        alphabet = get_alphabet(self.language) if self.language else None
+        if not self.extra_words:
+            return self.lexicon.cached_index(
+                f"anagrams:{self.language}",
+                lambda: AnagramIndex(self.lexicon, alphabet),
+            )
+        extra_count = len(self.extra_words)
+        if self._anagrams is None or self._anagrams_extra_count != extra_count:
+            words = chain(self.lexicon, self.extra_words)
+            self._anagrams = AnagramIndex(words, alphabet)
+            self._anagrams_extra_count = extra_count
+        return self._anagrams
+
+    def get_hook_table(self) -> HookTable:
+        """Get the front and back hooks of all valid words, for cross-checks.
+
+        Compiled lexicons carry the table in the file; other lexicons build
+        it on first use. It is shared between validators like the GADDAG
+        (see ``get_gaddag``).
+
+        Returns:
+            Hook table over the dictionary words
+        """
+        if not self.extra_words:
+            return self.lexicon.hook_table()
+        extra_count = len(self.extra_words)
+        if self._hooks is None or self._hooks_extra_count != extra_count:
+            self._hooks = HookTable.from_words(chain(self.lexicon, self.extra_words))
+            self._hooks_extra_count = extra_count
+        return self._hooks
 
     def get_word_count(self) -> int:
         """Get the number of words in the dictionary.
@@ -276,4 +517,4 @@ class WordValidator:
         Returns:
             Number of words
         """
-        return len(self.valid_words)
+        return len(self.lexicon) + len(self.extra_words)
@@ -0,0 +1,204 @@
+"""Streaming word list loader.
+
+Word lists are plain text with one word per line, optionally compressed with
+gzip, xz or bzip2; the compression is recognised from the file's first bytes.
+Several lists can be loaded in one call, such as a base list followed by
+house-rule additions. Lines are decoded and normalised as they stream in, so
+memory holds the distinct words found so far and never a whole file.
+
+Every dictionary load is reported to the listeners registered with
+``add_load_listener`` as a ``LoadReport``, for logging or metrics::
+
+    add_load_listener(lambda report: print(report))
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import time
+from typing import IO, Callable, Dict, Iterator, List, Optional, Sequence, Set, Union
+
+# Paths of the word lists making up one dictionary
+DictionaryFiles = Union[str, Sequence[str]]
+
+# Leading bytes of each supported compression format
+_COMPRESSED_OPENERS: Dict[bytes, Callable[..., IO]] = {
+    b"\x1f\x8b": gzip.open,
+    b"\xfd7zXZ\x00": lzma.open,
+    b"BZh": bz2.open,
+}
+_MAGIC_LENGTH = max(len(magic) for magic in _COMPRESSED_OPENERS)
+
+
+class LoadReport:
+    """Statistics of one dictionary load."""
+
+    __slots__ = (
+        "files",
+        "compiled",
+        "cache_hit",
+        "lines",
+        "words",
+        "duplicates",
+        "skipped",
+        "elapsed",
+    )
+
+    def __init__(self, files: Sequence[str], compiled: bool = False):
+        """Initialize an empty report.
+
+        Args:
+            files: Paths of the word lists being loaded
+            compiled: Whether the dictionary is a mapped compiled lexicon
+        """
+        self.files = tuple(files)
+        self.compiled = compiled
+        # Whether a compiled lexicon cache had the dictionary, None if unused
+        self.cache_hit: Optional[bool] = None
+        self.lines = 0
+        self.words = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self.elapsed = 0.0
+
+    def to_dict(self) -> Dict:
+        """Get the report as a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return (
+            f"LoadReport(files={len(self.files)}, words={self.words}, "
+            f"duplicates={self.duplicates}, elapsed={self.elapsed:.3f}s)"
+        )
+
+
+LoadListener = Callable[[LoadReport], None]
+
+_listeners: List[LoadListener] = []
+
+
+def add_load_listener(listener: LoadListener) -> None:
+    """Call a function with the report of every dictionary load.
+
+    Args:
+        listener: Function taking a ``LoadReport``
+    """
+    _listeners.append(listener)
+
+
+def remove_load_listener(listener: LoadListener) -> None:
+    """Stop calling a function added with ``add_load_listener``.
+
+    Args:
+        listener: Function to remove
+
+    Raises:
+        ValueError: If the listener was not added
+    """
+    _listeners.remove(listener)
+
+
+def notify_load(report: LoadReport) -> None:
+    """Pass a finished load report to every listener.
+
+    Args:
+        report: Report to publish
+    """
+    for listener in list(_listeners):
+        listener(report)
+
+
+def dictionary_files(files: Optional[DictionaryFiles]) -> List[str]:
+    """Normalise a dictionary argument to a list of paths.
+
+    Args:
+        files: One path, several paths, or None
+
+    Returns:
+        The paths, in order
+    """
+    if not files:
+        return []
+    if isinstance(files, str):
+        return [files]
+    return list(files)
+
+
+def open_word_list(file_path: str) -> IO[str]:
+    """Open a word list as text, decompressing it if needed.
+
+    Args:
+        file_path: Path to a plain, gzip, xz or bzip2 word list
+
+    Returns:
+        Text stream of the decompressed contents; a leading byte order mark
+        is dropped
+    """
+    with open(file_path, "rb") as f:
+        magic = f.read(_MAGIC_LENGTH)
+    for prefix, opener in _COMPRESSED_OPENERS.items():
+        if magic.startswith(prefix):
+            return io.TextIOWrapper(opener(file_path, "rb"), encoding="utf-8-sig")
+    return open(file_path, "r", encoding="utf-8-sig")
+
+
+def _normalised_words(files: List[str], report: LoadReport) -> Iterator[str]:
+    """Stream the playable words of word lists, duplicates included.
+
+    Args:
+        files: Paths of the word lists, read in order
+        report: Report to count lines and skipped lines into
+
+    Yields:
+        Each word, stripped and uppercased
+
+    Raises:
+        OSError: If a file cannot be opened
+        ValueError: If a file is not valid UTF-8 text or is corrupt
+    """
+    for file_path in files:
+        with open_word_list(file_path) as f:
+            try:
+                for line in f:
+                    report.lines += 1
+                    word = line.strip().upper()
+                    # Single letters can never be played
+                    if len(word) < 2:
+                        report.skipped += 1
+                    else:
+                        yield word
+            except (EOFError, OSError, lzma.LZMAError, UnicodeDecodeError) as e:
+                raise ValueError(f"Cannot read word list {file_path}: {e}") from e
+
+
+def read_word_lists(
+    files: DictionaryFiles, report: Optional[LoadReport] = None
+) -> Set[str]:
+    """Read the distinct words of one or more word lists.
+
+    Args:
+        files: Path or paths of the word lists, read in order
+        report: Report to count lines, words and duplicates into; its
+            ``elapsed`` is set to the reading time
+
+    Returns:
+        Set of normalised words
+
+    Raises:
+        OSError: If a file cannot be opened
+        ValueError: If a file is not valid UTF-8 text or is corrupt
+    """
+    start = time.perf_counter()
+    paths = dictionary_files(files)
+    if report is None:
+        report = LoadReport(paths)
+    words: Set[str] = set()
+    for word in _normalised_words(paths, report):
+        if word in words:
+            report.duplicates += 1
+        else:
+            words.add(word)
+    report.words = len(words)
+    report.elapsed = time.perf_counter() - start
+    return words
@@ -0,0 +1,156 @@
+"""Zobrist hashing of positions and a bounded transposition table.
+
+A Zobrist hash XORs together one random 64-bit key per feature of a position
+(a letter on a square, a tile on a rack, the player to move). Because XOR is
+its own inverse, adding or removing a tile updates the hash in O(1). Keys are
+derived from a cryptographic hash of the feature rather than drawn from a
+random generator, so they are identical in every process and across runs.
+"""
+
+import hashlib
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+_keys: Dict[Tuple[str, int, str, int], int] = {}
+
+
+def zobrist_key(kind: str, index: int, letter: str, extra: int = 0) -> int:
+    """Get the 64-bit key of one feature of a position.
+
+    Args:
+        kind: Feature type, e.g. 'square', 'blank', 'rack' or 'turn'
+        index: Square index, seat number or similar
+        letter: Letter involved, or '' if none
+        extra: Further distinguishing number, e.g. the copy of a rack letter
+
+    Returns:
+        Key in the range [0, 2**64)
+    """
+    feature = (kind, index, letter, extra)
+    key = _keys.get(feature)
+    if key is None:
+        digest = hashlib.blake2b(
+            f"{kind}:{index}:{letter}:{extra}".encode("utf-8"), digest_size=8
+        ).digest()
+        key = _keys[feature] = int.from_bytes(digest, "little")
+    return key
+
+
+def square_key(index: int, letter: str, is_blank: bool) -> int:
+    """Get the key of a letter on a board square.
+
+    Args:
+        index: Square index, ``row * size + col``
+        letter: Letter shown on the tile
+        is_blank: Whether the tile is a blank standing for ``letter``
+
+    Returns:
+        64-bit key
+    """
+    return zobrist_key("blank" if is_blank else "square", index, letter)
+
+
+def rack_key(seat: int, letter: str, copy: int) -> int:
+    """Get the key of the ``copy``-th tile of a letter on a player's rack.
+
+    Keying every copy separately makes the rack hash depend on how many of
+    each letter a player holds, not on the order of the tiles.
+
+    Args:
+        seat: Player id
+        letter: Tile letter, '*' for blanks
+        copy: 0 for the first tile of that letter, 1 for the second, ...
+
+    Returns:
+        64-bit key
+    """
+    return zobrist_key("rack", seat, letter, copy)
+
+
+def turn_key(seat: int) -> int:
+    """Get the key of the player to move.
+
+    Args:
+        seat: Index of the current player
+
+    Returns:
+        64-bit key
+    """
+    return zobrist_key("turn", seat, "")
+
+
+class TranspositionTable(Generic[V]):
+    """Fixed-size hash table of search results keyed by Zobrist hash.
+
+    Each hash maps to one slot (its low bits); storing a different position
+    in an occupied slot replaces it. Memory therefore stays bounded however
+    long a search runs. Full hashes are kept to tell positions that share a
+    slot apart.
+    """
+
+    def __init__(self, size: int = 1 << 16):
+        """Initialize an empty table.
+
+        Args:
+            size: Number of slots, rounded up to a power of two
+        """
+        if size < 1:
+            raise ValueError("Table size must be positive")
+        slots = 1 << (size - 1).bit_length()
+        self._mask = slots - 1
+        self._keys: List[Optional[int]] = [None] * slots
+        self._values: List[Optional[V]] = [None] * slots
+        self._count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: int, default: Optional[V] = None) -> Optional[V]:
+        """Look up a position.
+
+        Args:
+            key: Zobrist hash of the position
+            default: Value to return if the position is not stored
+
+        Returns:
+            Stored value, or ``default``
+        """
+        slot = key & self._mask
+        if self._keys[slot] == key:
+            self.hits += 1
+            return self._values[slot]
+        self.misses += 1
+        return default
+
+    def store(self, key: int, value: V) -> None:
+        """Store a value for a position, replacing whatever held its slot.
+
+        Args:
+            key: Zobrist hash of the position
+            value: Value to store
+        """
+        slot = key & self._mask
+        if self._keys[slot] is None:
+            self._count += 1
+        self._keys[slot] = key
+        self._values[slot] = value
+
+    def clear(self) -> None:
+        """Remove every stored value and reset the statistics."""
+        slots = self._mask + 1
+        self._keys = [None] * slots
+        self._values = [None] * slots
+        self._count = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of slots in the table."""
+        return self._mask + 1
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, int) and self._keys[key & self._mask] == key
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,67 @@
+"""Tests for the per-language letter codes."""
+
+import pytest
+
+from scrabble.alphabet import EMPTY, Alphabet, get_alphabet
+from scrabble.board import Board
+from scrabble.tile import Tile
+
+
+class TestAlphabet:
+    """Test Alphabet."""
+
+    def test_round_trip(self):
+        alphabet = get_alphabet("nl")
+        encoded = alphabet.encode("KATER")
+        assert EMPTY not in encoded
+        assert alphabet.decode(encoded) == "KATER"
+        assert alphabet.blank_code == len(alphabet) + 1
+        assert alphabet.size == len(alphabet) + 2
+
+    def test_languages(self):
+        assert "Ä" in get_alphabet("fi").codes
+        assert "*" not in get_alphabet("en").codes
+        assert get_alphabet("en") is get_alphabet("en")
+
+    def test_unknown_letter(self):
+        alphabet = get_alphabet("en")
+        with pytest.raises(ValueError):
+            alphabet.code("Ö")
+        with pytest.raises(ValueError):
+            alphabet.encode("KÖÖK")
+
+    def test_extended_keeps_codes(self):
+        alphabet = Alphabet("xx", "BA")
+        extended = alphabet.extended("CAB")
+        assert extended.letters == ("B", "A", "C")
+        assert alphabet.extended("AB") is alphabet
+        with pytest.raises(ValueError):
+            Alphabet("xx", "AA")
+
+
+class TestBoardCodes:
+    """Test the letter codes kept by the board."""
+
+    def test_follow_placement(self):
+        board = Board(get_alphabet("en"))
+        board.place_tile(7, 7, Tile("Q", 10))
+        blank = Tile("*", 0)
+        blank.set_blank_letter("U")
+        board.place_tile(7, 8, blank)
+        board.place_tile(7, 9, Tile("Ö", 1))
+        index = 7 * board.size + 7
+        codes = board.letter_codes[index : index + 3]
+        assert list(codes) == [
+            board.alphabet.code("Q"),
+            board.alphabet.code("U"),
+            len(get_alphabet("en")) + 1,
+        ]
+        assert board.get_word_at(7, 9, "H")[0] == "QUÖ"
+        assert board.transposed_codes[8 * board.size + 7] == codes[1]
+        assert board.tile_points[index] == 10
+        assert list(board.blank_flags[index : index + 3]) == [0, 1, 0]
+        board.remove_tile(7, 7)
+        assert board.letter_codes[index] == EMPTY
+        assert board.transposed_codes[index] == EMPTY
+        assert board.tile_points[index] == 0
+        assert board.copy().letter_codes == board.letter_codes
@@ -0,0 +1,50 @@
+"""Tests for the anagram index."""
+
+from scrabble.anagram import AnagramIndex
+from scrabble.lexicon import SetLexicon
+from scrabble.validator import WordValidator
+
+WORDS = ["KAT", "TAK", "AKTE", "TAKEN", "ETEN", "TE", "KATTEN", "NET", "TENT"]
+
+
+class TestAnagramIndex:
+    """Test AnagramIndex."""
+
+    def test_anagrams_use_every_letter(self):
+        index = AnagramIndex(WORDS)
+        assert index.anagrams("TKA") == ["KAT", "TAK"]
+        assert index.anagrams("kat") == ["KAT", "TAK"]
+        assert index.anagrams("NEKAT") == ["TAKEN"]
+        assert index.anagrams("KATE") == ["AKTE"]
+        assert index.anagrams("KATS") == []
+
+    def test_blanks(self):
+        index = AnagramIndex(WORDS)
+        assert index.anagrams("KA*") == ["KAT", "TAK"]
+        assert index.anagrams("K**") == ["KAT", "TAK"]
+        assert index.anagrams("**") == ["TE"]
+        assert index.anagrams("TTKNE**") == []
+        assert index.anagrams("TTKNE*") == ["KATTEN"]
+
+    def test_subanagrams(self):
+        index = AnagramIndex(WORDS)
+        assert index.subanagrams("TAKENX") == [
+            "TAKEN",
+            "AKTE",
+            "KAT",
+            "NET",
+            "TAK",
+            "TE",
+        ]
+        assert index.subanagrams("TAKEN", min_length=4) == ["TAKEN", "AKTE"]
+        assert index.subanagrams("ET*") == ["NET", "TE"]
+        assert index.subanagrams("Q") == []
+
+    def test_validator_shares_index(self):
+        lexicon = SetLexicon(WORDS)
+        first = WordValidator(lexicon=lexicon, language="nl")
+        second = WordValidator(lexicon=lexicon, language="nl")
+        assert first.get_anagram_index() is second.get_anagram_index()
+        first.add_word("KAST")
+        assert first.get_anagram_index().anagrams("STAK") == ["KAST"]
+        assert second.get_anagram_index().anagrams("STAK") == []
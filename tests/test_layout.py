@@ -0,0 +1,120 @@
+"""Tests for board layouts."""
+
+import copy
+import random
+
+import pytest
+
+from scrabble.board import Board
+from scrabble.game import Game
+from scrabble.layout import Layout, get_layout, register_layout
+from tests.test_movegen import make_rack, placement_score
+
+# 21x21 test geometry with quadruple premiums
+BIG_ROWS = [
+    "Q....d.....T.....d..Q",
+    ".D.......t.........D.",
+    "..D.....d.d.......D..",
+    "...D.....q.......D...",
+    "....D...........D....",
+    ".....t.........t.....",
+    "d.....d.......d.....d",
+    ".......D.....D.......",
+    "........d...d........",
+    ".........t.t.........",
+    "T.........*.........T",
+    ".........t.t.........",
+    "........d...d........",
+    ".......D.....D.......",
+    "d.....d.......d.....d",
+    ".....t.........t.....",
+    "....D...........D....",
+    "...D.............D...",
+    "..D...............D..",
+    ".D.................D.",
+    "Q....d.....T.....d..Q",
+]
+
+
+class TestLayout:
+    """Test Layout and the layout registry."""
+
+    def test_standard_layout(self):
+        layout = get_layout()
+        assert layout is get_layout("standard")
+        assert (layout.size, layout.center) == (15, (7, 7))
+        assert layout.premium_squares[(0, 0)] == "TW"
+        assert layout.premium_squares[(1, 5)] == "TL"
+        assert layout.premium_squares[(7, 7)] == "CENTER"
+        assert len(layout.premium_squares) == 61
+
+    def test_boards_share_layout(self):
+        first, second = Board(), Board()
+        assert first.layout is second.layout
+        assert first.letter_multipliers is second.letter_multipliers
+        clone = copy.deepcopy(first)
+        assert clone.layout is first.layout
+        assert clone.premium_squares is first.premium_squares
+
+    def test_from_rows(self):
+        layout = Layout.from_rows("big", BIG_ROWS)
+        assert (layout.size, layout.center) == (21, (10, 10))
+        assert layout.premium_squares[(0, 0)] == "QW"
+        assert layout.premium_squares[(3, 9)] == "QL"
+        index = 3 * 21 + 9
+        assert layout.letter_multipliers[index] == 4
+        assert layout.transposed_letter_multipliers[9 * 21 + 3] == 4
+        assert layout.word_multipliers[0] == 4
+
+    def test_invalid_layouts(self):
+        with pytest.raises(ValueError):
+            Layout.from_rows("ragged", ["...", "..", "..."])
+        with pytest.raises(ValueError):
+            Layout.from_rows("symbol", ["..", ".x"])
+        with pytest.raises(ValueError):
+            Layout("off", 5, {(5, 0): "DW"})
+        with pytest.raises(ValueError):
+            Layout("premium", 5, {(0, 0): "XX"})
+        with pytest.raises(ValueError):
+            get_layout("no-such-layout")
+
+
+@pytest.fixture(scope="module")
+def layout():
+    return register_layout(Layout.from_rows("test-21", BIG_ROWS))
+
+
+class TestCustomLayout:
+    """Test playing on a registered 21x21 layout."""
+
+    def test_board_geometry(self, layout):
+        board = Board(layout="test-21")
+        assert board.layout is layout
+        assert board.size == 21
+        assert board.is_center(10, 10)
+        assert not board.is_center(7, 7)
+        assert board.is_valid_position(20, 20)
+        assert not board.is_valid_position(21, 0)
+        assert board.get_premium_square(0, 0) == "QW"
+
+    def test_first_move_covers_center(self, layout):
+        game = Game(["Alice", "Bob"], layout=layout)
+        game.get_current_player().rack = make_rack("KATEOSL")
+        moves = game.generate_moves()
+        assert moves
+        for move in moves:
+            assert any((row, col) == (10, 10) for row, col, _, _ in move.tiles)
+
+    def test_scores_match_reference(self, layout):
+        game = Game(["Alice", "Bob"], rng=random.Random(4), layout=layout)
+        for _ in range(8):
+            moves = game.generate_moves()
+            for move in moves:
+                assert placement_score(game, move) == move.score
+            if not moves:
+                game.pass_turn()
+                continue
+            rack = game.get_current_player().rack
+            success, _, score = game.place_word(moves[0].to_placement(rack))
+            assert success
+            assert score == moves[0].score
@@ -0,0 +1,278 @@
+"""Tests for the lexicon backends."""
+
+import os
+import struct
+import time
+
+import pytest
+
+from scrabble.lexicon import (
+    DawgLexicon,
+    HookTable,
+    Lexicon,
+    MappedDawgLexicon,
+    SetLexicon,
+    build_lexicon,
+    compile_lexicon,
+    is_compiled_lexicon,
+    load_compiled_lexicon,
+)
+from scrabble.validator import WordValidator
+
+WORDS = ["KAT", "KATTEN", "KATER", "HOND", "HONDEN", "BOOT", "BOTEN", "ZON"]
+
+# Header of the compiled format: magic, version, word count, node count, edge
+# count, root, alphabet size in bytes
+FILE_HEADER = struct.Struct("<8sIIIIII")
+
+
+def version_1_file(data):
+    """Cut a compiled lexicon down to the version 1 format.
+
+    Version 1 files end after the forward graph: the node offsets and edge
+    targets as uint32, then one byte per edge label and per node.
+    """
+    magic, _, words, nodes, edges, root, alphabet = FILE_HEADER.unpack_from(data)
+    end = FILE_HEADER.size + alphabet + 4 * (nodes + 1) + 5 * edges + nodes
+    header = FILE_HEADER.pack(magic, 1, words, nodes, edges, root, alphabet)
+    return header + data[FILE_HEADER.size : end]
+
+
+class TestDawgLexicon:
+    """Test the DAWG lexicon backend."""
+
+    def test_contains(self):
+        lexicon = DawgLexicon.from_words(WORDS)
+        for word in WORDS:
+            assert word in lexicon
+        assert "KA" not in lexicon
+        assert "KATTE" not in lexicon
+        assert "XYZ" not in lexicon
+        assert len(lexicon) == len(WORDS)
+
+    def test_has_prefix(self):
+        lexicon = DawgLexicon.from_words(WORDS)
+        assert lexicon.has_prefix("KAT")
+        assert lexicon.has_prefix("HOND")
+        assert lexicon.has_prefix("BO")
+        assert not lexicon.has_prefix("BA")
+        assert not lexicon.has_prefix("Q")
+
+    def test_iteration_matches_input(self):
+        lexicon = DawgLexicon.from_words(WORDS)
+        assert sorted(lexicon) == sorted(WORDS)
+
+    def test_suffixes_are_shared(self):
+        words = [
+            stem + suffix
+            for stem in ("KAT", "HOND", "BOOM")
+            for suffix in ("", "EN", "JE")
+        ]
+        lexicon = DawgLexicon.from_words(words)
+        # A trie would need one node per distinct prefix; minimization merges
+        # the identical suffix trees hanging off every stem.
+        prefixes = {word[:i] for word in words for i in range(len(word) + 1)}
+        assert lexicon.node_count() < len(prefixes)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            build_lexicon(WORDS, "btree")
+
+
+class TestCompiledLexicon:
+    """Test the compiled, memory-mapped lexicon format."""
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "words.lex")
+        compile_lexicon(WORDS + ["ÄITI"], path)
+        assert is_compiled_lexicon(path)
+        lexicon = load_compiled_lexicon(path)
+        try:
+            assert sorted(lexicon) == sorted(WORDS + ["ÄITI"])
+            assert "KATER" in lexicon
+            assert "ÄITI" in lexicon
+            assert "KATE" not in lexicon
+            assert lexicon.has_prefix("BOT")
+            assert not lexicon.has_prefix("BOX")
+        finally:
+            lexicon.close()
+
+    def test_recompile_keeps_mapped_copy(self, tmp_path):
+        path = str(tmp_path / "words.lex")
+        compile_lexicon(WORDS, path)
+        old = load_compiled_lexicon(path)
+        try:
+            compile_lexicon(["ZO"], path)
+            assert sorted(old) == sorted(WORDS)
+            assert "KATER" in old and "ZO" not in old
+            assert sorted(os.listdir(tmp_path)) == ["words.lex"]
+            assert os.stat(path).st_mode & 0o777 == 0o644
+        finally:
+            old.close()
+        new = load_compiled_lexicon(path)
+        assert list(new) == ["ZO"]
+        new.close()
+
+    def test_rejects_truncated_files(self, tmp_path):
+        path = tmp_path / "words.lex"
+        compile_lexicon(WORDS, str(path))
+        data = path.read_bytes()
+        for size in range(1, len(data)):
+            path.write_bytes(data[:size])
+            with pytest.raises(ValueError):
+                MappedDawgLexicon(str(path))
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "words.txt"
+        path.write_text("KAT\n", encoding="utf-8")
+        assert not is_compiled_lexicon(str(path))
+        with pytest.raises(ValueError):
+            MappedDawgLexicon(str(path))
+
+    def test_validator_maps_compiled_file(self, tmp_path):
+        path = str(tmp_path / "words.lex")
+        compile_lexicon(WORDS, path)
+        validator = WordValidator(path)
+        assert isinstance(validator.lexicon, MappedDawgLexicon)
+        assert validator.is_valid_word("honden")
+        assert not validator.is_valid_word("HOND?")
+        assert validator.get_word_count() == len(WORDS)
+
+
+class TestValidatorBackends:
+    """Test WordValidator with each lexicon backend."""
+
+    @pytest.mark.parametrize("backend", ["set", "dawg"])
+    def test_basic_dictionary(self, backend):
+        validator = WordValidator(backend=backend)
+        assert validator.is_valid_word("kat")
+        assert not validator.is_valid_word("XYZ")
+        assert validator.is_valid_prefix("HON")
+        assert not validator.is_valid_prefix("XQ")
+
+    @pytest.mark.parametrize("backend", ["set", "dawg"])
+    def test_add_word(self, backend):
+        validator = WordValidator(backend=backend)
+        count = validator.get_word_count()
+        validator.add_word("spelers")
+        assert validator.is_valid_word("SPELERS")
+        assert validator.is_valid_prefix("SPELE")
+        assert validator.get_word_count() == count + 1
+
+    def test_backends_agree(self, tmp_path):
+        dictionary = tmp_path / "words.txt"
+        dictionary.write_text("\n".join(WORDS + ["a", "  zee "]), encoding="utf-8")
+        set_validator = WordValidator(str(dictionary))
+        dawg_validator = WordValidator(str(dictionary), backend="dawg")
+        assert isinstance(set_validator.lexicon, SetLexicon)
+        assert sorted(set_validator.valid_words) == sorted(dawg_validator.valid_words)
+        assert dawg_validator.is_valid_word("ZEE")
+        assert not dawg_validator.is_valid_word("A")
+
+    def test_valid_words_is_set_like(self):
+        validator = WordValidator(lexicon=SetLexicon(WORDS))
+        words = validator.valid_words
+        words.add("vis")
+        assert validator.is_valid_word("VIS")
+        assert "VIS" in words and "KAT" in words and 3 not in words
+        assert len(words) == len(WORDS) + 1
+        assert words >= {"KAT", "VIS"}
+
+    def test_lexicon_is_abstract(self):
+        with pytest.raises(TypeError):
+            Lexicon()  # type: ignore[abstract]
+
+
+class TestPatternMatch:
+    """Test wildcard pattern queries."""
+
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            ("?AT", ["KAT"]),
+            ("KAT", ["KAT"]),
+            ("KAT*", ["KAT", "KATER", "KATTEN"]),
+            ("*EN", ["BOTEN", "HONDEN", "KATTEN"]),
+            ("?O??", ["BOOT", "HOND"]),
+            ("*O*N", ["BOTEN", "HONDEN", "ZON"]),
+            ("B**T*", ["BOOT", "BOTEN"]),
+            ("?", []),
+        ],
+    )
+    def test_backends_agree(self, tmp_path, pattern, expected):
+        path = str(tmp_path / "words.lex")
+        compile_lexicon(WORDS, path)
+        mapped = load_compiled_lexicon(path)
+        try:
+            for lexicon in [SetLexicon(WORDS), DawgLexicon.from_words(WORDS), mapped]:
+                assert list(lexicon.match(pattern)) == expected
+        finally:
+            mapped.close()
+
+    def test_validator_match(self):
+        validator = WordValidator(lexicon=SetLexicon(WORDS))
+        validator.add_word("kaas")
+        assert list(validator.match("ka*")) == ["KAT", "KATER", "KATTEN", "KAAS"]
+        assert list(validator.match("*", limit=2)) == ["BOOT", "BOTEN"]
+
+    def test_deadline_stops_search(self):
+        words = [a + b + c for a in "BKLT" for b in "AEIOU" for c in "DKNST"]
+        lexicon = DawgLexicon.from_words(w + s for w in words for s in ["", "EN"])
+        assert len(list(lexicon.match("*"))) == 200
+        assert len(list(lexicon.match("*", time.perf_counter() - 1))) < 200
+
+    def test_deadline_covers_graph_build(self):
+        lexicon = SetLexicon(
+            f"{a}{b}{c}" for a in "KLMN" for b in "AEIOU" for c in "KLMN"
+        )
+        assert list(lexicon.match("*", time.perf_counter() - 1)) == []
+        assert "dawg" not in lexicon.__dict__.get("_indexes", {})
+        assert len(list(lexicon.match("*"))) == 80
+
+
+class TestHookTable:
+    """Test the front and back hook table."""
+
+    def check(self, hooks):
+        assert hooks.letters(hooks.back_hooks("KATE")) == {"R"}
+        assert hooks.letters(hooks.back_hooks("BOTE")) == {"N"}
+        assert hooks.letters(hooks.front_hooks("ON")) == {"Z"}
+        assert hooks.letters(hooks.front_hooks("ATTEN")) == {"K"}
+        assert hooks.letters(hooks.hooks("KAT", "EN")) == {"T"}
+        assert hooks.hooks("KAT", "X") == 0
+        assert hooks.back_hooks("XYZ") == 0
+        assert hooks.mask("RXZ") == hooks.back_hooks("KATE") | hooks.front_hooks("ON")
+
+    def test_built_from_words(self):
+        self.check(HookTable.from_words(WORDS))
+        self.check(SetLexicon(WORDS).hook_table())
+
+    def test_compiled_file_carries_table(self, tmp_path):
+        path = str(tmp_path / "words.lex")
+        compile_lexicon(WORDS, path)
+        lexicon = load_compiled_lexicon(path)
+        try:
+            hooks = lexicon.hook_table()
+            assert hooks.forward is lexicon
+            assert isinstance(hooks.backward, MappedDawgLexicon)
+            self.check(hooks)
+        finally:
+            lexicon.close()
+
+    def test_version_1_file(self, tmp_path):
+        path = tmp_path / "words.lex"
+        compile_lexicon(WORDS, str(path))
+        path.write_bytes(version_1_file(path.read_bytes()))
+        lexicon = MappedDawgLexicon(str(path))
+        try:
+            assert sorted(lexicon) == sorted(WORDS)
+            self.check(lexicon.hook_table())
+        finally:
+            lexicon.close()
+
+    def test_validator_includes_added_words(self):
+        validator = WordValidator(lexicon=SetLexicon(WORDS))
+        assert validator.get_hook_table() is validator.lexicon.hook_table()
+        validator.add_word("katers")
+        hooks = validator.get_hook_table()
+        assert hooks.letters(hooks.back_hooks("KATER")) == {"S"}
@@ -0,0 +1,99 @@
+"""Tests for the compiled lexicon cache."""
+
+import os
+
+import pytest
+
+import scrabble.lexicon_cache as lexicon_cache
+from scrabble.lexicon import MappedDawgLexicon
+from scrabble.lexicon_cache import LexiconCache
+from scrabble.registry import ValidatorRegistry, default_registry
+from scrabble.tournament import Tournament
+from scrabble.validator import WordValidator
+
+
+@pytest.fixture
+def words(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("KAT\nKATTEN\nAT\nTA\nTAK\nKAN\nNA\n", encoding="utf-8")
+    return str(path)
+
+
+class TestLexiconCache:
+    """Test LexiconCache."""
+
+    def test_miss_then_hit(self, tmp_path, words):
+        cache_dir = str(tmp_path / "cache")
+        cold = WordValidator(words, language="nl", cache_dir=cache_dir)
+        assert cold.load_report.cache_hit is False
+        assert cold.load_report.lines == 7
+        warm = WordValidator(words, language="nl", cache_dir=cache_dir)
+        assert warm.load_report.cache_hit is True
+        assert warm.load_report.compiled
+        assert isinstance(warm.lexicon, MappedDawgLexicon)
+        assert sorted(warm.lexicon) == sorted(cold.lexicon)
+        assert len(os.listdir(cache_dir)) == 1
+        cold.lexicon.close()
+        warm.lexicon.close()
+
+    def test_key(self, tmp_path, words, monkeypatch):
+        cache = LexiconCache(str(tmp_path / "cache"))
+        key = cache.key(words, "nl")
+        assert cache.key([words], "nl") == key
+        assert cache.key(words, "en") != key
+        assert cache.key([words, words], "nl") != key
+        monkeypatch.setattr(lexicon_cache, "LEXICON_FORMAT_VERSION", 99)
+        assert cache.key(words, "nl") != key
+        monkeypatch.undo()
+        with open(words, "a", encoding="utf-8") as f:
+            f.write("NAT\n")
+        assert cache.key(words, "nl") != key
+
+    def test_corrupt_file_is_rebuilt(self, tmp_path, words):
+        cache = LexiconCache(str(tmp_path / "cache"))
+        path = cache.compiled_path(words, "nl")
+        with open(path, "wb") as f:
+            f.write(b"garbage")
+        lexicon = cache.load(words, "nl")
+        assert "KATTEN" in lexicon
+        lexicon.close()
+
+    @pytest.mark.parametrize("keep", [0, 10, 40, 100, -1])
+    def test_truncated_file_is_rebuilt(self, tmp_path, words, keep):
+        cache = LexiconCache(str(tmp_path / "cache"))
+        path = cache.compiled_path(words, "nl")
+        with open(path, "rb") as f:
+            data = f.read()
+        with open(path, "wb") as f:
+            f.write(data[:keep])
+        lexicon = cache.load(words, "nl")
+        assert sorted(lexicon) == ["AT", "KAN", "KAT", "KATTEN", "NA", "TA", "TAK"]
+        assert lexicon.hook_table().letters(lexicon.hook_table().front_hooks("AT"))
+        lexicon.close()
+
+    def test_failed_build_leaves_no_file(self, tmp_path, words, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        cache = LexiconCache(str(cache_dir))
+
+        def fail(words, file_path):
+            with open(file_path, "wb") as f:
+                f.write(b"partial")
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(lexicon_cache, "compile_lexicon", fail)
+        with pytest.raises(RuntimeError):
+            cache.compiled_path(words, "nl")
+        assert os.listdir(cache_dir) == []
+
+    def test_registry_and_tournament_use_cache(self, tmp_path, words, monkeypatch):
+        cache_dir = str(tmp_path / "cache")
+        registry = ValidatorRegistry(cache_dir=cache_dir)
+        validator = registry.acquire("nl", words)
+        assert isinstance(validator.lexicon, MappedDawgLexicon)
+        registry.release(validator)
+        monkeypatch.setattr(default_registry, "cache_dir", cache_dir)
+        tournament = Tournament(
+            ["greedy", "greedy"], games=2, workers=1, dictionary_file=words
+        )
+        assert len(list(tournament.run())) == 2
+        assert len(os.listdir(cache_dir)) == 1
@@ -0,0 +1,159 @@
+"""Tests for the GADDAG index and move generation."""
+
+import random
+
+import pytest
+
+from scrabble.alphabet import get_alphabet
+from scrabble.gaddag import Gaddag
+from scrabble.game import Game
+from scrabble.tile import Tile
+
+
+def make_rack(letters):
+    return [Tile("*", 0) if letter == "*" else Tile(letter, 1) for letter in letters]
+
+
+PREMIUMS = {
+    "DL": (2, 1),
+    "TL": (3, 1),
+    "QL": (4, 1),
+    "DW": (1, 2),
+    "CENTER": (1, 2),
+    "TW": (1, 3),
+    "QW": (1, 4),
+}
+
+
+def placement_score(game, move):
+    """Validate and score a generated move square by square."""
+    placement = move.to_placement(game.get_current_player().rack)
+    valid, message = game._validate_placement(placement)
+    assert valid, message
+    new_positions = {(row, col) for row, col, _ in placement}
+    for row, col, tile in placement:
+        game.board.place_tile(row, col, tile)
+    try:
+        words = game._get_all_formed_words(placement)
+        assert all(game.validator.is_valid_word(word) for word, _ in words)
+        score = 0
+        for _, positions in words:
+            word_score, word_mult = 0, 1
+            for row, col in positions:
+                letter_mult = 1
+                if (row, col) in new_positions:
+                    premium = game.board.get_premium_square(row, col)
+                    letter_mult, mult = PREMIUMS.get(premium, (1, 1))
+                    word_mult *= mult
+                word_score += game.board.get_tile(row, col).points * letter_mult
+            score += word_score * word_mult
+    finally:
+        game._rollback_placement(placement)
+    if len(placement) == game.RACK_SIZE:
+        score += game.BINGO_BONUS
+    return score
+
+
+class TestGaddag:
+    """Test the GADDAG index."""
+
+    def test_contains_words(self):
+        gaddag = Gaddag(["KAT", "KATER", "BOOT"])
+        assert "KAT" in gaddag
+        assert "KATER" in gaddag
+        assert "KATE" not in gaddag
+        assert len(gaddag) == 3
+
+    def test_every_split_is_reachable(self):
+        gaddag = Gaddag(["KATER"])
+        word = "KATER"
+        for split in range(1, len(word) + 1):
+            node = gaddag.root
+            for letter in word[split - 1 :: -1] + "^" + word[split:]:
+                node = gaddag.child(node, letter)
+                assert node >= 0
+            assert gaddag.finals[node]
+
+    def test_uses_language_alphabet(self):
+        alphabet = get_alphabet("nl")
+        gaddag = Gaddag(["KAT", "ÉÉN"], alphabet)
+        assert gaddag.codes["K"] == alphabet.code("K")
+        assert gaddag.alphabet.letters[: len(alphabet)] == alphabet.letters
+        assert gaddag.codes["É"] == len(alphabet) + 1
+        assert "ÉÉN" in gaddag
+
+
+class TestMoveGeneration:
+    """Test Game.generate_moves."""
+
+    def test_first_move_covers_center(self):
+        game = Game(["Alice", "Bob"])
+        game.get_current_player().rack = make_rack("KATEOSL")
+        moves = game.generate_moves()
+        assert moves
+        assert any(move.word == "KAT" for move in moves)
+        for move in moves:
+            assert any((row, col) == (7, 7) for row, col, _, _ in move.tiles)
+
+    def test_moves_are_unique_and_sorted(self):
+        game = Game(["Alice", "Bob"])
+        game.get_current_player().rack = make_rack("KATEOSL")
+        moves = game.generate_moves()
+        placements = [tuple(sorted(move.tiles)) for move in moves]
+        assert len(placements) == len(set(placements))
+        scores = [move.score for move in moves]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_blank_tiles(self):
+        game = Game(["Alice", "Bob"])
+        game.get_current_player().rack = make_rack("HON*")
+        moves = game.generate_moves()
+        hond = [move for move in moves if move.word == "HOND"]
+        assert hond
+        assert all(
+            is_blank
+            for move in hond
+            for *_, letter, is_blank in move.tiles
+            if letter == "D"
+        )
+
+    def test_to_placement_leaves_rack_blanks(self):
+        game = Game(["Alice", "Bob"])
+        player = game.get_current_player()
+        player.rack = make_rack("HON*")
+        move = next(move for move in game.generate_moves() if move.word == "HOND")
+        placement = move.to_placement(player.rack)
+        letters = sorted(tile.get_display_letter() for _, _, tile in placement)
+        assert letters == sorted("HOND")
+        assert all(tile.blank_letter is None for tile in player.rack if tile.is_blank)
+        success, _, _ = game.place_word(placement)
+        assert success
+        assert len(player.rack) == 4
+
+    def test_scores_match_place_word(self):
+        game = Game(["Alice", "Bob"], rng=random.Random(4))
+        for _ in range(8):
+            moves = game.generate_moves()
+            for move in moves:
+                assert placement_score(game, move) == move.score
+            if not moves:
+                game.pass_turn()
+                continue
+            rack = game.get_current_player().rack
+            success, _, score = game.place_word(moves[0].to_placement(rack))
+            assert success
+            assert score == moves[0].score
+
+    def test_uses_added_words(self):
+        game = Game(["Alice", "Bob"])
+        game.get_current_player().rack = make_rack("QZXQZXA")
+        assert not game.generate_moves()
+        game.validator.add_word("QAZ")
+        assert [move.word for move in game.generate_moves()].count("QAZ") == 6
+
+    def test_to_placement_requires_tiles(self):
+        game = Game(["Alice", "Bob"])
+        game.get_current_player().rack = make_rack("KAT")
+        move = game.generate_moves()[0]
+        with pytest.raises(ValueError):
+            move.to_placement(make_rack("XYZ"))
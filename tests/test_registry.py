@@ -0,0 +1,87 @@
+"""Tests for the shared validator registry."""
+
+import os
+
+import pytest
+
+from scrabble.game import Game
+from scrabble.lexicon import compile_lexicon
+from scrabble.registry import ValidatorRegistry
+from scrabble.validator import WordValidator
+
+
+class TestValidatorRegistry:
+    """Test ValidatorRegistry."""
+
+    def test_games_share_lexicon(self):
+        registry = ValidatorRegistry()
+        games = [Game(["Alice", "Bob"], registry=registry) for _ in range(3)]
+        assert len(registry) == 1
+        assert len({id(game.validator.lexicon) for game in games}) == 1
+        assert registry.stats()[0]["games"] == 3
+
+    def test_languages_are_separate(self):
+        registry = ValidatorRegistry()
+        games = [
+            Game(["Alice", "Bob"], language=language, registry=registry)
+            for language in ("en", "nl")
+        ]
+        assert len({id(game.validator.lexicon) for game in games}) == 2
+        assert sorted(entry["language"] for entry in registry.stats()) == [
+            "en",
+            "nl",
+        ]
+
+    def test_unused_lexicon_is_evicted(self):
+        registry = ValidatorRegistry()
+        first = Game(["Alice", "Bob"], registry=registry)
+        second = Game(["Alice", "Bob"], registry=registry)
+        first.close()
+        first.close()  # Closing twice is harmless
+        assert registry.stats()[0]["games"] == 1
+        del second
+        assert len(registry) == 0
+
+    def test_clone_holds_lexicon(self):
+        registry = ValidatorRegistry()
+        game = Game(["Alice", "Bob"], registry=registry)
+        clone = game.clone()
+        assert registry.stats()[0]["games"] == 2
+        game.close()
+        assert len(registry) == 1
+        del clone
+        assert len(registry) == 0
+
+    def test_added_words_stay_per_game(self):
+        registry = ValidatorRegistry()
+        first = Game(["Alice", "Bob"], registry=registry)
+        second = Game(["Alice", "Bob"], registry=registry)
+        first.validator.add_word("SPELERS")
+        assert first.validator.is_valid_word("SPELERS")
+        assert not second.validator.is_valid_word("SPELERS")
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        registry = ValidatorRegistry()
+        path = str(tmp_path / "words.lex")
+        compile_lexicon(["KAT", "HOND"], path)
+        old = Game(["Alice", "Bob"], dictionary_file=path, registry=registry)
+        compile_lexicon(["KAT", "HOND", "VIS"], path)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        new = Game(["Alice", "Bob"], dictionary_file=path, registry=registry)
+        assert len(registry) == 2
+        assert old.validator.is_valid_word("HOND")
+        assert not old.validator.is_valid_word("VIS")
+        assert old.validator.get_word_count() == 2
+        assert sorted(old.validator.lexicon) == ["HOND", "KAT"]
+        assert new.validator.is_valid_word("VIS")
+        stats = {entry["words"]: entry for entry in registry.stats()}
+        assert stats[3]["dictionary_file"] == os.path.abspath(path)
+        assert stats[3]["memory_bytes"] > 0
+        old.close()
+        new.close()
+        assert len(registry) == 0
+
+    def test_release_unknown_validator(self):
+        with pytest.raises(ValueError):
+            ValidatorRegistry().release(WordValidator())
@@ -1,10 +1,13 @@
 """Tests for the Scrabble game components."""
 
+import copy
+
 import pytest
 
-from scrabble.board import Board
+from scrabble.board import Board, BoardOverlay
 from scrabble.game import Game
 from scrabble.player import Player
+from scrabble.rack import Rack
 from scrabble.tile import Tile, TileBag
 from scrabble.validator import WordValidator
 
@@ -34,6 +37,31 @@ class TestTile:
         assert tile1 != tile3
 
 
+class TestCanonicalTiles:
+    """Test interned tiles."""
+
+    def test_one_instance_per_language_and_letter(self):
+        assert Tile.canonical("nl", "A", 1) is Tile.canonical("nl", "A", 1)
+        assert Tile.canonical("nl", "A", 1) is not Tile.canonical("en", "A", 1)
+        assert Tile.canonical("nl", "*", 0) is not Tile.canonical("nl", "*", 0)
+
+    def test_bags_share_lettered_tiles_only(self):
+        first, second = TileBag("nl"), TileBag("nl")
+        ids = {id(tile) for tile in second.tiles}
+        shared = {id(tile) for tile in first.tiles} & ids
+        assert len(shared) == len(first.letter_distribution) - 1
+        assert not any(id(tile) in shared for tile in first.tiles if tile.is_blank)
+
+    def test_slots(self):
+        tile = Tile("A", 1)
+        assert not hasattr(tile, "__dict__")
+        assert copy.copy(tile) is tile
+        blank = Tile("*", 0)
+        blank.set_blank_letter("Q")
+        assert copy.deepcopy(blank) is not blank
+        assert copy.deepcopy(blank).get_display_letter() == "Q"
+
+
 class TestTileBag:
     """Test TileBag class."""
 
@@ -129,6 +157,204 @@ class TestBoard:
         assert word == "DOG"
         assert len(positions) == 3
 
+    def test_get_word_at_edges(self):
+        board = Board()
+        for col, letter in enumerate("AB", 13):
+            board.place_tile(14, col, Tile(letter, 1))
+        assert board.get_word_at(14, 14, "H") == ("AB", [(14, 13), (14, 14)])
+        assert board.get_word_at(14, 14, "V") == ("B", [(14, 14)])
+        assert board.get_word_at(0, 0, "V") == ("", [])
+
+    def test_square_arrays_match_tiles(self):
+        board = Board()
+        tile = Tile("Q", 10)
+        board.place_tile(3, 5, tile)
+        assert board.get_tile(3, 5) is tile
+        assert board.grid[3][5] is tile
+        with pytest.raises(TypeError):
+            board.grid[3][5] = None  # type: ignore[index]
+        assert board.get_letter(3, 5) == "Q"
+        assert board.get_letter(5, 3) is None
+        codes, points, base = board.line_arrays("V", 5)
+        assert codes[base + 3] == board.letter_codes[3 * board.size + 5]
+        assert points[base + 3] == 10
+        assert board.remove_tile(3, 5) is tile
+        assert not any(board.transposed_points)
+
+
+class TestWordRuns:
+    """Test the run index kept by Board."""
+
+    def place(self, board, row, col, letters):
+        for i, letter in enumerate(letters):
+            board.place_tile(row, col + i, Tile(letter, 2))
+
+    def test_runs_follow_placement(self):
+        board = Board()
+        self.place(board, 7, 3, "KAT")
+        self.place(board, 7, 7, "ON")
+        runs = board.line_runs("H", 7)
+        assert runs[3] is runs[5] == (3, 6, "KAT", 6)
+        assert runs[6] is None
+        assert board.word_run(7, 8, "H") == (7, 9, "ON", 4)
+        assert board.word_run(7, 4, "V") == (7, 8, "A", 2)
+        board.place_tile(7, 6, Tile("T", 2))
+        assert board.word_run(7, 3, "H") == (3, 9, "KATTON", 12)
+        copy = board.copy()
+        board.remove_tile(7, 6)
+        assert board.get_word_at(7, 8, "H")[0] == "ON"
+        assert copy.get_word_at(7, 8, "H")[0] == "KATTON"
+
+    def test_overlay_joins_runs(self):
+        board = Board()
+        self.place(board, 7, 3, "KAT")
+        self.place(board, 7, 7, "ON")
+        overlay = BoardOverlay(board, [(7, 6, Tile("T", 2)), (6, 4, Tile("B", 3))])
+        word, positions = overlay.get_word_at(7, 6, "H")
+        assert word == "KATTON"
+        assert positions == [(7, col) for col in range(3, 9)]
+        assert overlay.get_word_at(7, 4, "V") == ("BA", [(6, 4), (7, 4)])
+        assert overlay.get_word_at(7, 11, "H") == ("", [])
+        assert board.get_word_at(7, 6, "H") == ("KAT", [(7, 3), (7, 4), (7, 5)])
+
+
+class TestScorePlacement:
+    """Test Board.score_placement."""
+
+    def test_premiums_apply_to_new_tiles_only(self):
+        board = Board()
+        # K on the center (double word) of KAT
+        assert board.score_placement([(7, 7, 3), (7, 8, 1), (7, 9, 2)]) == 12
+        for col, points in ((7, 3), (8, 1), (9, 2)):
+            board.place_tile(7, col, Tile("X", points))
+        assert board.used_premiums == 1 << (7 * 15 + 7)
+        # Extending to KATS reuses the center without its premium
+        assert board.score_placement([(7, 10, 1)]) == 7
+
+    def test_cross_words(self):
+        board = Board()
+        board.place_tile(7, 7, Tile("A", 1))
+        board.place_tile(8, 7, Tile("T", 2))
+        # A vertical word through (6, 8) and (7, 8) forms one cross word
+        # with the A: the new tile on (7, 8) scores in both words
+        score = board.score_placement([(6, 8, 4), (7, 8, 5)])
+        assert score == (4 * 2 + 5) + (1 + 5)
+        # A single tile scores its row word; (8, 6) is a double letter
+        assert board.score_placement([(8, 6, 3)]) == 3 * 2 + 2
+
+    def test_multiplier_arrays(self):
+        board = Board()
+        assert board.letter_multipliers[1 * 15 + 5] == 3
+        assert board.word_multipliers[0] == 3
+        assert board.transposed_letter_multipliers[3 * 15 + 0] == 2
+        assert bin(board.premium_mask).count("1") == len(board.premium_squares)
+
+
+class TestBitboards:
+    """Test the occupancy bitboards kept by Board."""
+
+    def test_masks_follow_grid(self):
+        board = Board()
+        board.place_tile(3, 5, Tile("A", 1))
+        assert board.occupied == 1 << (3 * 15 + 5)
+        assert board.row_masks[3] == 1 << 5
+        assert board.col_masks[5] == 1 << 3
+        assert not board.is_empty(3, 5)
+        board.remove_tile(3, 5)
+        assert board.occupied == 0
+        assert board.row_masks[3] == 0
+        assert board.col_masks[5] == 0
+        assert board.is_board_empty()
+
+    def test_neighbours_do_not_wrap(self):
+        board = Board()
+        mask = board.neighbour_mask(board.position_mask([(0, 14)]))
+        assert mask == board.position_mask([(0, 13), (1, 14)])
+        mask = board.neighbour_mask(board.position_mask([(5, 0)]))
+        assert mask == board.position_mask([(4, 0), (6, 0), (5, 1)])
+
+    def test_anchor_mask(self):
+        board = Board()
+        board.place_tile(7, 7, Tile("A", 1))
+        board.place_tile(7, 8, Tile("T", 2))
+        expected = board.position_mask([(7, 6), (7, 9), (6, 7), (6, 8), (8, 7), (8, 8)])
+        assert board.anchor_mask() == expected
+
+    def test_gap_is_not_continuous(self):
+        game = Game(["Alice", "Bob"])
+        game.board.place_tile(7, 7, Tile("A", 1))
+        tiles = [Tile("K", 3), Tile("T", 2)]
+        valid, message = game._validate_placement([(7, 5, tiles[0]), (7, 8, tiles[1])])
+        assert not valid
+        assert "continuous" in message
+        valid, _ = game._validate_placement([(7, 6, tiles[0]), (7, 8, tiles[1])])
+        assert valid
+
+
+class TestCrossChecks:
+    """Test the cross-checks and anchors maintained by Board."""
+
+    def make_board(self):
+        board = Board()
+        validator = WordValidator()
+        board.attach_validator(validator, "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+        return board, validator
+
+    def test_anchors(self):
+        board = Board()
+        board.place_tile(7, 7, Tile("A", 1))
+        assert board.is_anchor(6, 7)
+        assert board.is_anchor(7, 8)
+        assert not board.is_anchor(7, 7)
+        assert not board.is_anchor(6, 6)
+        board.remove_tile(7, 7)
+        assert not board.is_anchor(6, 7)
+
+    def test_cross_checks(self):
+        board, _ = self.make_board()
+        board.place_tile(7, 7, Tile("A", 1))
+        board.place_tile(8, 7, Tile("T", 2))
+        # Playing horizontally above or below the vertical word "AT"
+        assert board.get_cross_check(6, 7, "H") == frozenset({"D", "K", "W"})
+        assert board.get_cross_check(9, 7, "H") == frozenset()
+        assert board.get_cross_score(6, 7, "H") == 3
+        # Squares without perpendicular neighbours are unconstrained
+        assert board.get_cross_check(6, 8, "H") is None
+        assert board.get_cross_score(6, 8, "H") == -1
+        # Playing vertically next to the "A"
+        assert board.get_cross_check(7, 8, "V") == frozenset()
+        assert board.get_cross_score(7, 8, "V") == 1
+
+    def test_cross_check_between_words(self):
+        board, _ = self.make_board()
+        for col, letter in [(4, "K"), (5, "A"), (7, "S")]:
+            board.place_tile(7, col, Tile(letter, 1))
+        assert board.get_cross_check(7, 6, "V") == frozenset({"A"})
+        assert board.get_cross_check(7, 3, "V") == frozenset()
+
+    def test_only_changed_lines_are_recomputed(self):
+        board, validator = self.make_board()
+        board.place_tile(7, 7, Tile("A", 1))
+        board.update_cross_checks()
+        calls = []
+        hooks = validator.get_hook_table()
+        lookup = hooks.hooks
+        hooks.hooks = lambda prefix, suffix: calls.append(prefix) or lookup(
+            prefix, suffix
+        )
+        board.place_tile(8, 7, Tile("T", 2))
+        board.update_cross_checks()
+        # Column 7 has two constrained squares above and below "AT", row 8
+        # two on either side of the "T"
+        assert len(calls) == 4
+
+    def test_added_words_refresh_checks(self):
+        board, validator = self.make_board()
+        board.place_tile(7, 7, Tile("Q", 10))
+        assert board.get_cross_check(6, 7, "H") == frozenset()
+        validator.add_word("AQ")
+        assert board.get_cross_check(6, 7, "H") == frozenset({"A"})
+
 
 class TestPlayer:
     """Test Player class."""
@@ -161,6 +387,53 @@ class TestPlayer:
         assert player.score == 15
 
 
+class TestRack:
+    """Test the Rack multiset."""
+
+    def test_counts(self):
+        rack = Rack([Tile("A", 1), Tile("B", 3), Tile("A", 1), Tile("*", 0)])
+        assert rack.count("A") == 2
+        assert rack.blanks == 1
+        assert rack.key() == "*AAB"
+        assert len(rack) == 4
+        assert Tile("B", 3) in rack
+        assert Tile("C", 5) not in rack
+
+    def test_has_tiles_counts_repeats(self):
+        rack = Rack([Tile("A", 1), Tile("B", 3)])
+        assert rack.has_tiles([Tile("A", 1), Tile("B", 3)])
+        assert not rack.has_tiles([Tile("A", 1), Tile("A", 1)])
+        assert not rack.has_tiles([Tile("A", 10)])
+        assert Tile("B", 9) not in rack
+
+    def test_can_spell_with_blanks(self):
+        rack = Rack([Tile("K", 3), Tile("A", 1), Tile("*", 0)])
+        assert rack.can_spell("KAT")
+        assert rack.can_spell("KAA")
+        assert not rack.can_spell("TAT")
+
+    def test_subtract_and_add(self):
+        tiles = [Tile("A", 1), Tile("B", 3), Tile("A", 1)]
+        rack = Rack(tiles)
+        with pytest.raises(ValueError):
+            rack.subtract([Tile("B", 3), Tile("B", 3)])
+        assert rack == tiles
+        rack.subtract([Tile("A", 1), Tile("B", 3)])
+        assert rack.key() == "A"
+        rack.add([Tile("C", 5)])
+        assert rack.key() == "AC"
+
+    def test_behaves_like_a_list(self):
+        tiles = [Tile("K", 3), Tile("A", 1), Tile("T", 2)]
+        player = Player("Alice", 0)
+        player.rack = tiles
+        assert isinstance(player.rack, Rack)
+        assert player.rack == tiles
+        assert player.rack[:2] == tiles[:2]
+        assert list(player.rack) == tiles
+        assert player.get_rack_letters() == "KAT"
+
+
 class TestWordValidator:
     """Test WordValidator class."""
 
@@ -221,6 +494,22 @@ class TestGame:
         assert success
         assert game.get_current_player().name != current_player
 
+    def test_forged_tile_points_are_rejected(self):
+        game = Game(["Alice", "Bob"])
+        player = game.get_current_player()
+        rack = [Tile("K", 3), Tile("A", 1), Tile("T", 2)]
+        player.rack = list(rack)
+        forged = [(7, 6, Tile("K", 10)), (7, 7, Tile("A", 10)), (7, 8, Tile("T", 10))]
+        success, message, score = game.place_word(forged)
+        assert not success
+        assert message == "Player does not have these tiles"
+        assert score == 0
+        assert player.rack == rack
+        assert game.board.is_board_empty()
+        success, message = game.exchange_tiles([Tile("K", 10)])
+        assert not success
+        assert player.rack == rack
+
     def test_first_word_must_cover_center(self):
         game = Game(["Alice", "Bob"])
         player = game.get_current_player()
@@ -309,5 +598,122 @@ class TestGame:
             assert score >= 50
 
 
+class TestEvaluatePlacement:
+    """Test scoring placements without playing them."""
+
+    def setup_method(self):
+        self.game = Game(["Alice", "Bob"])
+        self.tiles = [Tile("K", 3), Tile("A", 1), Tile("T", 2)]
+        self.game.get_current_player().rack = list(self.tiles)
+
+    def test_does_not_change_game(self):
+        game = self.game
+        player = game.get_current_player()
+        placement = [(7, 6 + i, tile) for i, tile in enumerate(self.tiles)]
+        remaining = game.tile_bag.remaining_count()
+        valid, message, words, score = game.evaluate_placement(placement)
+        assert valid
+        assert words == ["KAT"]
+        assert game.board.is_board_empty()
+        assert game.board.occupied == 0
+        assert player.rack == self.tiles
+        assert player.score == 0
+        assert game.tile_bag.remaining_count() == remaining
+
+        success, _, played = game.place_word(placement)
+        assert success
+        assert played == score
+
+    def test_reports_invalid_words(self):
+        placement = [(7, 7, self.tiles[2]), (7, 8, self.tiles[1])]
+        valid, message, words, score = self.game.evaluate_placement(placement)
+        assert not valid
+        assert words == ["TA"]
+        assert "TA" in message
+        assert score == 0
+
+    def test_evaluate_placements(self):
+        game = self.game
+        k, a, t = self.tiles
+        candidates = [
+            [(7, 6, k), (7, 7, a), (7, 8, t)],
+            [(6, 7, k), (7, 7, a), (8, 7, t)],
+            [(0, 0, k), (0, 1, a), (0, 2, t)],
+            [(7, 7, k), (7, 7, a)],
+        ]
+        results = game.evaluate_placements(candidates)
+        assert [valid for valid, *_ in results] == [True, True, False, False]
+        assert results[0][3] == results[1][3] > 0
+        assert "center" in results[2][1].lower()
+        assert game.board.is_board_empty()
+
+
+class TestUndoAndClone:
+    """Test Game.push_move, Game.pop_move and Game.clone."""
+
+    def snapshot(self, game):
+        return (
+            [row[:] for row in game.board.grid],
+            game.board.occupied,
+            list(game.tile_bag.tiles),
+            [(list(p.rack), p.score) for p in game.players],
+            game.current_player_index,
+            game.turn_number,
+            game.consecutive_passes,
+            game.game_over,
+        )
+
+    def test_pop_restores_position(self):
+        game = Game(["Alice", "Bob"])
+        game.get_current_player().rack = [Tile("K", 3), Tile("A", 1), Tile("T", 2)]
+        before = self.snapshot(game)
+        rack = game.get_current_player().rack
+        success, _, score = game.push_move(
+            [(7, 6, rack[0]), (7, 7, rack[1]), (7, 8, rack[2])]
+        )
+        assert success and score > 0
+        assert game.push_move(None)[0]
+        assert self.snapshot(game) != before
+        game.pop_move()
+        game.pop_move()
+        assert self.snapshot(game) == before
+        assert game.board.get_cross_check(6, 7, "H") is None
+        with pytest.raises(IndexError):
+            game.pop_move()
+
+    def test_failed_move_is_not_recorded(self):
+        game = Game(["Alice", "Bob"])
+        rack = game.get_current_player().rack
+        success, _, _ = game.push_move([(0, 0, rack[0]), (0, 1, rack[1])])
+        assert not success
+        with pytest.raises(IndexError):
+            game.pop_move()
+
+    def test_clone_is_independent(self):
+        game = Game(["Alice", "Bob"])
+        game.get_current_player().rack = [Tile("K", 3), Tile("A", 1), Tile("T", 2)]
+        clone = game.clone()
+        assert clone.validator is game.validator
+        assert clone.board.premium_squares is game.board.premium_squares
+        rack = clone.get_current_player().rack
+        success, _, _ = clone.place_word(
+            [(7, 6, rack[0]), (7, 7, rack[1]), (7, 8, rack[2])]
+        )
+        assert success
+        assert game.board.is_board_empty()
+        assert game.get_current_player().tile_count() == 3
+        assert game.tile_bag.remaining_count() == clone.tile_bag.remaining_count() + 3
+        game.close()
+        assert clone.validator.is_valid_word("KAT")
+        clone.close()
+
+    def test_deepcopy_shares_validator(self):
+        game = Game(["Alice", "Bob"])
+        copied = copy.deepcopy(game)
+        assert copied.validator is game.validator
+        assert copied.board.validator is game.validator
+        assert copied.players[0].rack == game.players[0].rack
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
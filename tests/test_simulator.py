@@ -0,0 +1,96 @@
+"""Tests for headless self-play simulation."""
+
+import random
+
+import pytest
+
+from scrabble.registry import ValidatorRegistry
+from scrabble.simulator import (
+    GreedyStrategy,
+    RandomStrategy,
+    Simulator,
+    Strategy,
+    get_strategy,
+)
+from scrabble.tile import TileBag
+
+
+class TestSeededTileBag:
+    """Test injecting a random number generator into the tile bag."""
+
+    def test_same_seed_same_draws(self):
+        first = TileBag("en", random.Random(7))
+        second = TileBag("en", random.Random(7))
+        assert first.draw(20) == second.draw(20)
+
+    def test_put_back_restores_order(self):
+        bag = TileBag("en", random.Random(7))
+        before = list(bag.tiles)
+        taken = bag.take(7)
+        assert len(bag.tiles) == len(before) - 7
+        bag.put_back(taken)
+        assert bag.tiles == before
+        assert all(a is b for a, b in zip(bag.tiles, before))
+
+    def test_rng_snapshot_replays_draws(self):
+        bag = TileBag("en", random.Random(7))
+        state = bag.get_rng_state()
+        taken = bag.take(5)
+        bag.put_back(taken)
+        bag.set_rng_state(state)
+        assert bag.take(5) == taken
+
+    def test_return_tiles_does_not_reshuffle(self):
+        bag = TileBag("en", random.Random(7))
+        before = list(bag.tiles)
+        drawn = bag.draw(3)
+        bag.return_tiles(drawn)
+        assert bag.tiles[-3:] == drawn
+        assert sorted(t.letter for t in bag.tiles) == sorted(t.letter for t in before)
+
+
+class TestSimulator:
+    """Test the Simulator."""
+
+    def make_simulator(self):
+        return Simulator(
+            [GreedyStrategy(), RandomStrategy()], registry=ValidatorRegistry()
+        )
+
+    def test_games_are_reproducible(self):
+        first = self.make_simulator().play(3).to_dict()
+        second = self.make_simulator().play(3).to_dict()
+        del first["elapsed"], second["elapsed"]
+        assert first == second
+
+    def test_streams_results_and_stats(self, capsys):
+        simulator = self.make_simulator()
+        seen = []
+        for result in simulator.run(3, seed=10):
+            seen.append(result.seed)
+            assert simulator.stats.games == len(seen)
+        assert seen == [10, 11, 12]
+        assert simulator.stats.moves > 0
+        assert simulator.stats.games_per_second > 0
+        assert capsys.readouterr().out == ""
+
+    def test_releases_lexicon(self):
+        simulator = self.make_simulator()
+        list(simulator.run(2))
+        assert len(simulator.registry) == 0
+
+    def test_strategy_lookup(self):
+        assert isinstance(get_strategy("greedy"), GreedyStrategy)
+        with pytest.raises(ValueError):
+            get_strategy("psychic")
+
+    def test_strategy_requires_choose(self):
+        class Undecided(Strategy):
+            name = "undecided"
+
+        with pytest.raises(TypeError):
+            Undecided()  # type: ignore[abstract]
+
+    def test_requires_two_to_four_strategies(self):
+        with pytest.raises(ValueError):
+            Simulator([GreedyStrategy()])
@@ -0,0 +1,118 @@
+"""Tests for board symmetries."""
+
+import pytest
+
+from scrabble.board import Board
+from scrabble.game import Game
+from scrabble.layout import Layout
+from scrabble.symmetry import (
+    canonical_move,
+    canonical_position,
+    layout_symmetries,
+    position_symmetries,
+    symmetries,
+)
+from scrabble.tile import Tile
+from tests.test_movegen import make_rack
+
+# Standard letter values of the tiles K, A, D, E, R, S, O
+RACK_POINTS = [5, 1, 2, 1, 2, 3, 1]
+
+
+def move_keys(moves):
+    return {(move.word, tuple(sorted(move.tiles)), move.score) for move in moves}
+
+
+def play(game, word, row, col, direction):
+    for i, letter in enumerate(word):
+        r, c = (row, col + i) if direction == "H" else (row + i, col)
+        game.board.place_tile(r, c, Tile(letter, 1))
+
+
+class TestSymmetry:
+    """Test Symmetry and the layout symmetries."""
+
+    def test_inverse_undoes_symmetry(self):
+        for symmetry in symmetries(15):
+            inverse = symmetry.inverse()
+            for row, col in [(0, 0), (0, 14), (3, 9), (7, 7), (12, 1)]:
+                assert inverse.square(*symmetry.square(row, col)) == (row, col)
+
+    def test_standard_layout_has_all_symmetries(self):
+        assert len(layout_symmetries(Board().layout)) == 8
+
+    def test_asymmetric_layout(self):
+        layout = Layout.from_rows(
+            "lopsided", ["T....", ".....", "..*..", ".....", "....."]
+        )
+        names = [symmetry.name for symmetry in layout_symmetries(layout)]
+        assert names == ["identity", "transpose"]
+
+    def test_only_reading_order_symmetries(self):
+        board = Board()
+        names = [symmetry.name for symmetry in position_symmetries(board)]
+        assert names == ["identity", "transpose"]
+        board.place_tile(7, 7, Tile("A", 1))
+        names = [symmetry.name for symmetry in position_symmetries(board)]
+        assert names == ["identity", "transpose"]
+
+
+class TestCanonicalPosition:
+    """Test canonical_position."""
+
+    def test_transposed_positions_share_key(self):
+        across, down = Game(["Alice", "Bob"]), Game(["Alice", "Bob"])
+        play(across, "KAT", 7, 6, "H")
+        play(down, "KAT", 6, 7, "V")
+        assert across.board.zobrist != down.board.zobrist
+        key, symmetry = canonical_position(across.board)
+        other_key, other_symmetry = canonical_position(down.board)
+        assert key == other_key
+        assert symmetry.name != other_symmetry.name
+
+        # Moves cached in the canonical orientation map back to each board
+        rack = make_rack("ESLOTEN")
+        across.get_current_player().rack = list(rack)
+        down.get_current_player().rack = list(rack)
+        cached = [symmetry.move(move) for move in across.generate_moves()]
+        back = other_symmetry.inverse()
+        assert move_keys(back.move(move) for move in cached) == move_keys(
+            down.generate_moves()
+        )
+
+    def test_different_positions_differ(self):
+        first, second = Board(), Board()
+        first.place_tile(7, 7, Tile("A", 1))
+        second.place_tile(7, 8, Tile("A", 1))
+        assert canonical_position(first)[0] != canonical_position(second)[0]
+
+
+class TestCanonicalMove:
+    """Test canonical_move on opening moves."""
+
+    def test_opening_classes(self):
+        game = Game(["Alice", "Bob"])
+        rack = [Tile(letter, points) for letter, points in zip("KADERSO", RACK_POINTS)]
+        game.get_current_player().rack = rack
+        moves = game.generate_moves()
+        found = position_symmetries(game.board)
+        legal = move_keys(moves)
+        classes = set()
+        for move in moves:
+            canonical, symmetry = canonical_move(move, found)
+            assert move_keys([symmetry.inverse().move(canonical)]) == move_keys([move])
+            images = [symmetry.move(move) for symmetry in found]
+            assert move_keys(images) <= legal
+            for image in images:
+                result = game.evaluate_placement(image.to_placement(rack))
+                assert result[3] == image.score
+            classes.add((canonical.word, tuple(canonical.tiles)))
+        assert len(classes) * 2 == len(moves)
+
+    def test_reversing_symmetry_is_rejected(self):
+        game = Game(["Alice", "Bob"])
+        game.get_current_player().rack = make_rack("KATEOSL")
+        opening = game.generate_moves()[0]
+        rotate180 = symmetries(15)[3]
+        with pytest.raises(ValueError):
+            rotate180.move(opening)
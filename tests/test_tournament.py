@@ -0,0 +1,68 @@
+"""Tests for the multiprocess tournament runner."""
+
+import pytest
+
+from scrabble.simulator import GreedyStrategy, RandomStrategy, Simulator
+from scrabble.tournament import StrategyStats, Tournament
+
+
+class TestTournament:
+    """Test Tournament."""
+
+    def test_standings(self):
+        tournament = Tournament(["greedy", "random"], games=6, workers=2, seed=5)
+        results = list(tournament.run())
+        assert sorted(result.seed for result in results) == list(range(5, 11))
+        assert tournament.games_played == 6
+        for stats in tournament.standings.values():
+            assert stats.games == 6
+            assert len(stats.scores) == 6
+        wins = sum(stats.wins for stats in tournament.standings.values())
+        assert wins == sum(result.winner is not None for result in results)
+
+    def test_seats_rotate_and_replay(self):
+        results = {
+            result.seed: result
+            for result in Tournament(["greedy", "random"], games=2, workers=1).run()
+        }
+        assert results[0].strategies == ["greedy", "random"]
+        assert results[1].strategies == ["random", "greedy"]
+        replay = Simulator([RandomStrategy(), GreedyStrategy()]).play(1)
+        assert replay.scores == results[1].scores
+
+    def test_plain_text_dictionary(self, tmp_path):
+        words = tmp_path / "words.txt"
+        words.write_text("KAT\nKATTEN\nAT\nTA\nTAK\nKAN\nNA\n")
+        tournament = Tournament(
+            ["greedy", "random"], games=2, workers=1, dictionary_file=str(words)
+        )
+        assert len(list(tournament.run())) == 2
+
+    def test_rejects_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            Tournament(["greedy", "psychic"], games=1)
+
+    def test_mirror_match(self):
+        tournament = Tournament(["greedy", "greedy"], games=4, workers=1, seed=3)
+        results = list(tournament.run())
+        assert list(tournament.standings) == ["greedy#0", "greedy#1"]
+        first, second = tournament.standings.values()
+        assert first.games == second.games == 4
+        # Entrant 0 sits first in even games and second in odd ones
+        assert sorted(first.scores) == sorted(
+            result.scores[(result.seed - 3) % 2] for result in results
+        )
+        assert sorted(second.scores) == sorted(
+            result.scores[(result.seed - 2) % 2] for result in results
+        )
+
+
+class TestStrategyStats:
+    """Test StrategyStats."""
+
+    def test_summary(self):
+        stats = StrategyStats("greedy")
+        stats.games, stats.wins, stats.scores = 4, 3, [10, 60, 70, 140]
+        assert stats.win_rate == 0.75
+        assert stats.mean_score == 70
+        assert stats.score_histogram(50) == {0: 1, 50: 2, 100: 1}
@@ -0,0 +1,110 @@
+"""Tests for the streaming word list loader."""
+
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from scrabble.game import Game
+from scrabble.lexicon import compile_lexicon
+from scrabble.registry import ValidatorRegistry
+from scrabble.validator import WordValidator
+from scrabble.wordlist import (
+    LoadReport,
+    add_load_listener,
+    read_word_lists,
+    remove_load_listener,
+)
+
+TEXT = "kat\nHond\n  vis \nkat\na\n\n"
+
+
+class TestReadWordLists:
+    """Test read_word_lists."""
+
+    @pytest.mark.parametrize(
+        "suffix,compress",
+        [
+            ("txt", str.encode),
+            ("gz", lambda text: gzip.compress(text.encode())),
+            ("xz", lambda text: lzma.compress(text.encode())),
+            ("bz2", lambda text: bz2.compress(text.encode())),
+        ],
+    )
+    def test_formats(self, tmp_path, suffix, compress):
+        path = tmp_path / f"words.{suffix}"
+        path.write_bytes(compress(TEXT))
+        report = LoadReport([str(path)])
+        assert read_word_lists(str(path), report) == {"KAT", "HOND", "VIS"}
+        assert (report.lines, report.words) == (6, 3)
+        assert (report.duplicates, report.skipped) == (1, 2)
+
+    def test_several_files(self, tmp_path):
+        base = tmp_path / "base.txt.gz"
+        base.write_bytes(gzip.compress(TEXT.encode()))
+        house = tmp_path / "house.txt"
+        house.write_text("\ufeffZON\nhond\n", encoding="utf-8")
+        report = LoadReport([str(base), str(house)])
+        words = read_word_lists([str(base), str(house)], report)
+        assert words == {"KAT", "HOND", "VIS", "ZON"}
+        assert report.duplicates == 2
+
+    def test_errors(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            read_word_lists(str(tmp_path / "missing.txt"))
+        corrupt = tmp_path / "words.gz"
+        corrupt.write_bytes(gzip.compress(TEXT.encode())[:20])
+        with pytest.raises(ValueError, match="words.gz"):
+            read_word_lists(str(corrupt))
+        binary = tmp_path / "words.bin"
+        binary.write_bytes(b"KAT\n\xff\xfe\n")
+        with pytest.raises(ValueError):
+            read_word_lists(str(binary))
+
+
+class TestValidatorLoading:
+    """Test dictionary loading through the validator."""
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            WordValidator(str(tmp_path / "missing.txt"))
+
+    def test_listener_gets_report(self, tmp_path):
+        path = tmp_path / "words.txt.xz"
+        path.write_bytes(lzma.compress(TEXT.encode()))
+        reports = []
+        add_load_listener(reports.append)
+        try:
+            validator = WordValidator(str(path), backend="dawg")
+        finally:
+            remove_load_listener(reports.append)
+        assert validator.is_valid_word("HOND")
+        assert reports == [validator.load_report]
+        assert reports[0].words == 3 and not reports[0].compiled
+        assert reports[0].elapsed > 0
+
+    def test_compiled_file(self, tmp_path):
+        path = str(tmp_path / "words.lex")
+        compile_lexicon(["KAT", "HOND"], path)
+        validator = WordValidator(path)
+        assert validator.load_report.compiled
+        assert validator.load_report.words == 2
+        with pytest.raises(ValueError, match="combined"):
+            WordValidator([path, path])
+
+    def test_registry_combines_files(self, tmp_path):
+        base = tmp_path / "base.txt"
+        base.write_text("KAT\nHOND\n", encoding="utf-8")
+        house = tmp_path / "house.txt"
+        house.write_text("ZON\n", encoding="utf-8")
+        registry = ValidatorRegistry()
+        files = [str(base), str(house)]
+        game = Game(["Alice", "Bob"], dictionary_file=files, registry=registry)
+        assert game.validator.is_valid_word("ZON")
+        assert registry.stats()[0]["dictionary_file"] == tuple(files)
+        base_only = Game(["Alice", "Bob"], dictionary_file=str(base), registry=registry)
+        assert not base_only.validator.is_valid_word("ZON")
+        assert len(registry) == 2
+        game.close()
+        base_only.close()
@@ -0,0 +1,101 @@
+"""Tests for Zobrist hashing and the transposition table."""
+
+import pytest
+
+from scrabble.board import Board
+from scrabble.game import Game
+from scrabble.player import Player
+from scrabble.tile import Tile
+from scrabble.zobrist import TranspositionTable
+
+
+def blank(letter):
+    tile = Tile("*", 0)
+    tile.set_blank_letter(letter)
+    return tile
+
+
+class TestBoardHash:
+    """Test the incremental board hash."""
+
+    def test_independent_of_order(self):
+        first, second = Board(), Board()
+        first.place_tile(7, 7, Tile("A", 1))
+        first.place_tile(7, 8, Tile("T", 2))
+        second.place_tile(7, 8, Tile("T", 2))
+        second.place_tile(7, 7, Tile("A", 1))
+        assert first.zobrist == second.zobrist != 0
+        first.remove_tile(7, 7)
+        first.remove_tile(7, 8)
+        assert first.zobrist == 0
+
+    def test_distinguishes_squares_letters_and_blanks(self):
+        hashes = set()
+        for row, col, tile in [
+            (7, 7, Tile("A", 1)),
+            (7, 8, Tile("A", 1)),
+            (7, 7, Tile("E", 1)),
+            (7, 7, blank("A")),
+        ]:
+            board = Board()
+            board.place_tile(row, col, tile)
+            hashes.add(board.zobrist)
+        assert len(hashes) == 4
+
+
+class TestRackHash:
+    """Test the incremental rack hash."""
+
+    def test_counts_not_order(self):
+        first, second = Player("Alice", 0), Player("Alice", 0)
+        first.add_tiles([Tile("A", 1), Tile("B", 3), Tile("A", 1)])
+        second.rack = [Tile("B", 3), Tile("A", 1), Tile("A", 1)]
+        assert first.zobrist == second.zobrist
+        first.remove_tile(Tile("A", 1))
+        assert first.zobrist != second.zobrist
+        second.remove_tile(Tile("A", 1))
+        assert first.zobrist == second.zobrist
+
+
+class TestGameHash:
+    """Test Game.zobrist."""
+
+    def test_follows_moves(self):
+        game = Game(["Alice", "Bob"])
+        game.get_current_player().rack = [Tile("K", 3), Tile("A", 1), Tile("T", 2)]
+        start = game.zobrist
+        assert game.clone().zobrist == start
+        rack = game.get_current_player().rack
+        assert game.push_move([(7, 6, rack[0]), (7, 7, rack[1]), (7, 8, rack[2])])[0]
+        assert game.zobrist != start
+        game.pop_move()
+        assert game.zobrist == start
+        game.pass_turn()
+        assert game.zobrist != start
+
+
+class TestTranspositionTable:
+    """Test TranspositionTable."""
+
+    def test_store_and_get(self):
+        table = TranspositionTable(size=100)
+        assert table.capacity == 128
+        table.store(12345, "value")
+        assert 12345 in table
+        assert table.get(12345) == "value"
+        assert table.get(54321, "missing") == "missing"
+        assert (table.hits, table.misses) == (1, 1)
+
+    def test_bounded(self):
+        table = TranspositionTable(size=8)
+        for key in range(100):
+            table.store(key, key)
+        assert len(table) == 8
+        assert 99 in table
+        assert 3 not in table
+        table.clear()
+        assert len(table) == 0
+
+    def test_rejects_empty_table(self):
+        with pytest.raises(ValueError):
+            TranspositionTable(size=0)